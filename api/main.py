@@ -1,14 +1,28 @@
 """FastAPI application for event ingestion."""
 
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, Header, HTTPException, Query, Response, status
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Literal
+import asyncio
 import logging
 
-from src.database import get_db
-from src.schemas import CanonicalEvent, IngestResponse
-from src.models import CoreEvent
-from src.insight.modules.embeddings import generate_embedding
+from src.config import get_settings
+from src.database import get_read_db
+from src.database_async import AsyncSessionLocal, get_async_db, get_async_read_db
+from src.schemas import CanonicalEvent, IngestResponse, SearchResponse
+from src.models import CoreEvent, CoreTenant
+from src.partitions import ensure_partition_for_async, find_event_for_update_async
+from src.pool_metrics import get_pool_stats
+from src.search import search_events
+from src.stats import load_ingest_stats, stats_cache
+from src.telemetry import INGESTED_EVENTS, record_request_latency
+from src.warmup import Readiness, warm_up
+from src.insight.modules.embeddings import generate_embedding_async
 
 # Configure logging
 logging.basicConfig(
@@ -17,12 +31,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Warm-up progress of this process (see /ready)
+readiness = Readiness()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the embedding model and database pools in the background while serving."""
+    warmup = None
+    if get_settings().warmup_enabled:
+        warmup = asyncio.create_task(warm_up(readiness))
+    else:
+        readiness.model_ready = readiness.db_ready = True
+
+    yield
+
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Weekly Strategic Insight Engine",
     description="Event ingestion API for strategic insights",
-    version="1.2"
+    version="1.2",
+    lifespan=lifespan
 )
+app.middleware("http")(record_request_latency)
 
 
 @app.get("/")
@@ -44,21 +79,91 @@ def health_check():
     }
 
 
+@app.get("/ready")
+def ready_check(response: Response):
+    """
+    Readiness check: 200 once the embedding model and database pools are warm, else 503.
+
+    /health only reports that the process is up (liveness).
+    """
+    if not readiness.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return readiness.snapshot()
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus metrics of this API process."""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+# Tenants already seen in core_tenants (tenants are added, never removed)
+_known_tenants: set = set()
+
+
+async def get_tenant_id(x_tenant_id: str | None = Header(None)) -> str:
+    """
+    Resolve the tenant (mailbox) an event is ingested for.
+
+    Each tenant is looked up once per process, on its own short session, so
+    the request's connection is not checked out before the handler needs it.
+
+    Args:
+        x_tenant_id: X-Tenant-ID header (defaults to default_tenant_id)
+
+    Returns:
+        Tenant ID
+    """
+    tenant_id = x_tenant_id or get_settings().default_tenant_id
+
+    if tenant_id not in _known_tenants:
+        async with AsyncSessionLocal() as db:
+            found = await db.scalar(select(CoreTenant.tenant_id).where(CoreTenant.tenant_id == tenant_id))
+
+        if found is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown tenant: {tenant_id}"
+            )
+        _known_tenants.add(tenant_id)
+
+    return tenant_id
+
+
+def check_event_tenant(existing_event: CoreEvent | None, tenant_id: str) -> None:
+    """Reject updates that would move an event to another tenant."""
+    if existing_event is not None and existing_event.tenant_id != tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Event {existing_event.id} belongs to another tenant"
+        )
+
+
 @app.post("/ingest/email", response_model=IngestResponse)
-def ingest_email(event: CanonicalEvent, db: Session = Depends(get_db)):
+async def ingest_email(
+    event: CanonicalEvent,
+    tenant_id: str = Depends(get_tenant_id),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Ingest and normalize email event.
 
     Args:
         event: Canonical event schema
+        tenant_id: Tenant from the X-Tenant-ID header
         db: Database session
 
     Returns:
         Ingestion response with event ID
     """
     try:
-        # Check if event already exists
-        existing_event = db.query(CoreEvent).filter(CoreEvent.id == event.id).first()
+        # Encode first (on the embedding executor) so no connection is held meanwhile
+        embedding = await generate_embedding_async(f"{event.subject} {event.text}")
+
+        # Check if event already exists (holding the event ID's lock until commit)
+        await ensure_partition_for_async(db, event.timestamp)
+        existing_event = await find_event_for_update_async(db, event.id)
+        check_event_tenant(existing_event, tenant_id)
 
         if existing_event:
             # Update existing event
@@ -78,20 +183,15 @@ def ingest_email(event: CanonicalEvent, db: Session = Depends(get_db)):
             existing_event.sentiment = event.sentiment
             existing_event.raw_ref = event.raw_ref
             existing_event.updated_at = datetime.utcnow()
-
-            # Generate new embedding
-            embedding = generate_embedding(f"{event.subject} {event.text}")
             existing_event.embedding = embedding.tolist()
 
         else:
             # Create new event
             logger.info(f"Creating new email event: {event.id}")
 
-            # Generate embedding
-            embedding = generate_embedding(f"{event.subject} {event.text}")
-
             new_event = CoreEvent(
                 id=event.id,
+                tenant_id=tenant_id,
                 source=event.source,
                 timestamp=event.timestamp,
                 actor=event.actor,
@@ -110,13 +210,17 @@ def ingest_email(event: CanonicalEvent, db: Session = Depends(get_db)):
 
             db.add(new_event)
 
-        db.commit()
+        await db.commit()
+        INGESTED_EVENTS.labels(event.source, "updated" if existing_event else "created").inc()
 
         return IngestResponse(ok=True, id=event.id)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error ingesting email event: {e}")
-        db.rollback()
+        INGESTED_EVENTS.labels(event.source, "error").inc()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to ingest event: {str(e)}"
@@ -124,20 +228,30 @@ def ingest_email(event: CanonicalEvent, db: Session = Depends(get_db)):
 
 
 @app.post("/ingest/meeting", response_model=IngestResponse)
-def ingest_meeting(event: CanonicalEvent, db: Session = Depends(get_db)):
+async def ingest_meeting(
+    event: CanonicalEvent,
+    tenant_id: str = Depends(get_tenant_id),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Ingest and normalize meeting event.
 
     Args:
         event: Canonical event schema
+        tenant_id: Tenant from the X-Tenant-ID header
         db: Database session
 
     Returns:
         Ingestion response with event ID
     """
     try:
-        # Check if event already exists
-        existing_event = db.query(CoreEvent).filter(CoreEvent.id == event.id).first()
+        # Encode first (on the embedding executor) so no connection is held meanwhile
+        embedding = await generate_embedding_async(f"{event.subject} {event.text}")
+
+        # Check if event already exists (holding the event ID's lock until commit)
+        await ensure_partition_for_async(db, event.timestamp)
+        existing_event = await find_event_for_update_async(db, event.id)
+        check_event_tenant(existing_event, tenant_id)
 
         if existing_event:
             # Update existing event
@@ -157,20 +271,15 @@ def ingest_meeting(event: CanonicalEvent, db: Session = Depends(get_db)):
             existing_event.sentiment = event.sentiment
             existing_event.raw_ref = event.raw_ref
             existing_event.updated_at = datetime.utcnow()
-
-            # Generate new embedding
-            embedding = generate_embedding(f"{event.subject} {event.text}")
             existing_event.embedding = embedding.tolist()
 
         else:
             # Create new event
             logger.info(f"Creating new meeting event: {event.id}")
 
-            # Generate embedding
-            embedding = generate_embedding(f"{event.subject} {event.text}")
-
             new_event = CoreEvent(
                 id=event.id,
+                tenant_id=tenant_id,
                 source=event.source,
                 timestamp=event.timestamp,
                 actor=event.actor,
@@ -189,32 +298,74 @@ def ingest_meeting(event: CanonicalEvent, db: Session = Depends(get_db)):
 
             db.add(new_event)
 
-        db.commit()
+        await db.commit()
+        INGESTED_EVENTS.labels(event.source, "updated" if existing_event else "created").inc()
 
         return IngestResponse(ok=True, id=event.id)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error ingesting meeting event: {e}")
-        db.rollback()
+        INGESTED_EVENTS.labels(event.source, "error").inc()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to ingest event: {str(e)}"
         )
 
 
-@app.get("/stats")
-def get_stats(db: Session = Depends(get_db)):
-    """Get ingestion statistics."""
+@app.get("/search", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, description="Text to find similar events for"),
+    limit: int | None = Query(None, ge=1, le=get_settings().search_max_limit),
+    start: datetime | None = Query(None, description="Only events at or after this time"),
+    end: datetime | None = Query(None, description="Only events before this time"),
+    source: Literal['email', 'meeting'] | None = Query(None),
+    actor: str | None = Query(None, description="Only events whose actor contains this text"),
+    mode: Literal['semantic', 'hybrid'] = Query('semantic', description="hybrid adds full-text matches"),
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Semantic or hybrid (semantic + full-text) search over ingested events.
+
+    Args:
+        q: Query text
+        limit: Maximum results (defaults to SEARCH_DEFAULT_LIMIT)
+        start: Lower time bound
+        end: Upper time bound (exclusive)
+        source: Event source filter
+        actor: Actor filter
+        mode: semantic or hybrid
+        tenant_id: Tenant from the X-Tenant-ID header
+        db: Database session
+
+    Returns:
+        Events ranked by relevance to the query
+    """
     try:
-        total_events = db.query(CoreEvent).count()
-        email_events = db.query(CoreEvent).filter(CoreEvent.source == 'email').count()
-        meeting_events = db.query(CoreEvent).filter(CoreEvent.source == 'meeting').count()
+        results = search_events(db, q, tenant_id, limit, start, end, source, actor, mode)
+        return {"query": q, "mode": mode, "results": results}
+
+    except Exception as e:
+        logger.error(f"Error searching events: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search events: {str(e)}"
+        )
+
 
-        return {
-            "total_events": total_events,
-            "email_events": email_events,
-            "meeting_events": meeting_events
-        }
+@app.get("/stats")
+async def get_stats(db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Get ingestion statistics.
+
+    Served from the core_event_counts counters and cached for
+    STATS_CACHE_TTL_SECONDS, so polling dashboards never scan core_events.
+    """
+    try:
+        return await stats_cache.get(lambda: load_ingest_stats(db))
 
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
@@ -224,6 +375,12 @@ def get_stats(db: Session = Depends(get_db)):
         )
 
 
+@app.get("/stats/pool")
+def get_pool_statistics():
+    """Connection pool statistics of this API process (checkout waits, saturation, pre-ping failures)."""
+    return {"pools": get_pool_stats()}
+
+
 if __name__ == "__main__":
     import uvicorn
     from src.config import get_settings
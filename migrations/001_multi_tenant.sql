@@ -0,0 +1,41 @@
+-- Migration 001: tenant (mailbox) dimension
+-- Upgrades a database created from schema.sql before tenants existed.
+-- Existing rows are assigned to the 'default' tenant. Safe to run more than once.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS core_tenants (
+  tenant_id TEXT PRIMARY KEY,
+  name TEXT NOT NULL,
+  slack_user_id TEXT,
+  active BOOLEAN NOT NULL DEFAULT TRUE,
+  created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+INSERT INTO core_tenants (tenant_id, name) VALUES ('default', 'Default mailbox')
+ON CONFLICT (tenant_id) DO NOTHING;
+
+ALTER TABLE core_events ADD COLUMN IF NOT EXISTS tenant_id TEXT NOT NULL DEFAULT 'default' REFERENCES core_tenants(tenant_id);
+ALTER TABLE core_topics ADD COLUMN IF NOT EXISTS tenant_id TEXT NOT NULL DEFAULT 'default' REFERENCES core_tenants(tenant_id);
+ALTER TABLE out_weekly_briefs ADD COLUMN IF NOT EXISTS tenant_id TEXT NOT NULL DEFAULT 'default' REFERENCES core_tenants(tenant_id);
+ALTER TABLE out_pipeline_checkpoints ADD COLUMN IF NOT EXISTS tenant_id TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE out_pipeline_runs ADD COLUMN IF NOT EXISTS tenant_id TEXT NOT NULL DEFAULT 'default';
+ALTER TABLE out_daily_rollups ADD COLUMN IF NOT EXISTS tenant_id TEXT NOT NULL DEFAULT 'default';
+
+-- Per-tenant primary keys
+ALTER TABLE out_weekly_briefs DROP CONSTRAINT IF EXISTS out_weekly_briefs_pkey;
+ALTER TABLE out_weekly_briefs ADD PRIMARY KEY (tenant_id, week_start);
+ALTER TABLE out_pipeline_checkpoints DROP CONSTRAINT IF EXISTS out_pipeline_checkpoints_pkey;
+ALTER TABLE out_pipeline_checkpoints ADD PRIMARY KEY (tenant_id, week_start, stage);
+ALTER TABLE out_daily_rollups DROP CONSTRAINT IF EXISTS out_daily_rollups_pkey;
+ALTER TABLE out_daily_rollups ADD PRIMARY KEY (tenant_id, day);
+
+CREATE INDEX IF NOT EXISTS idx_core_events_tenant_timestamp ON core_events(tenant_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_core_topics_tenant ON core_topics(tenant_id);
+DROP INDEX IF EXISTS idx_out_pipeline_runs_period;
+CREATE INDEX idx_out_pipeline_runs_period ON out_pipeline_runs(tenant_id, kind, period_start, started_at);
+
+COMMENT ON TABLE core_tenants IS 'Tenants (mailboxes); each gets its own topics, rollups and weekly brief';
+COMMENT ON COLUMN core_events.tenant_id IS 'Tenant (mailbox) the event was ingested for';
+
+COMMIT;
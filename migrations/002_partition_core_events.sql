@@ -0,0 +1,106 @@
+-- Migration 002: monthly range partitions of core_events on timestamp
+-- Requires migration 001. Rewrites core_events into a partitioned table with one
+-- partition per month from the oldest event to three months ahead, and adds the
+-- event timestamp to core_event_topics so its foreign key can reference the
+-- partitioned table. Takes an exclusive lock on both tables for the copy.
+
+BEGIN;
+
+ALTER TABLE core_event_topics DROP CONSTRAINT IF EXISTS core_event_topics_event_id_fkey;
+
+ALTER TABLE core_events RENAME TO core_events_unpartitioned;
+ALTER TABLE core_events_unpartitioned DROP CONSTRAINT core_events_pkey;
+DROP TRIGGER IF EXISTS update_core_events_updated_at ON core_events_unpartitioned;
+DROP INDEX IF EXISTS idx_core_events_timestamp;
+DROP INDEX IF EXISTS idx_core_events_tenant_timestamp;
+DROP INDEX IF EXISTS idx_core_events_source;
+DROP INDEX IF EXISTS idx_core_events_thread_id;
+DROP INDEX IF EXISTS idx_core_events_actor;
+DROP INDEX IF EXISTS idx_core_events_urgency;
+
+CREATE TABLE core_events (
+  id TEXT NOT NULL,
+  tenant_id TEXT NOT NULL DEFAULT 'default' REFERENCES core_tenants(tenant_id),
+  source TEXT NOT NULL CHECK (source IN ('email', 'meeting')),
+  timestamp TIMESTAMPTZ NOT NULL,
+  actor TEXT NOT NULL,
+  direction TEXT NOT NULL CHECK (direction IN ('inbound', 'outbound', 'internal', 'unknown')),
+  subject TEXT,
+  text TEXT NOT NULL,
+  thread_id TEXT,
+  decision TEXT NOT NULL CHECK (decision IN ('made', 'deferred', 'none')),
+  action_owner TEXT,
+  follow_up_required BOOLEAN NOT NULL,
+  urgency_score INTEGER NOT NULL CHECK (urgency_score BETWEEN 0 AND 10),
+  sentiment TEXT NOT NULL DEFAULT 'unknown',
+  raw_ref TEXT NOT NULL,
+  embedding VECTOR(384),
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+CREATE OR REPLACE FUNCTION create_core_events_partition(month DATE)
+RETURNS TEXT AS $$
+DECLARE
+  lower_bound TIMESTAMPTZ := date_trunc('month', month)::timestamp AT TIME ZONE 'UTC';
+  upper_bound TIMESTAMPTZ := (date_trunc('month', month) + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC';
+  partition_name TEXT := 'core_events_' || to_char(month, '"y"YYYY"m"MM');
+BEGIN
+  EXECUTE format(
+    'CREATE TABLE IF NOT EXISTS %I PARTITION OF core_events FOR VALUES FROM (%L) TO (%L)',
+    partition_name, lower_bound, upper_bound
+  );
+  RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT create_core_events_partition(month::date)
+FROM generate_series(
+  date_trunc('month', (SELECT COALESCE(MIN(timestamp), NOW()) FROM core_events_unpartitioned) AT TIME ZONE 'UTC'),
+  GREATEST(
+    date_trunc('month', (SELECT COALESCE(MAX(timestamp), NOW()) FROM core_events_unpartitioned) AT TIME ZONE 'UTC'),
+    date_trunc('month', NOW() AT TIME ZONE 'UTC') + INTERVAL '3 months'
+  ),
+  INTERVAL '1 month'
+) AS month;
+
+INSERT INTO core_events (
+  id, tenant_id, source, timestamp, actor, direction, subject, text, thread_id, decision,
+  action_owner, follow_up_required, urgency_score, sentiment, raw_ref, embedding, created_at, updated_at
+)
+SELECT
+  id, tenant_id, source, timestamp, actor, direction, subject, text, thread_id, decision,
+  action_owner, follow_up_required, urgency_score, sentiment, raw_ref, embedding, created_at, updated_at
+FROM core_events_unpartitioned;
+
+ALTER TABLE core_event_topics ADD COLUMN IF NOT EXISTS event_timestamp TIMESTAMPTZ;
+UPDATE core_event_topics et SET event_timestamp = e.timestamp
+FROM core_events_unpartitioned e WHERE e.id = et.event_id;
+DELETE FROM core_event_topics WHERE event_timestamp IS NULL;
+ALTER TABLE core_event_topics ALTER COLUMN event_timestamp SET NOT NULL;
+ALTER TABLE core_event_topics ALTER COLUMN event_id SET NOT NULL;
+ALTER TABLE core_event_topics ADD FOREIGN KEY (event_id, event_timestamp)
+  REFERENCES core_events(id, timestamp) ON DELETE CASCADE ON UPDATE CASCADE;
+
+DROP TABLE core_events_unpartitioned;
+
+CREATE INDEX IF NOT EXISTS idx_core_events_timestamp ON core_events(timestamp);
+CREATE INDEX IF NOT EXISTS idx_core_events_tenant_timestamp ON core_events(tenant_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_core_events_source ON core_events(source);
+CREATE INDEX IF NOT EXISTS idx_core_events_thread_id ON core_events(thread_id) WHERE thread_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_core_events_actor ON core_events(actor);
+CREATE INDEX IF NOT EXISTS idx_core_events_urgency ON core_events(urgency_score);
+CREATE INDEX IF NOT EXISTS idx_core_event_topics_event_timestamp ON core_event_topics(event_timestamp);
+
+CREATE TRIGGER update_core_events_updated_at
+  BEFORE UPDATE ON core_events
+  FOR EACH ROW
+  EXECUTE FUNCTION update_updated_at_column();
+
+COMMENT ON TABLE core_events IS 'Normalized events from email and meeting sources, partitioned by month';
+COMMENT ON COLUMN core_events.tenant_id IS 'Tenant (mailbox) the event was ingested for';
+COMMENT ON COLUMN core_events.embedding IS '384-dimensional vector from all-MiniLM-L6-v2 model';
+COMMENT ON COLUMN core_event_topics.event_timestamp IS 'Timestamp of the event (partition key of core_events)';
+
+COMMIT;
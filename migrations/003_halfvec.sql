@@ -0,0 +1,27 @@
+-- Migration 003: half-precision (float16) embedding storage
+-- Converts core_events.embedding and core_topics.centroid from vector(384) to
+-- halfvec(384), halving their size (1544 -> 776 bytes per value). Requires
+-- pgvector >= 0.7 on the server. Set EMBEDDING_STORAGE=halfvec for every process
+-- after running it. Rewrites both tables under an exclusive lock.
+--
+-- To go back to float32:
+--   ALTER TABLE core_events ALTER COLUMN embedding TYPE vector(384) USING embedding::vector(384);
+--   ALTER TABLE core_topics ALTER COLUMN centroid TYPE vector(384) USING centroid::vector(384);
+--   and recreate idx_core_topics_centroid and idx_core_events_embedding with vector_cosine_ops.
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_core_topics_centroid;
+DROP INDEX IF EXISTS idx_core_events_embedding;
+
+ALTER TABLE core_events ALTER COLUMN embedding TYPE halfvec(384) USING embedding::halfvec(384);
+ALTER TABLE core_topics ALTER COLUMN centroid TYPE halfvec(384) USING centroid::halfvec(384);
+
+CREATE INDEX idx_core_topics_centroid ON core_topics USING hnsw (centroid halfvec_cosine_ops);
+CREATE INDEX idx_core_events_embedding ON core_events USING hnsw (embedding halfvec_cosine_ops)
+  WITH (m = 16, ef_construction = 64);
+
+COMMENT ON COLUMN core_events.embedding IS '384-dimensional half-precision vector from all-MiniLM-L6-v2 model';
+COMMENT ON COLUMN core_topics.centroid IS 'Rolling average centroid of topic cluster in 384-dimensional space (half precision)';
+
+COMMIT;
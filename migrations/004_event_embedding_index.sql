@@ -0,0 +1,23 @@
+-- Migration 004: HNSW index on core_events.embedding for the /search endpoint
+-- Requires migration 002 (the index is created on every monthly partition). Uses
+-- halfvec_cosine_ops when migration 003 was applied. Blocks writes to core_events
+-- while the index builds; raise maintenance_work_mem (e.g. SET maintenance_work_mem
+-- = '1GB') so the graph fits in memory, otherwise the build is much slower.
+
+BEGIN;
+
+DO $$
+BEGIN
+  IF (
+    SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+    WHERE attrelid = 'core_events'::regclass AND attname = 'embedding'
+  ) LIKE 'halfvec%' THEN
+    CREATE INDEX IF NOT EXISTS idx_core_events_embedding ON core_events
+      USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64);
+  ELSE
+    CREATE INDEX IF NOT EXISTS idx_core_events_embedding ON core_events
+      USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+  END IF;
+END $$;
+
+COMMIT;
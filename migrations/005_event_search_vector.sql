@@ -0,0 +1,16 @@
+-- Migration 005: full-text search over event subject and text for hybrid /search
+-- Adds a generated tsvector column (subject weighted above text) and a GIN index
+-- on it. Adding a stored generated column rewrites every core_events partition
+-- under an exclusive lock.
+
+BEGIN;
+
+ALTER TABLE core_events ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+  setweight(to_tsvector('english', coalesce(subject, '')), 'A') || setweight(to_tsvector('english', text), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_core_events_search_vector ON core_events USING gin (search_vector);
+
+COMMENT ON COLUMN core_events.search_vector IS 'Full-text index of subject (weight A) and text (weight B)';
+
+COMMIT;
@@ -0,0 +1,65 @@
+-- Migration 006: per-day event counters maintained by triggers for /stats
+-- core_event_counts holds one row per tenant, UTC day and source with the number
+-- of events and how many of them still lack an embedding. Triggers on
+-- core_events keep it current, so /stats reads a few hundred rows instead of
+-- scanning the event table. Existing events are counted once below.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS core_event_counts (
+  tenant_id TEXT NOT NULL,
+  day DATE NOT NULL,
+  source TEXT NOT NULL,
+  events BIGINT NOT NULL DEFAULT 0,
+  missing_embeddings BIGINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (tenant_id, day, source)
+);
+
+CREATE OR REPLACE FUNCTION count_core_events()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('DELETE', 'UPDATE') THEN
+    UPDATE core_event_counts
+    SET events = events - 1, missing_embeddings = missing_embeddings - (OLD.embedding IS NULL)::int
+    WHERE tenant_id = OLD.tenant_id AND day = (OLD.timestamp AT TIME ZONE 'UTC')::date AND source = OLD.source;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    INSERT INTO core_event_counts (tenant_id, day, source, events, missing_embeddings)
+    VALUES (NEW.tenant_id, (NEW.timestamp AT TIME ZONE 'UTC')::date, NEW.source, 1, (NEW.embedding IS NULL)::int)
+    ON CONFLICT (tenant_id, day, source) DO UPDATE
+    SET events = core_event_counts.events + 1,
+        missing_embeddings = core_event_counts.missing_embeddings + EXCLUDED.missing_embeddings;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS count_core_events_insert_delete ON core_events;
+CREATE TRIGGER count_core_events_insert_delete
+  AFTER INSERT OR DELETE ON core_events
+  FOR EACH ROW
+  EXECUTE FUNCTION count_core_events();
+
+-- Re-ingesting an event only touches the counters if it moves or gains/loses its embedding
+DROP TRIGGER IF EXISTS count_core_events_update ON core_events;
+CREATE TRIGGER count_core_events_update
+  AFTER UPDATE OF tenant_id, source, timestamp, embedding ON core_events
+  FOR EACH ROW
+  WHEN (
+    OLD.tenant_id IS DISTINCT FROM NEW.tenant_id OR OLD.source IS DISTINCT FROM NEW.source
+    OR OLD.timestamp IS DISTINCT FROM NEW.timestamp OR (OLD.embedding IS NULL) <> (NEW.embedding IS NULL)
+  )
+  EXECUTE FUNCTION count_core_events();
+
+-- Lock out writers while the existing events are counted, so none is counted twice or missed
+LOCK TABLE core_events IN SHARE MODE;
+
+DELETE FROM core_event_counts;
+INSERT INTO core_event_counts (tenant_id, day, source, events, missing_embeddings)
+SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date, source, count(*), count(*) FILTER (WHERE embedding IS NULL)
+FROM core_events
+GROUP BY 1, 2, 3;
+
+COMMENT ON TABLE core_event_counts IS 'Events and missing embeddings per tenant, UTC day and source (maintained by triggers)';
+
+COMMIT;
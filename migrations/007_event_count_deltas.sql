@@ -0,0 +1,79 @@
+-- Migration 007: append-only event count deltas instead of per-row counter upserts
+-- The row-level triggers of migration 006 upserted core_event_counts once per
+-- event, so concurrent ingests of the same tenant, day and source queued on one
+-- counter row until each transaction committed. Statement-level triggers now
+-- aggregate each statement's transition table and append one delta row per
+-- tenant, day and source to core_event_count_deltas (no unique key, so nothing
+-- to wait for). /stats adds the deltas to core_event_counts, and
+-- scripts/compact_event_counts.py folds them in periodically.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS core_event_count_deltas (
+  id BIGSERIAL PRIMARY KEY,
+  tenant_id TEXT NOT NULL,
+  day DATE NOT NULL,
+  source TEXT NOT NULL,
+  events BIGINT NOT NULL,
+  missing_embeddings BIGINT NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION count_core_event_changes()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO core_event_count_deltas (tenant_id, day, source, events, missing_embeddings)
+    SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date, source, count(*), count(*) FILTER (WHERE embedding IS NULL)
+    FROM new_rows
+    GROUP BY 1, 2, 3;
+  ELSIF TG_OP = 'DELETE' THEN
+    INSERT INTO core_event_count_deltas (tenant_id, day, source, events, missing_embeddings)
+    SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date, source, -count(*), -count(*) FILTER (WHERE embedding IS NULL)
+    FROM old_rows
+    GROUP BY 1, 2, 3;
+  ELSE
+    -- Only updates that move an event or add/remove its embedding leave a non-zero delta
+    INSERT INTO core_event_count_deltas (tenant_id, day, source, events, missing_embeddings)
+    SELECT tenant_id, day, source, sum(events), sum(missing_embeddings)
+    FROM (
+      SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date AS day, source, 1 AS events,
+             (embedding IS NULL)::int AS missing_embeddings
+      FROM new_rows
+      UNION ALL
+      SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date, source, -1, -(embedding IS NULL)::int
+      FROM old_rows
+    ) changes
+    GROUP BY 1, 2, 3
+    HAVING sum(events) <> 0 OR sum(missing_embeddings) <> 0;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow one event per trigger and no column list
+DROP TRIGGER IF EXISTS count_core_events_insert_delete ON core_events;
+DROP TRIGGER IF EXISTS count_core_events_update ON core_events;
+DROP FUNCTION IF EXISTS count_core_events();
+
+CREATE TRIGGER count_core_events_insert
+  AFTER INSERT ON core_events
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION count_core_event_changes();
+
+CREATE TRIGGER count_core_events_delete
+  AFTER DELETE ON core_events
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION count_core_event_changes();
+
+CREATE TRIGGER count_core_events_update
+  AFTER UPDATE ON core_events
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION count_core_event_changes();
+
+COMMENT ON TABLE core_event_counts IS 'Compacted events and missing embeddings per tenant, UTC day and source';
+COMMENT ON TABLE core_event_count_deltas IS 'Event count changes appended by the core_events triggers, compacted into core_event_counts';
+
+COMMIT;
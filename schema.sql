@@ -5,9 +5,23 @@
 -- Enable pgvector extension for vector operations
 CREATE EXTENSION IF NOT EXISTS vector;
 
--- Core events table: stores all normalized events from emails and meetings
+-- Tenants table: one row per mailbox processed into its own weekly brief
+CREATE TABLE IF NOT EXISTS core_tenants (
+  tenant_id TEXT PRIMARY KEY,
+  name TEXT NOT NULL,
+  slack_user_id TEXT,
+  active BOOLEAN NOT NULL DEFAULT TRUE,
+  created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+INSERT INTO core_tenants (tenant_id, name) VALUES ('default', 'Default mailbox')
+ON CONFLICT (tenant_id) DO NOTHING;
+
+-- Core events table: stores all normalized events from emails and meetings,
+-- range-partitioned by month on timestamp (the partition key is part of the primary key)
 CREATE TABLE IF NOT EXISTS core_events (
-  id TEXT PRIMARY KEY,
+  id TEXT NOT NULL,
+  tenant_id TEXT NOT NULL DEFAULT 'default' REFERENCES core_tenants(tenant_id),
   source TEXT NOT NULL CHECK (source IN ('email', 'meeting')),
   timestamp TIMESTAMPTZ NOT NULL,
   actor TEXT NOT NULL,
@@ -22,13 +36,40 @@ CREATE TABLE IF NOT EXISTS core_events (
   sentiment TEXT NOT NULL DEFAULT 'unknown',
   raw_ref TEXT NOT NULL,
   embedding VECTOR(384),
+  search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(subject, '')), 'A') || setweight(to_tsvector('english', text), 'B')
+  ) STORED,
   created_at TIMESTAMPTZ DEFAULT NOW(),
-  updated_at TIMESTAMPTZ DEFAULT NOW()
-);
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+-- Creates the monthly partition of core_events containing a day (idempotent).
+-- Bounds are UTC month starts; partitions are named core_events_yYYYYmMM.
+CREATE OR REPLACE FUNCTION create_core_events_partition(month DATE)
+RETURNS TEXT AS $$
+DECLARE
+  lower_bound TIMESTAMPTZ := date_trunc('month', month)::timestamp AT TIME ZONE 'UTC';
+  upper_bound TIMESTAMPTZ := (date_trunc('month', month) + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC';
+  partition_name TEXT := 'core_events_' || to_char(month, '"y"YYYY"m"MM');
+BEGIN
+  EXECUTE format(
+    'CREATE TABLE IF NOT EXISTS %I PARTITION OF core_events FOR VALUES FROM (%L) TO (%L)',
+    partition_name, lower_bound, upper_bound
+  );
+  RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Partitions from two months back to three months ahead; scripts/maintain_partitions.py
+-- keeps creating future months and the API creates older months on demand
+SELECT create_core_events_partition((date_trunc('month', NOW()) + make_interval(months => m))::date)
+FROM generate_series(-2, 3) AS m;
 
 -- Topics table: stores persistent topics identified through clustering
 CREATE TABLE IF NOT EXISTS core_topics (
   topic_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  tenant_id TEXT NOT NULL DEFAULT 'default' REFERENCES core_tenants(tenant_id),
   centroid VECTOR(384) NOT NULL,
   created_at TIMESTAMPTZ DEFAULT NOW(),
   last_seen_at TIMESTAMPTZ DEFAULT NOW(),
@@ -37,14 +78,18 @@ CREATE TABLE IF NOT EXISTS core_topics (
 
 -- Event-Topic mapping table: many-to-many relationship
 CREATE TABLE IF NOT EXISTS core_event_topics (
-  event_id TEXT REFERENCES core_events(id) ON DELETE CASCADE,
+  event_id TEXT NOT NULL,
   topic_id UUID REFERENCES core_topics(topic_id) ON DELETE CASCADE,
-  PRIMARY KEY (event_id, topic_id)
+  event_timestamp TIMESTAMPTZ NOT NULL,
+  PRIMARY KEY (event_id, topic_id),
+  FOREIGN KEY (event_id, event_timestamp) REFERENCES core_events(id, timestamp)
+    ON DELETE CASCADE ON UPDATE CASCADE
 );
 
 -- Weekly briefs output table: stores generated reports
 CREATE TABLE IF NOT EXISTS out_weekly_briefs (
-  week_start DATE PRIMARY KEY,
+  tenant_id TEXT NOT NULL DEFAULT 'default' REFERENCES core_tenants(tenant_id),
+  week_start DATE NOT NULL,
   week_end DATE NOT NULL,
   markdown TEXT NOT NULL,
   watchlist_json JSONB NOT NULL,
@@ -52,19 +97,87 @@ CREATE TABLE IF NOT EXISTS out_weekly_briefs (
   openai_used BOOLEAN NOT NULL DEFAULT FALSE,
   openai_model TEXT,
   openai_response_id TEXT,
-  created_at TIMESTAMPTZ DEFAULT NOW()
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (tenant_id, week_start)
+);
+
+-- Pipeline checkpoints: completed stage outputs per week for resumable runs
+CREATE TABLE IF NOT EXISTS out_pipeline_checkpoints (
+  tenant_id TEXT NOT NULL DEFAULT 'default',
+  week_start DATE NOT NULL,
+  stage TEXT NOT NULL,
+  payload JSONB NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (tenant_id, week_start, stage)
+);
+
+-- Pipeline runs: one row per weekly/daily run, guarded by a per-period advisory lock
+CREATE TABLE IF NOT EXISTS out_pipeline_runs (
+  run_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  tenant_id TEXT NOT NULL DEFAULT 'default',
+  kind TEXT NOT NULL DEFAULT 'weekly' CHECK (kind IN ('weekly', 'daily')),
+  period_start DATE NOT NULL,
+  status TEXT NOT NULL CHECK (status IN ('running', 'completed', 'failed')),
+  host TEXT NOT NULL,
+  pid INTEGER NOT NULL,
+  started_at TIMESTAMPTZ DEFAULT NOW(),
+  heartbeat_at TIMESTAMPTZ DEFAULT NOW(),
+  finished_at TIMESTAMPTZ,
+  detail TEXT
+);
+
+-- Daily rollups: mergeable per-day metrics, topic rollups and findings (daily mode)
+CREATE TABLE IF NOT EXISTS out_daily_rollups (
+  tenant_id TEXT NOT NULL DEFAULT 'default',
+  day DATE NOT NULL,
+  metrics JSONB NOT NULL,
+  topics JSONB NOT NULL,
+  findings JSONB NOT NULL,
+  topics_assigned BOOLEAN NOT NULL DEFAULT FALSE,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (tenant_id, day)
+);
+
+-- Event counters: events and missing embeddings per tenant, UTC day and source.
+-- The count_core_events_* triggers below append changes to core_event_count_deltas
+-- (no unique key, so concurrent ingests never wait on a counter row);
+-- scripts/compact_event_counts.py folds them into core_event_counts. /stats reads both.
+CREATE TABLE IF NOT EXISTS core_event_counts (
+  tenant_id TEXT NOT NULL,
+  day DATE NOT NULL,
+  source TEXT NOT NULL,
+  events BIGINT NOT NULL DEFAULT 0,
+  missing_embeddings BIGINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (tenant_id, day, source)
+);
+
+CREATE TABLE IF NOT EXISTS core_event_count_deltas (
+  id BIGSERIAL PRIMARY KEY,
+  tenant_id TEXT NOT NULL,
+  day DATE NOT NULL,
+  source TEXT NOT NULL,
+  events BIGINT NOT NULL,
+  missing_embeddings BIGINT NOT NULL
 );
 
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_core_events_timestamp ON core_events(timestamp);
+CREATE INDEX IF NOT EXISTS idx_core_events_tenant_timestamp ON core_events(tenant_id, timestamp);
 CREATE INDEX IF NOT EXISTS idx_core_events_source ON core_events(source);
 CREATE INDEX IF NOT EXISTS idx_core_events_thread_id ON core_events(thread_id) WHERE thread_id IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_core_events_actor ON core_events(actor);
 CREATE INDEX IF NOT EXISTS idx_core_events_urgency ON core_events(urgency_score);
 CREATE INDEX IF NOT EXISTS idx_core_topics_last_seen ON core_topics(last_seen_at);
+CREATE INDEX IF NOT EXISTS idx_core_event_topics_event_timestamp ON core_event_topics(event_timestamp);
+CREATE INDEX IF NOT EXISTS idx_core_topics_tenant ON core_topics(tenant_id);
+CREATE INDEX IF NOT EXISTS idx_out_pipeline_runs_period ON out_pipeline_runs(tenant_id, kind, period_start, started_at);
 
 -- HNSW index for fast vector similarity search
 CREATE INDEX IF NOT EXISTS idx_core_topics_centroid ON core_topics USING hnsw (centroid vector_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_core_events_embedding ON core_events USING hnsw (embedding vector_cosine_ops)
+  WITH (m = 16, ef_construction = 64);
+CREATE INDEX IF NOT EXISTS idx_core_events_search_vector ON core_events USING gin (search_vector);
 
 -- Function to update updated_at timestamp automatically
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -81,12 +194,74 @@ CREATE TRIGGER update_core_events_updated_at
   FOR EACH ROW
   EXECUTE FUNCTION update_updated_at_column();
 
+-- Function appending each statement's net change per tenant, day and source to core_event_count_deltas
+CREATE OR REPLACE FUNCTION count_core_event_changes()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO core_event_count_deltas (tenant_id, day, source, events, missing_embeddings)
+    SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date, source, count(*), count(*) FILTER (WHERE embedding IS NULL)
+    FROM new_rows
+    GROUP BY 1, 2, 3;
+  ELSIF TG_OP = 'DELETE' THEN
+    INSERT INTO core_event_count_deltas (tenant_id, day, source, events, missing_embeddings)
+    SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date, source, -count(*), -count(*) FILTER (WHERE embedding IS NULL)
+    FROM old_rows
+    GROUP BY 1, 2, 3;
+  ELSE
+    -- Only updates that move an event or add/remove its embedding leave a non-zero delta
+    INSERT INTO core_event_count_deltas (tenant_id, day, source, events, missing_embeddings)
+    SELECT tenant_id, day, source, sum(events), sum(missing_embeddings)
+    FROM (
+      SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date AS day, source, 1 AS events,
+             (embedding IS NULL)::int AS missing_embeddings
+      FROM new_rows
+      UNION ALL
+      SELECT tenant_id, (timestamp AT TIME ZONE 'UTC')::date, source, -1, -(embedding IS NULL)::int
+      FROM old_rows
+    ) changes
+    GROUP BY 1, 2, 3
+    HAVING sum(events) <> 0 OR sum(missing_embeddings) <> 0;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level triggers counting inserted, deleted and updated events
+-- (transition tables allow one event per trigger and no column list)
+CREATE TRIGGER count_core_events_insert
+  AFTER INSERT ON core_events
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION count_core_event_changes();
+
+CREATE TRIGGER count_core_events_delete
+  AFTER DELETE ON core_events
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION count_core_event_changes();
+
+CREATE TRIGGER count_core_events_update
+  AFTER UPDATE ON core_events
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION count_core_event_changes();
+
 -- Comments for documentation
-COMMENT ON TABLE core_events IS 'Normalized events from email and meeting sources';
+COMMENT ON TABLE core_tenants IS 'Tenants (mailboxes); each gets its own topics, rollups and weekly brief';
+COMMENT ON TABLE core_events IS 'Normalized events from email and meeting sources, partitioned by month';
 COMMENT ON TABLE core_topics IS 'Persistent topics identified through HDBSCAN clustering';
 COMMENT ON TABLE core_event_topics IS 'Many-to-many mapping between events and topics';
 COMMENT ON TABLE out_weekly_briefs IS 'Generated weekly strategic insight reports';
+COMMENT ON TABLE out_pipeline_checkpoints IS 'Completed weekly pipeline stage outputs used by --resume';
+COMMENT ON TABLE out_daily_rollups IS 'Per-day rollups merged into the weekly brief in daily processing mode';
+COMMENT ON TABLE core_event_counts IS 'Compacted events and missing embeddings per tenant, UTC day and source';
+COMMENT ON TABLE core_event_count_deltas IS 'Event count changes appended by the core_events triggers, compacted into core_event_counts';
+COMMENT ON TABLE out_pipeline_runs IS 'Weekly and daily pipeline run state (running, completed, failed) with heartbeats';
 
+COMMENT ON COLUMN core_events.tenant_id IS 'Tenant (mailbox) the event was ingested for';
+COMMENT ON COLUMN core_event_topics.event_timestamp IS 'Timestamp of the event (partition key of core_events)';
 COMMENT ON COLUMN core_events.embedding IS '384-dimensional vector from all-MiniLM-L6-v2 model';
+COMMENT ON COLUMN core_events.search_vector IS 'Full-text index of subject (weight A) and text (weight B)';
 COMMENT ON COLUMN core_topics.centroid IS 'Rolling average centroid of topic cluster in 384-dimensional space';
 COMMENT ON COLUMN core_topics.n_points IS 'Count of events associated with this topic';
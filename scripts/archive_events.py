@@ -0,0 +1,46 @@
+"""Move events past retention from Postgres to cold storage (e.g. run monthly)."""
+
+import sys
+import argparse
+import logging
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import configure_engine
+from src.archive import archive_events
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archive old core_events partitions to cold storage")
+    parser.add_argument(
+        "--today",
+        type=lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+        help="Reference day (YYYY-MM-DD, default today UTC)"
+    )
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        help="Months to keep in Postgres (default PARTITION_RETENTION_MONTHS, 0 = only export detached months)"
+    )
+    args = parser.parse_args()
+
+    configure_engine(profile="maintenance")
+
+    try:
+        result = archive_events(args.today, args.retention_months)
+    except (RuntimeError, ValueError) as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    logger.info(f"Detached partitions: {', '.join(result['detached']) or 'none'}")
+    logger.info(f"Exported partitions: {', '.join(result['exported']) or 'none'}")
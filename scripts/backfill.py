@@ -0,0 +1,66 @@
+"""Backfill weekly briefs for a historical date range."""
+
+import sys
+import argparse
+import logging
+from datetime import date, datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import configure_engine
+from src.insight.backfill import run_backfill
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate weekly briefs for past weeks")
+    parser.add_argument("--start", type=parse_date, required=True, help="First day to cover (YYYY-MM-DD)")
+    parser.add_argument(
+        "--end",
+        type=parse_date,
+        default=date.today(),
+        help="Day the last week ends on (YYYY-MM-DD, default today)"
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default BACKFILL_WORKERS)")
+    parser.add_argument("--refresh-llm", action="store_true", help="Ignore cached LLM responses")
+    parser.add_argument("--send-slack", action="store_true", help="Also deliver each brief to Slack")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted backfill")
+    parser.add_argument("--tenant", help="Tenant to backfill (default DEFAULT_TENANT_ID)")
+    args = parser.parse_args()
+
+    if args.start >= args.end:
+        parser.error("--start must be before --end")
+
+    configure_engine(profile="batch")
+    summaries = run_backfill(
+        args.start,
+        args.end,
+        workers=args.workers,
+        refresh_llm=args.refresh_llm,
+        send_slack=args.send_slack,
+        resume=args.resume,
+        tenant_id=args.tenant
+    )
+
+    print("\n" + "=" * 80)
+    print("BACKFILL SUMMARY")
+    print("=" * 80)
+    for summary in summaries:
+        detail = f" ({summary['detail']})" if summary["detail"] else ""
+        print(f"{summary['week_start']}  {summary['status']}{detail}")
+    print("=" * 80 + "\n")
+
+    if any(s["status"] == "failed" for s in summaries):
+        sys.exit(1)
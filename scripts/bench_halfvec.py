@@ -0,0 +1,197 @@
+"""Benchmark float16 (halfvec) against float32 (vector) embedding storage."""
+
+import sys
+import json
+import argparse
+import logging
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+from sklearn.metrics import adjusted_rand_score
+from sqlalchemy import Column, Integer, MetaData, Table, select, text
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.vector_types import EmbeddingVector
+from src.insight.modules.clustering import cluster_events
+from src.insight.modules.embeddings import compute_centroid, cosine_similarity
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+DIM = 384
+
+
+def make_synthetic_embeddings(n_events: int, n_topics: int, noise: float, seed: int) -> np.ndarray:
+    """
+    Build unit-length embeddings scattered around random topic directions.
+
+    Args:
+        n_events: Number of embeddings
+        n_topics: Number of topic directions
+        noise: Standard deviation of the per-dimension noise
+        seed: Random seed
+
+    Returns:
+        float32 array of shape (n_events, DIM)
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(n_topics, DIM))
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+
+    points = centers[rng.integers(0, n_topics, n_events)] + rng.normal(scale=noise, size=(n_events, DIM))
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    return points.astype(np.float32)
+
+
+def to_half(embeddings: np.ndarray) -> np.ndarray:
+    """Round-trip embeddings through float16, as halfvec storage does."""
+    return embeddings.astype(np.float16).astype(np.float32)
+
+
+def compare_offline(embeddings: np.ndarray) -> dict:
+    """
+    Compare clustering and topic matching on float32 and float16-rounded embeddings.
+
+    Args:
+        embeddings: float32 embeddings
+
+    Returns:
+        Result dictionary
+    """
+    half = to_half(embeddings)
+
+    start = time.perf_counter()
+    labels_full = cluster_events(embeddings)
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    labels_half = cluster_events(half)
+    half_seconds = time.perf_counter() - start
+
+    # Topic matching: every float32 cluster centroid against every other one,
+    # decided with the configured threshold on both precisions
+    clusters = sorted(set(labels_full) - {-1})
+    centroids_full = [compute_centroid(list(embeddings[labels_full == c])) for c in clusters]
+    centroids_half = [to_half(c) for c in centroids_full]
+    sims_full = [cosine_similarity(e, c) for e in embeddings[:200] for c in centroids_full]
+    sims_half = [cosine_similarity(e, c) for e in half[:200] for c in centroids_half]
+    threshold = settings.topic_similarity_threshold
+    agreement = np.mean([(a >= threshold) == (b >= threshold) for a, b in zip(sims_full, sims_half)]) if sims_full else 1.0
+
+    return {
+        "scenario": "clustering_agreement",
+        "events": len(embeddings),
+        "max_abs_element_error": float(np.max(np.abs(embeddings - half))),
+        "max_abs_cosine_error": float(np.max(np.abs(np.array(sims_full) - np.array(sims_half)))) if sims_full else 0.0,
+        "clusters_float32": len(clusters),
+        "clusters_float16": len(set(labels_half) - {-1}),
+        "adjusted_rand_index": round(float(adjusted_rand_score(labels_full, labels_half)), 4),
+        "topic_match_agreement": round(float(agreement), 4),
+        "cluster_seconds_float32": round(full_seconds, 3),
+        "cluster_seconds_float16": round(half_seconds, 3)
+    }
+
+
+def compare_in_database(embeddings: np.ndarray, repeats: int) -> list[dict]:
+    """
+    Measure table size, server-side scan time and fetch time for both storage modes.
+
+    Uses temporary tables, so nothing is left behind in the database.
+
+    Args:
+        embeddings: float32 embeddings
+        repeats: Timed repetitions (the median is reported)
+
+    Returns:
+        One result dictionary per storage mode
+    """
+    from src.database import engine
+
+    results = []
+    query = embeddings[0].tolist()
+
+    with engine.connect() as connection:
+        for storage in ("vector", "halfvec"):
+            table = Table(
+                f"bench_{storage}", MetaData(),
+                Column("id", Integer, primary_key=True),
+                Column("embedding", EmbeddingVector(DIM, storage)),
+                prefixes=["TEMPORARY"]
+            )
+            table.create(connection)
+            connection.execute(table.insert(), [
+                {"id": i, "embedding": embedding} for i, embedding in enumerate(embeddings)
+            ])
+            connection.execute(text(f"ANALYZE {table.name}"))
+
+            size = connection.execute(text(f"SELECT pg_total_relation_size('{table.name}')")).scalar()
+
+            scan_times, fetch_times = [], []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                connection.execute(
+                    select(table.c.embedding.cosine_distance(query)).order_by(table.c.id)
+                ).all()
+                scan_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                connection.execute(select(table.c.embedding)).scalars().all()
+                fetch_times.append(time.perf_counter() - start)
+
+            results.append({
+                "scenario": f"database ({storage})",
+                "rows": len(embeddings),
+                "table_bytes": size,
+                "bytes_per_row": round(size / len(embeddings), 1),
+                "scan_seconds": round(statistics.median(scan_times), 4),
+                "fetch_seconds": round(statistics.median(fetch_times), 4)
+            })
+            table.drop(connection)
+
+        connection.rollback()
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark halfvec against vector embedding storage")
+    parser.add_argument("--events", type=int, default=1500)
+    parser.add_argument("--topics", type=int, default=25)
+    parser.add_argument("--noise", type=float, default=0.03)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--database",
+        action="store_true",
+        help="Also measure size and scan time in DATABASE_URL (needs pgvector >= 0.7)"
+    )
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    embeddings = make_synthetic_embeddings(args.events, args.topics, args.noise, args.seed)
+
+    # pgvector varlena: 4-byte header + 2-byte dimension count + 2 unused bytes
+    results = [{
+        "scenario": "storage_per_value",
+        "vector_bytes": 4 * DIM + 8,
+        "halfvec_bytes": 2 * DIM + 8
+    }, compare_offline(embeddings)]
+
+    if args.database:
+        results += compare_in_database(embeddings, args.repeats)
+
+    for result in results:
+        print(json.dumps(result))
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
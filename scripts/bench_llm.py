@@ -0,0 +1,227 @@
+"""Offline latency benchmark for the LLM enhancement stage against local stand-in servers."""
+
+import sys
+import json
+import asyncio
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.insight.modules import llm
+from src.insight.modules.clients import close_clients, close_async_clients
+from src.insight.modules.payload import estimate_tokens
+from src.insight.modules.resilience import get_resilience_counters, reset_resilience_state
+from scripts.llm_standin_server import StandinServer
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def make_synthetic_inputs(n_actors: int, n_topics: int, n_threads: int) -> tuple:
+    """
+    Build synthetic metrics shaped like the weekly pipeline's output.
+
+    Args:
+        n_actors: Number of distinct actors
+        n_topics: Number of topics
+        n_threads: Number of repeated threads
+
+    Returns:
+        (week_metrics, baseline_metrics, deltas, topic_metrics, findings)
+    """
+    def metrics(scale: int) -> dict:
+        return {
+            "total_events": n_actors * scale,
+            "urgency_distribution": {"low": 10 * scale, "medium": 20 * scale, "high": 5 * scale},
+            "actor_load": {f"actor{i}@example.com": scale * (n_actors - i) for i in range(n_actors)},
+            "decision_counts": {"made": 4 * scale, "deferred": 6 * scale, "none": 25 * scale},
+            "follow_up_count": 12 * scale,
+            "repeated_patterns": [
+                {"thread_id": f"thread_{i}", "count": 3 + i % 7, "subjects": [f"Project {i % 5} status update"]}
+                for i in range(n_threads)
+            ]
+        }
+
+    topic_metrics = [
+        {
+            "topic_id": f"00000000-0000-0000-0000-{i:012d}",
+            "event_count": n_topics - i + 2,
+            "avg_urgency": 5.5,
+            "decisions_made": i % 2,
+            "decisions_deferred": i % 4,
+            "follow_up_required": i % 3,
+            "sample_subjects": [f"Project {i % 5} status update", f"Budget line {i}"],
+            "created_at": "2025-12-01T00:00:00+00:00",
+            "is_new": i % 5 == 0
+        }
+        for i in range(n_topics)
+    ]
+
+    findings = [
+        {
+            "type": "decision_pressure",
+            "severity": "high",
+            "description": f"Topic requires {t['follow_up_required']} follow-ups",
+            "evidence": t["sample_subjects"],
+            "topic_id": t["topic_id"]
+        }
+        for t in topic_metrics[:n_topics // 2]
+    ]
+
+    deltas = {
+        "total_events_delta": n_actors,
+        "total_events_pct_change": 12.5,
+        "urgency_shifts": {"high_delta": 2, "medium_delta": 1, "low_delta": -1},
+        "decision_shifts": {"made_delta": -1, "deferred_delta": 3},
+        "follow_up_delta": 4,
+        "top_actor_movers": [{"actor": f"actor{i}@example.com", "delta": 5 - i} for i in range(5)]
+    }
+
+    return metrics(1), metrics(4), deltas, topic_metrics, findings
+
+
+def summarize(name: str, latencies: list[float], successes: int) -> dict:
+    """Summarize latencies for one scenario."""
+    ordered = sorted(latencies)
+    return {
+        "scenario": name,
+        "runs": len(latencies),
+        "successes": successes,
+        "mean_s": round(statistics.mean(ordered), 3),
+        "p50_s": round(ordered[len(ordered) // 2], 3),
+        "p95_s": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 3),
+        "max_s": round(ordered[-1], 3),
+        "provider_calls": get_resilience_counters()
+    }
+
+
+def reset_state() -> None:
+    close_clients()
+    reset_resilience_state()
+
+
+def run_sequential(inputs: tuple, iterations: int, use_cache: bool) -> tuple:
+    settings.llm_cache_enabled = use_cache
+    latencies, successes = [], 0
+
+    for _ in range(iterations):
+        started = time.perf_counter()
+        _, used, _, _ = llm.enhance_with_llm(*inputs)
+        latencies.append(time.perf_counter() - started)
+        successes += int(used)
+
+    return latencies, successes
+
+
+async def run_hedged(inputs: tuple, iterations: int, hedge_delay: float) -> tuple:
+    settings.llm_cache_enabled = False
+    latencies, successes, saved = [], 0, []
+
+    try:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            _, used, _, _, hedge = await llm.enhance_with_llm_hedged(*inputs, hedge_delay=hedge_delay)
+            latencies.append(time.perf_counter() - started)
+            successes += int(used)
+            saved.append(hedge["latency_saved_seconds"])
+    finally:
+        await close_async_clients()
+
+    return latencies, successes, saved
+
+
+def run_benchmark(args) -> list[dict]:
+    """Run all benchmark scenarios and return their summaries."""
+    inputs = make_synthetic_inputs(args.actors, args.topics, args.threads)
+    results = []
+
+    grok = StandinServer(latency=args.grok_latency, latency_jitter=args.jitter, error_rate=args.grok_error_rate)
+    openai = StandinServer(latency=args.openai_latency, latency_jitter=args.jitter, error_rate=args.openai_error_rate)
+
+    with grok, openai, tempfile.TemporaryDirectory() as cache_dir:
+        settings.grok_api_key = "standin"
+        settings.grok_api_url = grok.url
+        settings.openai_api_key = "standin"
+        settings.openai_base_url = openai.url
+        settings.llm_cache_dir = cache_dir
+
+        # Payload compaction
+        budget = settings.llm_token_budget
+        settings.llm_token_budget = 10 ** 9
+        settings.llm_payload_top_k = 10 ** 9
+        full_tokens = estimate_tokens(llm.prepare_facts_payload(*inputs))
+        settings.llm_token_budget = budget
+        settings.llm_payload_top_k = args.top_k
+        compact_tokens = estimate_tokens(llm.prepare_facts_payload(*inputs))
+        results.append({
+            "scenario": "payload_compaction",
+            "tokens_uncompacted": full_tokens,
+            "tokens_compacted": compact_tokens,
+            "token_budget": budget
+        })
+
+        reset_state()
+        latencies, successes = run_sequential(inputs, args.iterations, use_cache=False)
+        results.append(summarize("sequential", latencies, successes))
+
+        reset_state()
+        latencies, successes, saved = asyncio.run(run_hedged(inputs, args.iterations, args.hedge_delay))
+        summary = summarize(f"hedged (delay {args.hedge_delay}s)", latencies, successes)
+        summary["mean_latency_saved_s"] = round(statistics.mean(saved), 3)
+        results.append(summary)
+
+        reset_state()
+        latencies, successes = run_sequential(inputs, args.iterations, use_cache=True)
+        results.append(summarize("sequential + cache", latencies, successes))
+
+        results.append({
+            "scenario": "stand-in servers",
+            "grok_requests": grok.requests,
+            "grok_connections": grok.connections,
+            "openai_requests": openai.requests,
+            "openai_connections": openai.connections
+        })
+
+    reset_state()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark LLM enhancement against local stand-in servers")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--grok-latency", type=float, default=0.5)
+    parser.add_argument("--grok-error-rate", type=float, default=0.2)
+    parser.add_argument("--openai-latency", type=float, default=0.3)
+    parser.add_argument("--openai-error-rate", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--hedge-delay", type=float, default=0.2)
+    parser.add_argument("--actors", type=int, default=200)
+    parser.add_argument("--topics", type=int, default=40)
+    parser.add_argument("--threads", type=int, default=60)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Keep injected failures cheap so the benchmark measures the pipeline, not sleeps
+    settings.retry_base_delay_seconds = 0.05
+    settings.retry_max_delay_seconds = 0.5
+
+    results = run_benchmark(args)
+
+    for result in results:
+        print(json.dumps(result))
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
@@ -0,0 +1,176 @@
+"""Benchmark HNSW semantic search latency and recall at large row counts."""
+
+import sys
+import io
+import json
+import argparse
+import logging
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import text
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+DIM = 384
+CHUNK = 50_000
+
+
+def make_chunk(rng: np.random.Generator, centers: np.ndarray, size: int, noise: float) -> np.ndarray:
+    """Unit-length embeddings scattered around random topic directions."""
+    points = centers[rng.integers(0, len(centers), size)] + rng.normal(scale=noise, size=(size, DIM))
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    return points.astype(np.float32)
+
+
+def load_table(connection, rows: int, topics: int, noise: float, seed: int) -> np.ndarray:
+    """
+    Fill a temporary events-like table through COPY.
+
+    Args:
+        connection: SQLAlchemy connection
+        rows: Rows to load
+        topics: Topic directions of the synthetic embeddings
+        noise: Per-dimension noise
+        seed: Random seed
+
+    Returns:
+        Topic directions (queries are drawn around them)
+    """
+    column_type = "halfvec" if settings.embedding_storage == "halfvec" else "vector"
+    connection.execute(text(
+        f"CREATE TEMPORARY TABLE bench_events (id INTEGER PRIMARY KEY, source TEXT NOT NULL, "
+        f"timestamp TIMESTAMPTZ NOT NULL, embedding {column_type}({DIM}))"
+    ))
+
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(topics, DIM))
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+
+    cursor = connection.connection.cursor()
+    for offset in range(0, rows, CHUNK):
+        size = min(CHUNK, rows - offset)
+        buffer = io.StringIO()
+        for i, embedding in enumerate(make_chunk(rng, centers, size, noise), start=offset):
+            source = "email" if i % 2 else "meeting"
+            # Spread rows over a year so time filters select a fraction of them
+            buffer.write(f"{i}\t{source}\t2025-{i % 12 + 1:02d}-15 12:00:00+00\t")
+            buffer.write("[" + ",".join(f"{value:.6f}" for value in embedding) + "]\n")
+        buffer.seek(0)
+        cursor.copy_expert("COPY bench_events (id, source, timestamp, embedding) FROM STDIN", buffer)
+        logger.info(f"Loaded {offset + size}/{rows} rows")
+
+    connection.execute(text("ANALYZE bench_events"))
+    return centers
+
+
+def run_queries(connection, queries: np.ndarray, limit: int, where: str, exact: bool) -> tuple[list, list]:
+    """
+    Run the nearest-neighbour query for each query embedding.
+
+    Returns:
+        (latencies in milliseconds, result id lists)
+    """
+    column_type = "halfvec" if settings.embedding_storage == "halfvec" else "vector"
+    connection.execute(text(f"SET enable_indexscan = {'off' if exact else 'on'}"))
+    latencies, results = [], []
+
+    for query in queries:
+        vector = "[" + ",".join(f"{value:.6f}" for value in query) + "]"
+        start = time.perf_counter()
+        ids = connection.execute(text(
+            f"SELECT id FROM bench_events {where} ORDER BY embedding <=> CAST(:q AS {column_type}) LIMIT :limit"
+        ), {"q": vector, "limit": limit}).scalars().all()
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append(ids)
+
+    connection.execute(text("RESET enable_indexscan"))
+    return latencies, results
+
+
+def percentile(values: list, p: float) -> float:
+    return round(float(np.percentile(values, p)), 2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the HNSW index used by /search")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows to load (e.g. 1000000)")
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--noise", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[settings.search_ef_search])
+    parser.add_argument("--target-p95-ms", type=float, default=50.0)
+    parser.add_argument("--target-recall", type=float, default=0.95)
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    from src.database import engine
+
+    results = []
+    ops = "halfvec_cosine_ops" if settings.embedding_storage == "halfvec" else "vector_cosine_ops"
+
+    with engine.connect() as connection:
+        centers = load_table(connection, args.rows, args.topics, args.noise, args.seed)
+
+        start = time.perf_counter()
+        connection.execute(text(
+            f"CREATE INDEX ON bench_events USING hnsw (embedding {ops}) WITH (m = 16, ef_construction = 64)"
+        ))
+        build_seconds = time.perf_counter() - start
+        index_bytes = connection.execute(text("SELECT pg_indexes_size('bench_events')")).scalar()
+        results.append({
+            "scenario": "index_build",
+            "rows": args.rows,
+            "build_seconds": round(build_seconds, 1),
+            "index_bytes": index_bytes
+        })
+
+        queries = make_chunk(np.random.default_rng(args.seed + 1), centers, args.queries, args.noise)
+        filters = {
+            "unfiltered": "",
+            "source": "WHERE source = 'email'",
+            "source_and_quarter": "WHERE source = 'email' AND timestamp >= '2025-01-01' AND timestamp < '2025-04-01'"
+        }
+
+        for name, where in filters.items():
+            _, truth = run_queries(connection, queries, args.limit, where, exact=True)
+
+            for ef_search in args.ef_search:
+                connection.execute(text(f"SET hnsw.ef_search = {max(ef_search, args.limit)}"))
+                latencies, found = run_queries(connection, queries, args.limit, where, exact=False)
+                recall = statistics.mean(
+                    len(set(a) & set(b)) / max(len(b), 1) for a, b in zip(found, truth)
+                )
+                results.append({
+                    "scenario": name,
+                    "ef_search": ef_search,
+                    "p50_ms": percentile(latencies, 50),
+                    "p95_ms": percentile(latencies, 95),
+                    "p99_ms": percentile(latencies, 99),
+                    "recall": round(recall, 4),
+                    "short_results": sum(len(ids) < args.limit for ids in found),
+                    "meets_target": percentile(latencies, 95) <= args.target_p95_ms and recall >= args.target_recall
+                })
+
+        connection.rollback()
+
+    for result in results:
+        print(json.dumps(result))
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
@@ -0,0 +1,25 @@
+"""Fold the event count deltas appended by the core_events triggers into core_event_counts (run every few minutes)."""
+
+import sys
+import logging
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import configure_engine, get_db_context
+from src.stats import compact_event_counts
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    configure_engine(profile="maintenance")
+
+    with get_db_context() as db:
+        compact_event_counts(db)
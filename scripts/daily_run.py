@@ -0,0 +1,73 @@
+"""Daily incremental processing script (PROCESSING_MODE=daily)."""
+
+import sys
+import argparse
+import logging
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.database import configure_engine
+from src.pool_metrics import log_pool_stats
+from src.telemetry import export_batch_metrics
+from src.insight.daily import run_daily_for_tenants
+from src.insight.tenants import get_active_tenants
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process one day of events into a daily rollup")
+    parser.add_argument(
+        "--day",
+        type=lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+        help="Day to process (YYYY-MM-DD, default yesterday UTC)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run even when PROCESSING_MODE is not daily"
+    )
+    parser.add_argument(
+        "--on-conflict",
+        choices=["exit", "wait"],
+        help="When another run is processing the same day (default RUN_LOCK_ON_CONFLICT)"
+    )
+    parser.add_argument(
+        "--tenant",
+        action="append",
+        help="Process only this tenant (repeatable; default all active tenants)"
+    )
+    args = parser.parse_args()
+
+    if get_settings().processing_mode != "daily" and not args.force:
+        logger.info("PROCESSING_MODE is not daily, nothing to do")
+        sys.exit(0)
+
+    configure_engine(profile="batch")
+    tenants = args.tenant or get_active_tenants()
+    results = run_daily_for_tenants(tenants, args.day, on_conflict=args.on_conflict)
+
+    failed = [tenant_id for tenant_id, run in results.items() if isinstance(run, Exception)]
+    for tenant_id, run in results.items():
+        if isinstance(run, Exception):
+            continue
+        if run.stopped:
+            logger.warning(f"Daily processing stopped for {tenant_id}: {run.stopped_reason}")
+        else:
+            logger.info(f"Daily processing for {tenant_id} finished in {run.wall_seconds:.2f}s")
+
+    log_pool_stats()
+    export_batch_metrics("daily_run")
+
+    if failed:
+        logger.error(f"Daily processing failed for {len(failed)} of {len(tenants)} tenants: {', '.join(failed)}")
+        sys.exit(1)
@@ -0,0 +1,189 @@
+"""Local OpenAI-compatible stand-in server for offline LLM testing and benchmarks."""
+
+import sys
+import json
+import random
+import argparse
+import logging
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+CANNED_OUTPUT = {
+    "signals": ["Event volume up versus baseline, concentrated in two topics"],
+    "drift": ["Decision deferrals rising in budget-related threads"],
+    "decision_pressure": ["Two topics need an owner decision this week"],
+    "recommended_actions": ["Assign an owner to the top deferred topic"],
+    "watchlist": ["High-urgency topic with no decisions made"]
+}
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Serves POST /chat/completions with canned schema-valid responses."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+
+        with self.server.lock:
+            self.server.requests += 1
+
+        delay = max(random.gauss(self.server.latency, self.server.latency_jitter), 0.0)
+        time.sleep(delay)
+
+        if random.random() < self.server.error_rate:
+            self._send_json(
+                503,
+                {"error": {"message": "Stand-in injected failure"}},
+                headers={"Retry-After": str(self.server.retry_after)}
+            )
+            return
+
+        try:
+            model = json.loads(body).get("model", "standin")
+        except ValueError:
+            model = "standin"
+
+        self._send_json(200, {
+            "id": f"chatcmpl-standin-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps(self.server.output)},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": length // 4, "completion_tokens": 64, "total_tokens": length // 4 + 64}
+        })
+
+    def _send_json(self, status_code: int, payload: dict, headers: dict | None = None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        try:
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up (e.g. a hedged request that was cancelled)
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class StandinServer:
+    """
+    OpenAI-compatible /chat/completions server running in a background thread.
+
+    Args:
+        latency: Mean response latency in seconds
+        latency_jitter: Standard deviation of response latency in seconds
+        error_rate: Probability (0-1) of answering 503
+        retry_after: Retry-After seconds sent with injected errors
+        output: Canned enhancement output (defaults to a schema-valid sample)
+        host: Bind address
+        port: Bind port (0 picks a free port)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 0,
+        output: dict | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        self.httpd = ThreadingHTTPServer((host, port), StandinHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.lock = threading.Lock()
+        self.httpd.latency = latency
+        self.httpd.latency_jitter = latency_jitter
+        self.httpd.error_rate = error_rate
+        self.httpd.retry_after = retry_after
+        self.httpd.output = output or CANNED_OUTPUT
+        self.httpd.connections = 0
+        self.httpd.requests = 0
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def connections(self) -> int:
+        """Number of TCP connections accepted so far."""
+        return self.httpd.connections
+
+    @property
+    def requests(self) -> int:
+        """Number of /chat/completions requests served so far."""
+        return self.httpd.requests
+
+    def start(self) -> "StandinServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local OpenAI-compatible stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.5, help="Mean latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Latency standard deviation in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a 503 response")
+    parser.add_argument("--retry-after", type=float, default=1, help="Retry-After seconds on 503")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    server = StandinServer(
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        host=args.host,
+        port=args.port
+    )
+    logger.info(f"Stand-in LLM server listening on {server.url}/chat/completions")
+
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+        sys.exit(0)
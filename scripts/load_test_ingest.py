@@ -0,0 +1,135 @@
+"""Load test the ingest API: burst of webhook-style requests, p50/p99 latency and throughput."""
+
+import sys
+import json
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+
+def make_event(run_id: str, i: int) -> dict:
+    """Build a canonical email event with a unique ID."""
+    return {
+        "id": f"loadtest:{run_id}:{i}",
+        "source": "email",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "actor": f"sender{i % 50}@example.com",
+        "direction": "inbound",
+        "subject": f"Load test {i % 20}",
+        "text": f"Status update {i} on the quarterly budget and hiring plan.",
+        "thread_id": f"loadtest-thread-{i % 100}",
+        "decision": "none",
+        "action_owner": None,
+        "follow_up_required": i % 3 == 0,
+        "urgency_score": i % 11,
+        "sentiment": "unknown",
+        "raw_ref": f"loadtest-{i}"
+    }
+
+
+async def run_target(label: str, url: str, endpoint: str, requests: int, concurrency: int, tenant: str | None) -> dict:
+    """
+    Send a burst of requests to one API and measure it.
+
+    Args:
+        label: Name of the target in the results
+        url: API base URL
+        endpoint: "email", "meeting" or "stats"
+        requests: Total requests
+        concurrency: Requests in flight at once (n8n webhook burst size)
+        tenant: X-Tenant-ID header, if any
+
+    Returns:
+        Result dictionary
+    """
+    run_id = uuid.uuid4().hex[:8]
+    headers = {"X-Tenant-ID": tenant} if tenant else {}
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=120, limits=limits, headers=headers) as client:
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    if endpoint == "stats":
+                        response = await client.get("/stats")
+                    else:
+                        event = make_event(run_id, i)
+                        event["source"] = endpoint
+                        response = await client.post(f"/ingest/{endpoint}", json=event)
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    errors += 1
+                    logger.debug(f"Request {i} failed: {e}")
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "target": label,
+        "endpoint": endpoint,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "p50_ms": round(float(np.percentile(latencies, 50)), 1),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 1),
+        "requests_per_second": round(requests / elapsed, 1)
+    }
+
+
+def parse_target(value: str) -> tuple[str, str]:
+    label, _, url = value.partition("=")
+    if not url:
+        raise argparse.ArgumentTypeError("Targets are given as label=url")
+    return label, url
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare ingest latency and throughput of API deployments")
+    parser.add_argument(
+        "--target",
+        type=parse_target,
+        action="append",
+        help="label=url of an API to test (repeat to compare, e.g. sync=http://localhost:8001)"
+    )
+    parser.add_argument("--endpoint", choices=["email", "meeting", "stats"], default="email")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--tenant", help="X-Tenant-ID header")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    targets = args.target or [("api", "http://localhost:8000")]
+    results = [
+        asyncio.run(run_target(label, url, args.endpoint, args.requests, args.concurrency, args.tenant))
+        for label, url in targets
+    ]
+
+    for result in results:
+        print(json.dumps(result))
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
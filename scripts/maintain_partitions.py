@@ -0,0 +1,43 @@
+"""Create upcoming core_events partitions and archive old ones (run daily)."""
+
+import sys
+import argparse
+import logging
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import configure_engine
+from src.partitions import maintain_partitions
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain monthly partitions of core_events")
+    parser.add_argument(
+        "--today",
+        type=lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+        help="Reference day (YYYY-MM-DD, default today UTC)"
+    )
+    parser.add_argument("--premake-months", type=int, help="Months to create ahead (default PARTITION_PREMAKE_MONTHS)")
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        help="Months to keep attached before archiving (default PARTITION_RETENTION_MONTHS, 0 = keep all)"
+    )
+    args = parser.parse_args()
+
+    configure_engine(profile="maintenance")
+
+    result = maintain_partitions(args.today, args.premake_months, args.retention_months)
+
+    logger.info(f"Created partitions: {', '.join(result['created']) or 'none'}")
+    logger.info(f"Archived partitions: {', '.join(result['archived']) or 'none'}")
@@ -0,0 +1,359 @@
+"""Cold storage for archived events: Parquet export of old partitions and a hot + cold reader."""
+
+import logging
+import os
+import re
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Type
+import numpy as np
+from sqlalchemy import inspect, text
+from pgvector.utils import from_db
+
+from src import database
+from src.config import get_settings
+from src.database import get_db_context
+from src.models import CoreEvent
+from src.partitions import ARCHIVE_SCHEMA, MIN_RETENTION_MONTHS, add_months, archive_partitions, month_start
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, only needed for COLD_STORAGE=parquet
+    pa = None
+    pq = None
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIM = 384
+
+# Event columns copied to cold storage (embedding and topic_ids are handled separately)
+EVENT_COLUMNS = [
+    "id", "tenant_id", "source", "timestamp", "actor", "direction", "subject", "text", "thread_id",
+    "decision", "action_owner", "follow_up_required", "urgency_score", "sentiment", "raw_ref",
+    "created_at", "updated_at"
+]
+
+DETACHED_PARTITION = re.compile(r"^core_events_y(\d{4})m(\d{2})$")
+
+
+class ColdStorage(ABC):
+    """
+    Interface of a cold-storage backend holding archived events by month.
+
+    Backends store one batch of rows per month (each row has the EVENT_COLUMNS,
+    an "embedding" float32 array or None and a "topic_ids" list) and read back
+    the events of a time range as transient CoreEvent objects.
+    """
+
+    @abstractmethod
+    def write_month(self, month: date, batches: Iterable[List[Dict[str, Any]]]) -> int:
+        """Store a month of archived rows, replacing any earlier copy; returns rows written."""
+
+    @abstractmethod
+    def months(self) -> List[date]:
+        """Months held in cold storage."""
+
+    @abstractmethod
+    def read_events(self, start: datetime, end: datetime, tenant_id: str) -> List[CoreEvent]:
+        """Archived events of a tenant with start <= timestamp < end."""
+
+
+class ParquetColdStorage(ColdStorage):
+    """
+    Zstandard-compressed Parquet files partitioned by month.
+
+    Layout: <root>/year=YYYY/month=MM/core_events.parquet. Embeddings are a
+    fixed-size binary column (little-endian float32, or float16 when
+    EMBEDDING_STORAGE=halfvec) and topic assignments a list column.
+    """
+
+    FILENAME = "core_events.parquet"
+
+    def __init__(self, root: str | Path):
+        if pa is None:
+            raise RuntimeError("pyarrow is required for Parquet cold storage (pip install pyarrow)")
+
+        self.root = Path(root)
+        self.dtype = np.dtype("<f2") if settings.embedding_storage == "halfvec" else np.dtype("<f4")
+
+    def path(self, month: date) -> Path:
+        return self.root / f"year={month.year:04d}" / f"month={month.month:02d}" / self.FILENAME
+
+    def schema(self) -> "pa.Schema":
+        string_columns = [c for c in EVENT_COLUMNS if c not in (
+            "timestamp", "follow_up_required", "urgency_score", "created_at", "updated_at"
+        )]
+        fields = [pa.field(name, pa.string()) for name in string_columns] + [
+            pa.field("timestamp", pa.timestamp("us", tz="UTC")),
+            pa.field("follow_up_required", pa.bool_()),
+            pa.field("urgency_score", pa.int16()),
+            pa.field("created_at", pa.timestamp("us", tz="UTC")),
+            pa.field("updated_at", pa.timestamp("us", tz="UTC")),
+            pa.field("embedding", pa.binary(EMBEDDING_DIM * self.dtype.itemsize)),
+            pa.field("topic_ids", pa.list_(pa.string())),
+        ]
+        return pa.schema(fields, metadata={"embedding_dtype": self.dtype.str, "embedding_dim": str(EMBEDDING_DIM)})
+
+    def write_month(self, month: date, batches: Iterable[List[Dict[str, Any]]]) -> int:
+        path = self.path(month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".parquet.partial")
+        schema = self.schema()
+        rows = 0
+
+        with pq.ParquetWriter(partial, schema, compression="zstd") as writer:
+            for batch in batches:
+                records = [
+                    {
+                        **{name: row[name] for name in EVENT_COLUMNS},
+                        "embedding": None if row["embedding"] is None
+                        else np.asarray(row["embedding"], dtype=self.dtype).tobytes(),
+                        "topic_ids": row["topic_ids"]
+                    }
+                    for row in batch
+                ]
+                writer.write_table(pa.Table.from_pylist(records, schema=schema))
+                rows += len(records)
+
+        # The file only appears once it is complete
+        os.replace(partial, path)
+        return rows
+
+    def months(self) -> List[date]:
+        months = []
+        for path in self.root.glob(f"year=*/month=*/{self.FILENAME}"):
+            year = int(path.parent.parent.name.split("=")[1])
+            month = int(path.parent.name.split("=")[1])
+            months.append(date(year, month, 1))
+        return sorted(months)
+
+    def read_events(self, start: datetime, end: datetime, tenant_id: str) -> List[CoreEvent]:
+        start, end = _as_utc(start), _as_utc(end)
+        events = []
+
+        month = month_start(start.date())
+        while month < end.date():
+            path = self.path(month)
+            if path.exists():
+                table = pq.read_table(path, filters=[
+                    ("tenant_id", "=", tenant_id), ("timestamp", ">=", start), ("timestamp", "<", end)
+                ])
+                dtype = np.dtype(table.schema.metadata[b"embedding_dtype"].decode())
+                for row in table.to_pylist():
+                    events.append(_to_event(row, dtype))
+            month = add_months(month, 1)
+
+        return events
+
+
+COLD_STORAGE_BACKENDS: Dict[str, Type[ColdStorage]] = {"parquet": ParquetColdStorage}
+
+
+def register_cold_storage(name: str, backend: Type[ColdStorage]) -> None:
+    """Make a cold-storage backend selectable through COLD_STORAGE."""
+    COLD_STORAGE_BACKENDS[name] = backend
+
+
+def get_cold_storage() -> ColdStorage | None:
+    """
+    Get the configured cold-storage backend.
+
+    Returns:
+        Backend for cold_storage_path, or None when cold_storage is "none"
+
+    Raises:
+        ValueError: On an unknown backend name
+    """
+    if settings.cold_storage == "none":
+        return None
+
+    if settings.cold_storage not in COLD_STORAGE_BACKENDS:
+        raise ValueError(f"Unknown cold storage backend: {settings.cold_storage}")
+
+    return COLD_STORAGE_BACKENDS[settings.cold_storage](settings.cold_storage_path)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _to_event(row: Dict[str, Any], dtype: np.dtype) -> CoreEvent:
+    # Transient object: readable like a loaded event, never added to a session
+    embedding = None
+    if row["embedding"] is not None:
+        embedding = np.frombuffer(row["embedding"], dtype=dtype).astype(np.float32)
+
+    return CoreEvent(**{name: row[name] for name in EVENT_COLUMNS}, embedding=embedding)
+
+
+def is_archived(event: CoreEvent) -> bool:
+    """Whether an event was read from cold storage rather than the database."""
+    state = inspect(event, raiseerr=False)
+    return state is not None and state.transient
+
+
+def merge_hot_and_cold(hot: List[CoreEvent], cold: List[CoreEvent]) -> List[CoreEvent]:
+    """
+    Combine database and cold-storage events in timestamp order.
+
+    An event present in both (an export interrupted before its partition
+    was dropped) is taken from the database.
+
+    Args:
+        hot: Events loaded from core_events
+        cold: Events read from cold storage
+
+    Returns:
+        Events ordered by timestamp
+    """
+    hot_ids = {event.id for event in hot}
+    events = hot + [event for event in cold if event.id not in hot_ids]
+    return sorted(events, key=lambda event: _as_utc(event.timestamp))
+
+
+def load_events(db, start: datetime, end: datetime, tenant_id: str) -> List[CoreEvent]:
+    """
+    Load a tenant's events in a time range from the database and cold storage.
+
+    Args:
+        db: Database session
+        start: Range start (inclusive, naive UTC or aware)
+        end: Range end (exclusive)
+        tenant_id: Tenant
+
+    Returns:
+        Events ordered by timestamp; archived ones are transient CoreEvent objects
+    """
+    hot = db.query(CoreEvent).filter(
+        CoreEvent.tenant_id == tenant_id,
+        CoreEvent.timestamp >= start,
+        CoreEvent.timestamp < end
+    ).all()
+
+    storage = get_cold_storage()
+    if storage is None:
+        return hot
+
+    cold = storage.read_events(start, end, tenant_id)
+    if cold:
+        logger.info(f"Read {len(cold)} archived events from cold storage")
+
+    return merge_hot_and_cold(hot, cold)
+
+
+def list_detached_partitions(db) -> Dict[date, str]:
+    """
+    List core_events partitions detached into the archive schema and not yet exported.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary mapping month start to table name, in month order
+    """
+    names = db.execute(
+        text("SELECT table_name FROM information_schema.tables WHERE table_schema = :schema"),
+        {"schema": ARCHIVE_SCHEMA}
+    ).scalars()
+
+    partitions = {}
+    for name in names:
+        match = DETACHED_PARTITION.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+
+    return dict(sorted(partitions.items()))
+
+
+def _read_partition(name: str, mappings: str | None, batch_size: int) -> Iterable[List[Dict[str, Any]]]:
+    topic_ids = (
+        f"ARRAY(SELECT t.topic_id::text FROM {ARCHIVE_SCHEMA}.{mappings} t WHERE t.event_id = e.id)"
+        if mappings else "ARRAY[]::text[]"
+    )
+    query = text(
+        f"SELECT {', '.join('e.' + c for c in EVENT_COLUMNS)}, e.embedding::text AS embedding, "
+        f"{topic_ids} AS topic_ids FROM {ARCHIVE_SCHEMA}.{name} e ORDER BY e.timestamp"
+    )
+
+    # Server-side cursor so a month of events is never held in memory at once
+    with database.engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(query)
+        for partition in result.mappings().partitions():
+            yield [{**row, "embedding": from_db(row["embedding"])} for row in partition]
+
+
+def export_detached_partitions(storage: ColdStorage, batch_size: int = 5000) -> List[str]:
+    """
+    Write every detached partition to cold storage and drop it from the database.
+
+    Each partition is dropped only after its month was written completely, so an
+    interrupted export is simply repeated on the next run.
+
+    Args:
+        storage: Cold-storage backend
+        batch_size: Rows read and written per batch
+
+    Returns:
+        Names of the exported partitions
+    """
+    with get_db_context() as db:
+        detached = list_detached_partitions(db)
+
+    exported = []
+    for month, name in detached.items():
+        mappings = f"core_event_topics_y{month.year:04d}m{month.month:02d}"
+        with get_db_context() as db:
+            if db.execute(text("SELECT to_regclass(:name)"), {"name": f"{ARCHIVE_SCHEMA}.{mappings}"}).scalar() is None:
+                mappings = None
+
+        rows = storage.write_month(month, _read_partition(name, mappings, batch_size))
+
+        with get_db_context() as db:
+            db.execute(text(f"DROP TABLE {ARCHIVE_SCHEMA}.{name}"))
+            if mappings:
+                db.execute(text(f"DROP TABLE {ARCHIVE_SCHEMA}.{mappings}"))
+
+        logger.info(f"Exported {rows} events of {name} to cold storage")
+        exported.append(name)
+
+    return exported
+
+
+def archive_events(today: date | None = None, retention_months: int | None = None) -> Dict[str, List[str]]:
+    """
+    Move events older than the retention horizon from Postgres to cold storage.
+
+    Months past retention are detached (see src.partitions) and every detached
+    partition is then exported and dropped.
+
+    Args:
+        today: Reference day (defaults to today, UTC)
+        retention_months: Full months to keep in Postgres before the current one
+            (defaults to partition_retention_months; 0 only exports already detached months)
+
+    Returns:
+        Dictionary with the "detached" and "exported" partition names
+
+    Raises:
+        RuntimeError: If no cold storage is configured
+        ValueError: If retention is shorter than a weekly run's window
+    """
+    storage = get_cold_storage()
+    if storage is None:
+        raise RuntimeError("Set COLD_STORAGE (e.g. parquet) before archiving events")
+
+    today = today or datetime.utcnow().date()
+    retention_months = settings.partition_retention_months if retention_months is None else retention_months
+
+    if 0 < retention_months < MIN_RETENTION_MONTHS:
+        raise ValueError(f"Retention must be at least {MIN_RETENTION_MONTHS} months (or 0)")
+
+    detached = []
+    if retention_months:
+        with get_db_context() as db:
+            detached = archive_partitions(db, add_months(month_start(today), -retention_months))
+
+    return {"detached": detached, "exported": export_detached_partitions(storage)}
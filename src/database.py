@@ -1,28 +1,247 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict
+import logging
+import threading
+import time
 from src.config import get_settings
+from src.pool_metrics import InstrumentedQueuePool, instrument_engine
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Engine profiles; each reads db_<profile>_<option> from Settings
+ENGINE_PROFILES = ("api", "batch", "maintenance")
+
+
+def engine_profile(profile: str) -> Dict[str, Any]:
+    """
+    Pool options of an engine profile.
+
+    Args:
+        profile: "api" (request handlers), "batch" (weekly/daily/backfill runs)
+            or "maintenance" (partition and archive jobs)
+
+    Returns:
+        Dictionary with pool_size, max_overflow, pool_recycle, pool_timeout and
+        statement_timeout_ms
+
+    Raises:
+        ValueError: On an unknown profile
+    """
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown engine profile {profile!r} (expected one of {ENGINE_PROFILES})")
+
+    return {
+        "pool_size": getattr(settings, f"db_{profile}_pool_size"),
+        "max_overflow": getattr(settings, f"db_{profile}_max_overflow"),
+        "pool_recycle": getattr(settings, f"db_{profile}_pool_recycle_seconds"),
+        "pool_timeout": getattr(settings, f"db_{profile}_pool_timeout_seconds"),
+        "statement_timeout_ms": getattr(settings, f"db_{profile}_statement_timeout_ms")
+    }
+
+
+def create_profile_engine(
+    profile: str,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    replica: bool = False
+):
+    """
+    Create an instrumented psycopg2 engine for a profile.
+
+    Args:
+        profile: Engine profile name
+        pool_size: Override the profile's pool size
+        max_overflow: Override the profile's overflow
+        replica: Connect to database_replica_url instead of database_url
+
+    Returns:
+        SQLAlchemy engine (pool statistics registered under the profile name,
+        suffixed with "-replica" for the replica)
+    """
+    options = engine_profile(profile)
+    pool_size = options["pool_size"] if pool_size is None else pool_size
+    max_overflow = options["max_overflow"] if max_overflow is None else max_overflow
+
+    connect_args = {}
+    if options["statement_timeout_ms"]:
+        connect_args["options"] = f"-c statement_timeout={options['statement_timeout_ms']}"
+
+    new_engine = create_engine(
+        settings.database_replica_url if replica else settings.database_url,
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=options["pool_recycle"],
+        pool_timeout=options["pool_timeout"],
+        connect_args=connect_args
+    )
+    instrument_engine(new_engine, f"{profile}-replica" if replica else profile, pool_size, max_overflow)
+    return new_engine
+
 
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
-)
+engine = create_profile_engine(settings.db_profile)
 
-# Create session factory
+# Optional read replica for read-only workloads (see get_read_db_context)
+replica_engine = create_profile_engine(settings.db_profile, replica=True) if settings.database_replica_url else None
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine or engine)
 
 # Base class for models
 Base = declarative_base()
 
 
+def configure_engine(
+    profile: str | None = None,
+    pool_size: int | None = None,
+    max_overflow: int | None = None
+) -> None:
+    """
+    Replace the engine with one for another profile or pool size.
+
+    Called at startup by scripts (batch and maintenance profiles) and by
+    worker processes (e.g. the backfill pool) so the total number of
+    connections stays bounded. Connections inherited from a parent process
+    are dropped without being closed.
+
+    Args:
+        profile: Engine profile (defaults to db_profile)
+        pool_size: Persistent connections kept in the pool (defaults to the profile's)
+        max_overflow: Extra connections allowed beyond pool_size (defaults to the profile's)
+    """
+    global engine, replica_engine
+
+    engine.dispose(close=False)
+    engine = create_profile_engine(profile or settings.db_profile, pool_size, max_overflow)
+    SessionLocal.configure(bind=engine)
+
+    if replica_engine is not None:
+        replica_engine.dispose(close=False)
+        replica_engine = create_profile_engine(profile or settings.db_profile, pool_size, max_overflow, replica=True)
+    ReadSessionLocal.configure(bind=replica_engine or engine)
+
+
+# Commit time of the last transaction the replica has replayed (now() when the
+# URL points at a server that is not a standby). Equal receive and replay LSNs
+# only mean the replica has applied what it received, not that it has received
+# everything, so that is never taken as "no lag".
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN pg_is_in_recovery() THEN pg_last_xact_replay_timestamp() ELSE now() END"
+)
+
+
+class ReplicaLagCache:
+    """Replica replay position, measured at most once per replica_lag_check_seconds."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checked_at = float("-inf")
+        self.replayed_at: datetime | None = None
+
+    def due(self) -> bool:
+        """Whether the cached measurement is older than replica_lag_check_seconds."""
+        return time.monotonic() - self.checked_at >= settings.replica_lag_check_seconds
+
+    def record(self, replayed_at: datetime | None, error: Exception | None = None) -> None:
+        """Store a measurement (None with the error if the replica could not be reached)."""
+        if error is not None:
+            logger.warning(f"Replica lag check failed, reading from the primary: {error}")
+        self.replayed_at = replayed_at
+        self.checked_at = time.monotonic()
+
+    def get(self, measure) -> datetime | None:
+        """
+        Commit time of the last replayed transaction, or None if unknown.
+
+        Caching the replay time rather than a lag keeps the staleness honest:
+        the lag derived from it grows while the measurement ages.
+
+        Args:
+            measure: Callable returning the replay time (raises when the replica is down)
+        """
+        with self._lock:
+            if self.due():
+                try:
+                    self.record(measure())
+                except Exception as e:
+                    self.record(None, e)
+            return self.replayed_at
+
+
+def replica_is_fresh(
+    replayed_at: datetime | None,
+    required_as_of: datetime | None = None,
+    max_lag_seconds: float | None = None,
+    now: datetime | None = None
+) -> bool:
+    """
+    Decide whether a replica can serve a read.
+
+    WAL is replayed in commit order, so once a transaction committed at or
+    after required_as_of has been replayed, everything committed before it is
+    visible. A replica of an idle primary has nothing new to replay and reads
+    as behind; that only costs a fallback to the primary.
+
+    This is for time-bounded reads. Rows the caller has just written itself
+    must be read from the primary.
+
+    Args:
+        replayed_at: Commit time of the last replayed transaction (None = unknown
+            or unreachable)
+        required_as_of: The read needs every write committed before this time
+            (e.g. the end of the window being computed)
+        max_lag_seconds: Upper bound on lag regardless of the window
+        now: Current time (defaults to now, UTC)
+
+    Returns:
+        True to read from the replica, False to fall back to the primary
+    """
+    if replayed_at is None:
+        return False
+    if replayed_at.tzinfo is None:
+        replayed_at = replayed_at.replace(tzinfo=timezone.utc)
+
+    now = now or datetime.now(timezone.utc)
+    if max_lag_seconds is not None and (now - replayed_at).total_seconds() > max_lag_seconds:
+        return False
+    if required_as_of is not None:
+        if required_as_of.tzinfo is None:
+            required_as_of = required_as_of.replace(tzinfo=timezone.utc)
+        if replayed_at < required_as_of:
+            return False
+    return True
+
+
+_replica_lag = ReplicaLagCache()
+
+
+def _measure_replica_replay() -> datetime | None:
+    with replica_engine.connect() as connection:
+        return connection.execute(REPLICA_LAG_SQL).scalar()
+
+
+def use_replica(required_as_of: datetime | None = None, max_lag_seconds: float | None = None) -> bool:
+    """Whether a read-only workload should go to the replica (see replica_is_fresh)."""
+    if replica_engine is None:
+        return False
+
+    replayed_at = _replica_lag.get(_measure_replica_replay)
+    fresh = replica_is_fresh(replayed_at, required_as_of, max_lag_seconds)
+    if not fresh and replayed_at is not None:
+        logger.info(f"Replica has replayed up to {replayed_at.isoformat()}, reading from the primary")
+    return fresh
+
+
 def get_db() -> Session:
     """Dependency for FastAPI endpoints to get database session."""
     db = SessionLocal()
@@ -32,10 +251,62 @@ def get_db() -> Session:
         db.close()
 
 
+def get_read_db() -> Session:
+    """Dependency for read-only FastAPI endpoints (replica within replica_max_lag_seconds)."""
+    factory = ReadSessionLocal if use_replica(max_lag_seconds=settings.replica_max_lag_seconds) else SessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 @contextmanager
-def get_db_context():
-    """Context manager for database sessions in scripts."""
-    db = SessionLocal()
+def get_read_db_context(
+    required_as_of: datetime | None = None,
+    max_lag_seconds: float | None = None,
+    primary: Session | None = None
+):
+    """
+    Context manager for read-only sessions, on the replica when it is fresh enough.
+
+    Falls back to the primary when no replica is configured, it cannot be
+    reached or it has not replayed writes up to required_as_of. Objects loaded
+    from the replica are detached afterwards; write changes through a primary
+    session. Do not use this for rows the caller has just committed: the
+    replica may not have received them yet.
+
+    Args:
+        required_as_of: Writes committed before this time must be visible
+        max_lag_seconds: Maximum acceptable replica lag
+        primary: Session to use (and leave open) on fallback instead of a new one
+    """
+    if not use_replica(required_as_of, max_lag_seconds):
+        if primary is not None:
+            yield primary
+            return
+        factory = SessionLocal
+    else:
+        factory = ReadSessionLocal
+
+    # close() ends the transaction without expiring loaded objects, unlike rollback()
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@contextmanager
+def get_db_context(expire_on_commit: bool = True):
+    """
+    Context manager for database sessions in scripts.
+
+    Args:
+        expire_on_commit: Expire loaded instances on commit (disable when
+            loaded objects are read after intermediate commits)
+    """
+    db = SessionLocal(expire_on_commit=expire_on_commit)
     try:
         yield db
         db.commit()
@@ -0,0 +1,114 @@
+"""Async database engine and session management (asyncpg) for the API."""
+
+import logging
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.config import get_settings
+from src.database import REPLICA_LAG_SQL, ReplicaLagCache, engine_profile, replica_is_fresh
+from src.pool_metrics import InstrumentedAsyncQueuePool, instrument_engine
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def async_database_url(url: str) -> str:
+    """
+    Turn a sync Postgres URL into its asyncpg equivalent.
+
+    Args:
+        url: URL such as postgresql://... or postgresql+psycopg2://...
+
+    Returns:
+        URL using the postgresql+asyncpg driver
+    """
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+def create_async_profile_engine(profile: str = "api", replica: bool = False):
+    """
+    Create an instrumented asyncpg engine for a profile.
+
+    Args:
+        profile: Engine profile name (see src.database.engine_profile)
+        replica: Connect to database_replica_url instead of the primary
+
+    Returns:
+        AsyncEngine (pool statistics registered as "<profile>-async", or
+        "<profile>-async-replica")
+    """
+    options = engine_profile(profile)
+
+    server_settings = {}
+    if options["statement_timeout_ms"]:
+        server_settings["statement_timeout"] = str(options["statement_timeout_ms"])
+
+    if replica:
+        url = async_database_url(settings.database_replica_url)
+    else:
+        url = settings.async_database_url or async_database_url(settings.database_url)
+
+    new_engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_pre_ping=True,
+        pool_size=options["pool_size"],
+        max_overflow=options["max_overflow"],
+        pool_recycle=options["pool_recycle"],
+        pool_timeout=options["pool_timeout"],
+        connect_args={"server_settings": server_settings}
+    )
+    name = f"{profile}-async-replica" if replica else f"{profile}-async"
+    instrument_engine(new_engine.sync_engine, name, options["pool_size"], options["max_overflow"])
+    return new_engine
+
+
+# Create async SQLAlchemy engine (used by the API's async handlers)
+async_engine = create_async_profile_engine("api")
+
+# Create session factory; loaded objects stay readable after commit without a new round trip
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+# Optional read replica for read-only endpoints (see get_async_read_db)
+async_replica_engine = create_async_profile_engine("api", replica=True) if settings.database_replica_url else None
+AsyncReadSessionLocal = async_sessionmaker(
+    async_replica_engine or async_engine, expire_on_commit=False, autoflush=False
+)
+
+_replica_lag = ReplicaLagCache()
+
+
+async def use_async_replica(max_lag_seconds: float | None = None) -> bool:
+    """
+    Whether a read-only endpoint should read from the replica.
+
+    Args:
+        max_lag_seconds: Maximum acceptable lag (defaults to replica_max_lag_seconds)
+
+    Returns:
+        False when no replica is configured, it is unreachable or too far behind
+    """
+    if async_replica_engine is None:
+        return False
+
+    if _replica_lag.due():
+        try:
+            async with async_replica_engine.connect() as connection:
+                _replica_lag.record((await connection.execute(REPLICA_LAG_SQL)).scalar())
+        except Exception as e:
+            _replica_lag.record(None, e)
+
+    max_lag_seconds = settings.replica_max_lag_seconds if max_lag_seconds is None else max_lag_seconds
+    return replica_is_fresh(_replica_lag.replayed_at, max_lag_seconds=max_lag_seconds)
+
+
+async def get_async_db() -> AsyncSession:
+    """Dependency for async FastAPI endpoints to get database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncSession:
+    """Dependency for async read-only endpoints (replica within replica_max_lag_seconds)."""
+    factory = AsyncReadSessionLocal if await use_async_replica() else AsyncSessionLocal
+    async with factory() as db:
+        yield db
@@ -0,0 +1,215 @@
+"""Historical backfill of weekly briefs over a date range."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+from src.config import get_settings
+from src.database import configure_engine, get_db_context
+from src.insight.pipeline import PipelineRun
+from src.insight.weekly import compute_windows, run_guarded, run_weekly_pipeline
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Topic matching compares clusters against centroids updated by earlier weeks,
+# so these stages run one week at a time in chronological order (in daily mode
+# the rollups stage assigns topics day by day)
+TOPIC_STAGES = {"batch": ["topics"], "daily": ["rollups"]}
+
+
+def backfill_windows(start: date, end: date) -> List[Dict[str, datetime]]:
+    """
+    Compute the weekly windows covering a date range.
+
+    Weeks end on the same weekday as the range end and step back seven days
+    at a time; only weeks that start on or after the range start are kept.
+
+    Args:
+        start: First day to cover
+        end: Day the last week ends on (exclusive, like a weekly run on that day)
+
+    Returns:
+        Windows from compute_windows in chronological order
+    """
+    windows = []
+    week_end = datetime(end.year, end.month, end.day)
+    earliest = datetime(start.year, start.month, start.day)
+
+    while week_end - timedelta(days=7) >= earliest:
+        windows.append(compute_windows(week_end))
+        week_end -= timedelta(days=7)
+
+    return list(reversed(windows))
+
+
+def summarize_run(windows: Dict[str, datetime], run: PipelineRun | None, error: str | None = None) -> Dict[str, Any]:
+    """
+    Summarize one week's run in a form that can cross process boundaries.
+
+    Args:
+        windows: Windows of the week
+        run: Pipeline run (None if it raised)
+        error: Error message when the run failed
+
+    Returns:
+        Dictionary with week_start, status, wall_seconds, restored and detail
+    """
+    if run is None:
+        status, detail = "failed", error
+    elif run.stopped:
+        status, detail = "skipped", run.stopped_reason
+    else:
+        status, detail = "completed", None
+
+    return {
+        "week_start": windows["week_start"].date().isoformat(),
+        "status": status,
+        "wall_seconds": run.wall_seconds if run else None,
+        "restored": run.restored if run else [],
+        "detail": detail
+    }
+
+
+def assign_topics(
+    windows: Dict[str, datetime],
+    resume: bool = False,
+    tenant_id: str | None = None
+) -> Dict[str, Any]:
+    """
+    Run the stages up to topic assignment for one week and checkpoint them.
+
+    Args:
+        windows: Windows of the week
+        resume: Keep checkpoints from an earlier backfill instead of starting fresh
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        Run summary from summarize_run
+    """
+    def execute() -> PipelineRun:
+        with get_db_context(expire_on_commit=False) as db:
+            return asyncio.run(run_weekly_pipeline(
+                db, windows, resume=resume, targets=TOPIC_STAGES[settings.processing_mode], tenant_id=tenant_id
+            ))
+
+    try:
+        return summarize_run(windows, run_guarded(windows, execute, on_conflict="exit", tenant_id=tenant_id))
+    except Exception as e:
+        logger.error(f"Topic assignment failed for week {windows['week_start'].date()}: {e}", exc_info=True)
+        return summarize_run(windows, None, str(e))
+
+
+def init_worker(pool_size: int, max_overflow: int) -> None:
+    """Process pool initializer: configure logging and a bounded connection pool."""
+    logging.basicConfig(
+        level=settings.log_level,
+        format='%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    configure_engine(profile="batch", pool_size=pool_size, max_overflow=max_overflow)
+
+
+def complete_week(
+    windows: Dict[str, datetime],
+    refresh_llm: bool = False,
+    send_slack: bool = False,
+    tenant_id: str | None = None
+) -> Dict[str, Any]:
+    """
+    Run the remaining stages (metrics, rules, LLM, reports, storage) for one week.
+
+    Topic assignment is restored from the checkpoint written by assign_topics.
+
+    Args:
+        windows: Windows of the week
+        refresh_llm: Bypass the LLM response cache
+        send_slack: Deliver the brief to Slack
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        Run summary from summarize_run
+    """
+    def execute() -> PipelineRun:
+        with get_db_context(expire_on_commit=False) as db:
+            return asyncio.run(run_weekly_pipeline(
+                db, windows, refresh_llm, resume=True, send_slack=send_slack, tenant_id=tenant_id
+            ))
+
+    try:
+        return summarize_run(windows, run_guarded(windows, execute, on_conflict="exit", tenant_id=tenant_id))
+    except Exception as e:
+        logger.error(f"Backfill failed for week {windows['week_start'].date()}: {e}", exc_info=True)
+        return summarize_run(windows, None, str(e))
+
+
+def run_backfill(
+    start: date,
+    end: date,
+    workers: int | None = None,
+    refresh_llm: bool = False,
+    send_slack: bool = False,
+    resume: bool = False,
+    tenant_id: str | None = None
+) -> List[Dict[str, Any]]:
+    """
+    Generate a tenant's weekly briefs for every week in a date range.
+
+    Topic assignment runs sequentially in chronological order in this process.
+    Weeks locked by another run (e.g. the weekly cron) are skipped.
+    The remaining per-week work is independent and runs in a process pool;
+    one week holds the run lock and pipeline session for its whole run plus
+    short heartbeat and checkpoint sessions, which may overlap when stages
+    finish together. Each worker's pool is sized for that
+    (backfill_db_pool_size plus backfill_db_max_overflow), so the total stays
+    at workers * (backfill_db_pool_size + backfill_db_max_overflow) plus this
+    process's pool.
+
+    Args:
+        start: First day to cover
+        end: Day the last week ends on
+        workers: Worker processes (defaults to backfill_workers)
+        refresh_llm: Bypass the LLM response cache
+        send_slack: Deliver each brief to Slack (off by default for history)
+        resume: Keep checkpoints from an earlier, interrupted backfill
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        Per-week summaries in chronological order
+    """
+    windows_list = backfill_windows(start, end)
+    workers = workers or settings.backfill_workers
+    tenant_id = tenant_id or settings.default_tenant_id
+    logger.info(
+        f"Backfilling {len(windows_list)} weeks of {tenant_id} from {start} to {end} with {workers} workers"
+    )
+
+    # Phase 1: ordered topic assignment
+    summaries = {}
+    pending = []
+    for windows in windows_list:
+        summary = assign_topics(windows, resume, tenant_id)
+        if summary["status"] == "completed":
+            pending.append(windows)
+        else:
+            summaries[summary["week_start"]] = summary
+        logger.info(f"Topics for week {summary['week_start']}: {summary['status']}")
+
+    # Phase 2: independent weeks in parallel
+    if pending:
+        # spawn keeps workers free of the parent's DB connections and model threads
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(settings.backfill_db_pool_size, settings.backfill_db_max_overflow)
+        ) as pool:
+            futures = [pool.submit(complete_week, windows, refresh_llm, send_slack, tenant_id) for windows in pending]
+            for future in as_completed(futures):
+                summary = future.result()
+                summaries[summary["week_start"]] = summary
+                logger.info(f"Week {summary['week_start']}: {summary['status']}")
+
+    return [summaries[key] for key in sorted(summaries)]
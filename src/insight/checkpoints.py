@@ -0,0 +1,58 @@
+"""Database-backed checkpoint store for resumable pipeline runs."""
+
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List
+from sqlalchemy.dialects.postgresql import insert
+
+from src.config import get_settings
+from src.database import get_db_context
+from src.models import OutPipelineCheckpoint
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class CheckpointStore:
+    """Stores stage outputs in out_pipeline_checkpoints keyed by tenant and week."""
+
+    def __init__(self, week_start: date, tenant_id: str | None = None):
+        self.week_start = week_start
+        self.tenant_id = tenant_id or settings.default_tenant_id
+
+    def load_all(self) -> Dict[str, Any]:
+        """Load all checkpoints for the week as {stage: payload}."""
+        with get_db_context() as db:
+            rows = db.query(OutPipelineCheckpoint).filter(
+                OutPipelineCheckpoint.tenant_id == self.tenant_id,
+                OutPipelineCheckpoint.week_start == self.week_start
+            ).all()
+            return {row.stage: row.payload for row in rows}
+
+    def save(self, stage: str, payload: Any) -> None:
+        """Insert or replace the checkpoint for a stage."""
+        statement = insert(OutPipelineCheckpoint).values(
+            tenant_id=self.tenant_id,
+            week_start=self.week_start,
+            stage=stage,
+            payload=payload,
+            created_at=datetime.utcnow()
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["tenant_id", "week_start", "stage"],
+            set_={"payload": statement.excluded.payload, "created_at": statement.excluded.created_at}
+        )
+
+        with get_db_context() as db:
+            db.execute(statement)
+
+        logger.debug(f"Saved checkpoint {self.tenant_id}/{self.week_start}/{stage}")
+
+    def delete(self, stages: List[str]) -> None:
+        """Delete checkpoints for the given stages."""
+        with get_db_context() as db:
+            db.query(OutPipelineCheckpoint).filter(
+                OutPipelineCheckpoint.tenant_id == self.tenant_id,
+                OutPipelineCheckpoint.week_start == self.week_start,
+                OutPipelineCheckpoint.stage.in_(stages)
+            ).delete(synchronize_session=False)
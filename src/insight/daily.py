@@ -0,0 +1,292 @@
+"""Daily incremental processing: per-day topic assignment, rollups and rules."""
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+from uuid import UUID
+import numpy as np
+from sqlalchemy.dialects.postgresql import insert
+
+from src.archive import load_events as load_hot_and_cold_events
+from src.config import get_settings
+from src.database import get_db_context, get_read_db_context
+from src.models import CoreEvent, CoreTopic, OutDailyRollup
+from src.insight.pipeline import PipelineRun, Stage, run_pipeline
+from src.insight.run_guard import RunGuard, run_exclusive
+from src.insight.tenants import run_for_tenants
+from src.insight.modules.embeddings import generate_embeddings_for_events, get_embedding_model
+from src.insight.modules.clustering import cluster_events, process_clusters_to_topics
+from src.insight.modules.metrics import (
+    compute_rollup, merge_rollups, metrics_from_rollup, compute_deltas,
+    compute_topic_rollups, merge_topic_rollups, topic_metrics_from_rollups
+)
+from src.insight.modules.rules import apply_rules
+from src.telemetry import record_pipeline_run
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def days_between(start: date, end: date) -> List[date]:
+    """Days from start (inclusive) to end (exclusive)."""
+    return [start + timedelta(days=i) for i in range((end - start).days)]
+
+
+def load_rollups(db, start: date, end: date, tenant_id: str | None = None) -> Dict[date, Dict[str, Any]]:
+    """
+    Load stored daily rollups for a range of days.
+
+    Args:
+        db: Database session
+        start: First day (inclusive)
+        end: Last day (exclusive)
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        Dictionary mapping day to {"metrics", "topics", "findings", "topics_assigned"}
+    """
+    rows = db.query(OutDailyRollup).filter(
+        OutDailyRollup.tenant_id == (tenant_id or settings.default_tenant_id),
+        OutDailyRollup.day >= start,
+        OutDailyRollup.day < end
+    ).all()
+
+    return {
+        row.day: {
+            "metrics": row.metrics,
+            "topics": row.topics,
+            "findings": row.findings,
+            "topics_assigned": row.topics_assigned
+        }
+        for row in rows
+    }
+
+
+def build_daily_stages(
+    db,
+    day: date,
+    assign_topics: bool = True,
+    tenant_id: str | None = None
+) -> List[Stage]:
+    """
+    Build the daily pipeline for one day of a tenant's events.
+
+    With assign_topics the day's events are embedded, clustered and matched
+    to persistent topics, and rules are evaluated for the trailing seven days.
+    Without it only the metrics rollup is stored (used for baseline-only days).
+
+    Args:
+        db: Database session
+        day: Day to process (UTC)
+        assign_topics: Run topic assignment and rules
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        List of pipeline stages
+    """
+    tenant_id = tenant_id or settings.default_tenant_id
+    day_start = datetime(day.year, day.month, day.day)
+    day_end = day_start + timedelta(days=1)
+
+    def load_events(results: Dict[str, Any]) -> List[CoreEvent]:
+        with get_read_db_context(required_as_of=day_end, primary=db) as read_db:
+            events = load_hot_and_cold_events(read_db, day_start, day_end, tenant_id)
+        logger.info(f"Loaded {len(events)} events for {tenant_id}/{day}")
+        return events
+
+    def embeddings(results: Dict[str, Any]) -> int:
+        return generate_embeddings_for_events(db, results["load_events"])
+
+    def cluster(results: Dict[str, Any]) -> np.ndarray:
+        events = results["load_events"]
+        return cluster_events(np.array([event.embedding for event in events]))
+
+    def topics(results: Dict[str, Any]) -> Dict[str, UUID]:
+        return process_clusters_to_topics(results["load_events"], results["cluster"], db, tenant_id)
+
+    def rollup(results: Dict[str, Any]) -> Dict[str, Any]:
+        return compute_rollup(results["load_events"])
+
+    def topic_rollups(results: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        event_topic_map = results["topics"]
+        topic_ids = set(event_topic_map.values())
+        created_at = {}
+        if topic_ids:
+            created_at = {
+                str(topic_id): created
+                for topic_id, created in db.query(CoreTopic.topic_id, CoreTopic.created_at).filter(
+                    CoreTopic.topic_id.in_(topic_ids)
+                )
+            }
+        return compute_topic_rollups(results["load_events"], event_topic_map, created_at)
+
+    # Rules see the trailing seven days (this day plus the six before) against the 28 before that
+    def rules(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        stored = load_rollups(db, day - timedelta(days=34), day, tenant_id)
+        window_days = [day - timedelta(days=i) for i in range(1, 7)]
+        baseline_days = [day - timedelta(days=i) for i in range(7, 35)]
+
+        week = merge_rollups([results["rollup"]] + [stored[d]["metrics"] for d in window_days if d in stored])
+        baseline = merge_rollups([stored[d]["metrics"] for d in baseline_days if d in stored])
+        week_topics = merge_topic_rollups(
+            [results["topic_rollups"]] + [stored[d]["topics"] for d in window_days if d in stored]
+        )
+
+        week_metrics = metrics_from_rollup(week)
+        baseline_metrics = metrics_from_rollup(baseline)
+        findings = apply_rules(
+            week_metrics,
+            baseline_metrics,
+            compute_deltas(week_metrics, baseline_metrics),
+            topic_metrics_from_rollups(week_topics, as_of=day_end)
+        )
+
+        for finding in findings:
+            logger.info(f"  - [{finding.severity}] {finding.finding_type}: {finding.description}")
+
+        return [f.to_dict() for f in findings]
+
+    def store(results: Dict[str, Any]) -> bool:
+        values = {
+            "tenant_id": tenant_id,
+            "day": day,
+            "metrics": results["rollup"],
+            "topics": results.get("topic_rollups", {}),
+            "findings": results.get("rules", []),
+            "topics_assigned": assign_topics,
+            "updated_at": datetime.utcnow()
+        }
+        statement = insert(OutDailyRollup).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=["tenant_id", "day"],
+            set_={key: statement.excluded[key] for key in values if key not in ("tenant_id", "day")}
+        )
+
+        db.execute(statement)
+        db.commit()
+        return True
+
+    if not assign_topics:
+        return [
+            Stage("load_events", load_events, resource="db", rows=len),
+            Stage("rollup", rollup, deps=("load_events",)),
+            Stage("store", store, deps=("rollup",), resource="db"),
+        ]
+
+    return [
+        Stage("load_events", load_events, resource="db", rows=len),
+        Stage("embeddings", embeddings, deps=("load_events",), resource="db", rows=lambda count: count),
+        Stage("cluster", cluster, deps=("load_events", "embeddings"), rows=len),
+        Stage("topics", topics, deps=("load_events", "cluster"), resource="db", rows=len),
+        Stage("rollup", rollup, deps=("load_events",)),
+        Stage("topic_rollups", topic_rollups, deps=("load_events", "topics"), resource="db", rows=len),
+        Stage("rules", rules, deps=("rollup", "topic_rollups"), resource="db", rows=len),
+        Stage("store", store, deps=("rollup", "topic_rollups", "rules"), resource="db"),
+    ]
+
+
+def run_daily_processing(
+    day: date | None = None,
+    assign_topics: bool = True,
+    on_conflict: str | None = None,
+    tenant_id: str | None = None
+) -> PipelineRun:
+    """
+    Process one day of a tenant's events into a stored daily rollup.
+
+    Args:
+        day: Day to process (defaults to yesterday, UTC)
+        assign_topics: Run topic assignment and rules (False stores metrics only)
+        on_conflict: "exit" or "wait" when another run holds the day
+            (defaults to run_lock_on_conflict)
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        PipelineRun with stage results and timings
+    """
+    day = day or (datetime.utcnow().date() - timedelta(days=1))
+    tenant_id = tenant_id or settings.default_tenant_id
+    logger.info(f"Daily processing for {tenant_id}/{day} ({'full' if assign_topics else 'metrics only'})")
+
+    def execute() -> PipelineRun:
+        with get_db_context(expire_on_commit=False) as db:
+            run = asyncio.run(run_pipeline(build_daily_stages(db, day, assign_topics, tenant_id)))
+        record_pipeline_run(run, "daily", tenant_id)
+        return run
+
+    return run_exclusive(RunGuard(day, kind="daily", tenant_id=tenant_id), execute, on_conflict)
+
+
+def run_daily_for_tenants(
+    tenants: List[str],
+    day: date | None = None,
+    on_conflict: str | None = None,
+    concurrency: int | None = None
+) -> Dict[str, PipelineRun | Exception]:
+    """
+    Run daily processing for several tenants in one process.
+
+    Args:
+        tenants: Tenant IDs
+        day: Day to process (defaults to yesterday, UTC)
+        on_conflict: "exit" or "wait" when another run holds a tenant's day
+        concurrency: Tenants processed at the same time (defaults to tenant_concurrency)
+
+    Returns:
+        Dictionary mapping tenant ID to its PipelineRun or the exception it raised
+    """
+    if len(tenants) > 1:
+        # Load the shared model once instead of racing to load it per tenant
+        get_embedding_model()
+
+    return run_for_tenants(
+        lambda tenant_id: run_daily_processing(day, on_conflict=on_conflict, tenant_id=tenant_id),
+        tenants,
+        concurrency
+    )
+
+
+def ensure_daily_rollups(
+    start: date,
+    end: date,
+    topics_from: date,
+    tenant_id: str | None = None
+) -> Dict[date, Dict[str, Any]]:
+    """
+    Make sure every day in a range has a rollup, processing missing days, and load them.
+
+    Days before topics_from only need metrics (they are baseline days); days
+    from topics_from on also need topic assignment. Missing days are processed
+    in chronological order so topic matching sees earlier days first.
+
+    Args:
+        start: First day (inclusive)
+        end: Last day (exclusive)
+        topics_from: First day that needs topic assignment
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        Dictionary mapping day to its rollup
+    """
+    with get_db_context() as db:
+        stored = load_rollups(db, start, end, tenant_id)
+
+    missing = [
+        day for day in days_between(start, end)
+        if day not in stored or (day >= topics_from and not stored[day]["topics_assigned"])
+    ]
+
+    if missing:
+        logger.info(f"Catching up {len(missing)} daily rollups between {start} and {end} ({tenant_id or settings.default_tenant_id})")
+
+    for day in missing:
+        run = run_daily_processing(day, assign_topics=day >= topics_from, on_conflict="wait", tenant_id=tenant_id)
+        if run.stopped:
+            raise RuntimeError(f"Daily processing for {day} did not complete: {run.stopped_reason}")
+
+    if not missing:
+        return stored
+
+    with get_db_context() as db:
+        return load_rollups(db, start, end, tenant_id)
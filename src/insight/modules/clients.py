@@ -0,0 +1,111 @@
+"""Shared, lazily initialized HTTP and SDK clients for external providers."""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+from functools import lru_cache
+import httpx
+from openai import OpenAI, AsyncOpenAI
+from slack_sdk import WebClient
+
+from src.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Async clients are bound to the event loop they were created on
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_async_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+
+
+def http2_available() -> bool:
+    """Check whether HTTP/2 is enabled and the h2 package is installed."""
+    return settings.http2_enabled and importlib.util.find_spec("h2") is not None
+
+
+def _client_options() -> dict:
+    return {
+        "timeout": httpx.Timeout(settings.http_timeout_seconds),
+        "limits": httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds
+        ),
+        "http2": http2_available()
+    }
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Get shared keep-alive HTTP client."""
+    options = _client_options()
+    logger.info(f"Creating shared HTTP client (http2={options['http2']})")
+    return httpx.Client(**options)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get shared keep-alive async HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(**_client_options())
+        _async_http_clients[loop] = client
+
+    return client
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Get shared OpenAI client backed by the shared HTTP connection pool."""
+    # Retries are handled by the resilience layer, not the SDK
+    return OpenAI(
+        api_key=api_key,
+        base_url=settings.openai_base_url,
+        http_client=get_http_client(),
+        max_retries=0
+    )
+
+
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get shared async OpenAI client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    clients = _async_openai_clients.setdefault(loop, {})
+
+    if api_key not in clients:
+        clients[api_key] = AsyncOpenAI(
+            api_key=api_key,
+            base_url=settings.openai_base_url,
+            http_client=get_async_http_client(),
+            max_retries=0
+        )
+
+    return clients[api_key]
+
+
+@lru_cache(maxsize=None)
+def get_slack_client(token: str) -> WebClient:
+    """Get shared Slack client for a bot token."""
+    # No SDK-level retries: call_with_retry decides what is safe to repeat
+    return WebClient(token=token, retry_handlers=[])
+
+
+def close_clients() -> None:
+    """Close pooled sync clients and reset the registry."""
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
+
+    get_http_client.cache_clear()
+    get_openai_client.cache_clear()
+    get_slack_client.cache_clear()
+
+
+async def close_async_clients() -> None:
+    """Close pooled async clients for the running event loop."""
+    loop = asyncio.get_running_loop()
+    _async_openai_clients.pop(loop, None)
+
+    client = _async_http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
@@ -3,10 +3,13 @@
 import numpy as np
 import hdbscan
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from typing import List, Dict, Tuple
 from uuid import UUID
 import logging
+from datetime import datetime, timezone
 
+from src.archive import is_archived
 from src.models import CoreEvent, CoreTopic, CoreEventTopic
 from src.insight.modules.embeddings import cosine_similarity, compute_centroid, rolling_average_update
 from src.config import get_settings
@@ -15,6 +18,16 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def cluster_time_range(cluster_events: List[CoreEvent]) -> Tuple[datetime, datetime]:
+    """Earliest and latest event timestamp of a cluster."""
+    timestamps = [event.timestamp for event in cluster_events]
+    return min(timestamps, key=_as_utc), max(timestamps, key=_as_utc)
+
+
 def cluster_events(embeddings: np.ndarray, min_cluster_size: int = None) -> np.ndarray:
     """
     Cluster embeddings using HDBSCAN.
@@ -51,7 +64,8 @@ def cluster_events(embeddings: np.ndarray, min_cluster_size: int = None) -> np.n
 def match_to_existing_topic(
     embedding: np.ndarray,
     db: Session,
-    threshold: float = None
+    threshold: float = None,
+    tenant_id: str | None = None
 ) -> Tuple[CoreTopic | None, float]:
     """
     Find existing topic that matches embedding above threshold.
@@ -60,6 +74,7 @@ def match_to_existing_topic(
         embedding: Event embedding to match
         db: Database session
         threshold: Similarity threshold (defaults to config)
+        tenant_id: Only match this tenant's topics (defaults to default_tenant_id)
 
     Returns:
         (Matching topic or None, best similarity score)
@@ -67,7 +82,9 @@ def match_to_existing_topic(
     if threshold is None:
         threshold = settings.topic_similarity_threshold
 
-    topics = db.query(CoreTopic).all()
+    topics = db.query(CoreTopic).filter(
+        CoreTopic.tenant_id == (tenant_id or settings.default_tenant_id)
+    ).all()
 
     if not topics:
         return None, 0.0
@@ -92,7 +109,8 @@ def match_to_existing_topic(
 def process_clusters_to_topics(
     events: List[CoreEvent],
     labels: np.ndarray,
-    db: Session
+    db: Session,
+    tenant_id: str | None = None
 ) -> Dict[str, UUID]:
     """
     Process cluster labels and map events to topics.
@@ -101,10 +119,12 @@ def process_clusters_to_topics(
         events: List of events (must have embeddings)
         labels: Cluster labels from HDBSCAN
         db: Database session
+        tenant_id: Tenant owning the events and topics (defaults to default_tenant_id)
 
     Returns:
         Dictionary mapping event_id to topic_id
     """
+    tenant_id = tenant_id or settings.default_tenant_id
     event_topic_map = {}
 
     # Group events by cluster
@@ -126,7 +146,7 @@ def process_clusters_to_topics(
         cluster_centroid = compute_centroid(embeddings)
 
         # Try to match to existing topic
-        matched_topic, similarity = match_to_existing_topic(cluster_centroid, db)
+        matched_topic, similarity = match_to_existing_topic(cluster_centroid, db, tenant_id=tenant_id)
 
         if matched_topic:
             # Update existing topic with rolling average
@@ -140,17 +160,27 @@ def process_clusters_to_topics(
 
             matched_topic.centroid = new_centroid.tolist()
             matched_topic.n_points += len(cluster_events)
-            matched_topic.last_seen_at = max(e.timestamp for e in cluster_events)
+
+            # Weeks may be processed out of order (backfill), so only widen the seen range
+            first_seen, last_seen = cluster_time_range(cluster_events)
+            if matched_topic.created_at is None or _as_utc(first_seen) < _as_utc(matched_topic.created_at):
+                matched_topic.created_at = first_seen
+            if matched_topic.last_seen_at is None or _as_utc(last_seen) > _as_utc(matched_topic.last_seen_at):
+                matched_topic.last_seen_at = last_seen
 
             topic_id = matched_topic.topic_id
         else:
             # Create new topic
             logger.info(f"Cluster {cluster_id} creating new topic")
 
+            # Dated by its events rather than the wall clock, so backfilled weeks get historical topics
+            first_seen, last_seen = cluster_time_range(cluster_events)
             new_topic = CoreTopic(
+                tenant_id=tenant_id,
                 centroid=cluster_centroid.tolist(),
                 n_points=len(cluster_events),
-                last_seen_at=max(e.timestamp for e in cluster_events)
+                created_at=first_seen,
+                last_seen_at=last_seen
             )
             db.add(new_topic)
             db.flush()  # Get topic_id
@@ -161,9 +191,19 @@ def process_clusters_to_topics(
         for event in cluster_events:
             event_topic_map[event.id] = topic_id
 
-            # Create event-topic mapping
-            mapping = CoreEventTopic(event_id=event.id, topic_id=topic_id)
-            db.add(mapping)
+    # Create event-topic mappings; rows left by an interrupted run are kept as they are.
+    # Events read from cold storage are no longer in core_events and get no row.
+    timestamps = {event.id: event.timestamp for event in events if not is_archived(event)}
+    mappings = [
+        {"event_id": e, "event_timestamp": timestamps[e], "topic_id": t}
+        for e, t in event_topic_map.items() if e in timestamps
+    ]
+    if mappings:
+        db.execute(
+            insert(CoreEventTopic)
+            .values(mappings)
+            .on_conflict_do_nothing(index_elements=["event_id", "topic_id"])
+        )
 
     db.commit()
     logger.info(f"Mapped {len(event_topic_map)} events to topics")
@@ -1,11 +1,19 @@
 """Embedding generation module using sentence-transformers."""
 
 from sentence_transformers import SentenceTransformer
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+import asyncio
 import numpy as np
+import logging
+import time
+from sqlalchemy import inspect, update
 from src.config import get_settings
+from src.models import CoreEvent
+from src.telemetry import observe_embedding
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @lru_cache(maxsize=1)
@@ -25,10 +33,36 @@ def generate_embedding(text: str) -> np.ndarray:
         384-dimensional numpy array
     """
     model = get_embedding_model()
+    start = time.perf_counter()
     embedding = model.encode(text, convert_to_numpy=True, show_progress_bar=False)
+    observe_embedding("single", 1, time.perf_counter() - start)
     return embedding
 
 
+@lru_cache(maxsize=1)
+def get_embedding_executor() -> ThreadPoolExecutor:
+    """Get the executor that runs embedding work for async callers."""
+    return ThreadPoolExecutor(max_workers=settings.embedding_workers, thread_name_prefix="embedding")
+
+
+async def generate_embedding_async(text: str) -> np.ndarray:
+    """
+    Generate an embedding without blocking the event loop.
+
+    Encoding runs on a dedicated executor rather than the default one, so a
+    burst of ingests cannot starve other threadpool work and the number of
+    concurrent encodes (each using all torch threads) stays bounded.
+
+    Args:
+        text: Input text to embed
+
+    Returns:
+        384-dimensional numpy array
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_embedding_executor(), generate_embedding, text)
+
+
 def generate_embeddings_batch(texts: list[str]) -> np.ndarray:
     """
     Generate embeddings for multiple texts efficiently.
@@ -40,10 +74,51 @@ def generate_embeddings_batch(texts: list[str]) -> np.ndarray:
         Array of shape (len(texts), 384)
     """
     model = get_embedding_model()
+    start = time.perf_counter()
     embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=False, batch_size=32)
+    observe_embedding("batch", len(texts), time.perf_counter() - start)
     return embeddings
 
 
+def generate_embeddings_for_events(db, events: list) -> int:
+    """
+    Embed the given events that have no embedding yet, in place.
+
+    Events attached to db are flushed by the commit; detached ones (loaded
+    through a read replica session) are written with one UPDATE by primary key.
+
+    Args:
+        db: Primary database session
+        events: Already-loaded CoreEvent objects
+
+    Returns:
+        Number of events embedded
+    """
+    missing = [event for event in events if event.embedding is None]
+
+    if not missing:
+        logger.info("All events have embeddings")
+        return 0
+
+    logger.info(f"Generating embeddings for {len(missing)} events")
+
+    texts = [f"{event.subject} {event.text}" for event in missing]
+    for event, embedding in zip(missing, generate_embeddings_batch(texts)):
+        event.embedding = embedding.tolist()
+
+    detached = [event for event in missing if inspect(event).detached]
+    if detached:
+        db.execute(update(CoreEvent), [
+            {"id": event.id, "timestamp": event.timestamp, "embedding": event.embedding}
+            for event in detached
+        ])
+
+    db.commit()
+    logger.info(f"Generated {len(missing)} embeddings")
+
+    return len(missing)
+
+
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """
     Calculate cosine similarity between two vectors.
@@ -1,17 +1,29 @@
 """LLM enhancement layer with Grok primary and OpenAI fallback."""
 
+import asyncio
 import json
 import logging
+import time
 from typing import Dict, Any, Tuple
 import httpx
-from openai import OpenAI
 
 from src.config import get_settings
 from src.schemas import LLMEnhancedOutput
+from src.insight.modules.llm_cache import compute_cache_key, get_cached_response, store_cached_response
+from src.insight.modules.clients import (
+    get_http_client, get_async_http_client, get_openai_client, get_async_openai_client
+)
+from src.insight.modules.resilience import (
+    RETRYABLE_STATUS_CODES, CircuitOpenError, call_with_retry, call_with_retry_async, classify_llm_error
+)
+from src.insight.modules.payload import compact_to_budget, dump_compact, estimate_tokens
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Bump whenever the system/user prompts change so cached responses are not reused
+PROMPT_VERSION = "1"
+
 
 # Strict JSON schema for OpenAI structured output
 ENHANCEMENT_SCHEMA = {
@@ -58,6 +70,9 @@ def prepare_facts_payload(
     """
     Prepare facts-only payload for LLM (no raw text).
 
+    The payload is compacted to fit the configured token budget: compact JSON,
+    top-k actors/threads/topics with "other" rollups and deduplicated subjects.
+
     Args:
         week_metrics: Current week metrics
         baseline_metrics: 28-day baseline metrics
@@ -82,7 +97,137 @@ def prepare_facts_payload(
         "rule_findings": findings
     }
 
-    return json.dumps(facts, indent=2)
+    tokens_before = estimate_tokens(json.dumps(facts, indent=2))
+    compacted = compact_to_budget(facts, settings.llm_token_budget, settings.llm_payload_top_k)
+    payload = dump_compact(compacted)
+    tokens_after = estimate_tokens(payload)
+
+    logger.info(
+        f"Facts payload: ~{tokens_before} tokens before compaction, "
+        f"~{tokens_after} after (budget {settings.llm_token_budget})"
+    )
+    if tokens_after > settings.llm_token_budget:
+        logger.warning("Facts payload still exceeds token budget after compaction")
+
+    return payload
+
+
+SYSTEM_PROMPT = """You are an executive strategic analyst. Analyze the provided metrics and findings to identify:
+1. Key signals (emerging patterns, shifts in activity)
+2. Strategic drift (deviation from expected patterns)
+3. Decision pressure points (where decisions are needed)
+4. Recommended actions (specific, actionable steps)
+5. Watchlist items (things to monitor)
+
+Provide ONLY factual, evidence-backed insights. No speculation or assumptions."""
+
+
+def build_grok_request(facts_payload: str) -> Dict[str, Any]:
+    """Build the Grok chat completions request body."""
+    system_prompt = SYSTEM_PROMPT + "\nOutput must be valid JSON matching the required schema."
+
+    user_prompt = f"""Analyze these weekly strategic metrics and provide insights:
+
+{facts_payload}
+
+Return a JSON object with arrays for: signals, drift, decision_pressure, recommended_actions, and watchlist."""
+
+    return {
+        "model": settings.grok_model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": settings.llm_temperature
+    }
+
+
+def build_openai_request(facts_payload: str) -> Dict[str, Any]:
+    """Build the OpenAI chat completions keyword arguments."""
+    user_prompt = f"""Analyze these weekly strategic metrics and provide insights:
+
+{facts_payload}"""
+
+    return {
+        "model": settings.openai_model,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "strategic_enhancement",
+                "strict": True,
+                "schema": ENHANCEMENT_SCHEMA
+            }
+        },
+        "temperature": settings.llm_temperature
+    }
+
+
+def parse_grok_response(response: httpx.Response) -> Tuple[LLMEnhancedOutput | None, str | None, str | None]:
+    """Validate a Grok HTTP response against the enhancement schema."""
+    if response.status_code != 200:
+        logger.error(f"Grok API error: {response.status_code} - {response.text}")
+        return None, None, None
+
+    result = response.json()
+    content = result["choices"][0]["message"]["content"]
+    response_id = result.get("id")
+
+    # Parse and validate
+    parsed = json.loads(content)
+    enhanced = LLMEnhancedOutput(**parsed)
+
+    logger.info("Grok API enhancement successful")
+    return enhanced, settings.grok_model, response_id
+
+
+def parse_openai_response(response: Any) -> Tuple[LLMEnhancedOutput | None, str | None, str | None]:
+    """Validate an OpenAI chat completion against the enhancement schema."""
+    content = response.choices[0].message.content
+    parsed = json.loads(content)
+
+    # Validate with Pydantic
+    enhanced = LLMEnhancedOutput(**parsed)
+
+    logger.info("OpenAI API enhancement successful")
+    return enhanced, settings.openai_model, response.id
+
+
+def grok_headers() -> Dict[str, str]:
+    """Build Grok request headers."""
+    return {
+        "Authorization": f"Bearer {settings.grok_api_key}",
+        "Content-Type": "application/json"
+    }
+
+
+def post_grok_request(facts_payload: str) -> httpx.Response:
+    """Send one Grok request, raising on transient HTTP errors so they are retried."""
+    # Call Grok API (OpenAI-compatible endpoint) over the shared connection pool
+    response = get_http_client().post(
+        f"{settings.grok_api_url}/chat/completions",
+        headers=grok_headers(),
+        json=build_grok_request(facts_payload)
+    )
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        response.raise_for_status()
+    return response
+
+
+async def post_grok_request_async(facts_payload: str) -> httpx.Response:
+    """Send one Grok request asynchronously, raising on transient HTTP errors."""
+    response = await get_async_http_client().post(
+        f"{settings.grok_api_url}/chat/completions",
+        headers=grok_headers(),
+        json=build_grok_request(facts_payload)
+    )
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        response.raise_for_status()
+    return response
 
 
 def call_grok_api(facts_payload: str) -> Tuple[LLMEnhancedOutput | None, str | None, str | None]:
@@ -100,56 +245,38 @@ def call_grok_api(facts_payload: str) -> Tuple[LLMEnhancedOutput | None, str | N
         return None, None, None
 
     try:
-        system_prompt = """You are an executive strategic analyst. Analyze the provided metrics and findings to identify:
-1. Key signals (emerging patterns, shifts in activity)
-2. Strategic drift (deviation from expected patterns)
-3. Decision pressure points (where decisions are needed)
-4. Recommended actions (specific, actionable steps)
-5. Watchlist items (things to monitor)
-
-Provide ONLY factual, evidence-backed insights. No speculation or assumptions.
-Output must be valid JSON matching the required schema."""
+        response = call_with_retry("grok", post_grok_request, facts_payload, classify=classify_llm_error)
+        return parse_grok_response(response)
 
-        user_prompt = f"""Analyze these weekly strategic metrics and provide insights:
-
-{facts_payload}
-
-Return a JSON object with arrays for: signals, drift, decision_pressure, recommended_actions, and watchlist."""
+    except CircuitOpenError as e:
+        logger.warning(f"Skipping Grok API call: {e}")
+        return None, None, None
+    except Exception as e:
+        logger.error(f"Grok API call failed: {e}")
+        return None, None, None
 
-        # Call Grok API (OpenAI-compatible endpoint)
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                f"{settings.grok_api_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.grok_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": settings.grok_model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "response_format": {"type": "json_object"},
-                    "temperature": 0.3
-                }
-            )
 
-        if response.status_code != 200:
-            logger.error(f"Grok API error: {response.status_code} - {response.text}")
-            return None, None, None
+async def call_grok_api_async(facts_payload: str) -> Tuple[LLMEnhancedOutput | None, str | None, str | None]:
+    """
+    Call Grok API for enhancement without blocking the event loop.
 
-        result = response.json()
-        content = result["choices"][0]["message"]["content"]
-        response_id = result.get("id")
+    Args:
+        facts_payload: JSON facts string
 
-        # Parse and validate
-        parsed = json.loads(content)
-        enhanced = LLMEnhancedOutput(**parsed)
+    Returns:
+        (Enhanced output or None, model name, response ID)
+    """
+    if not settings.grok_api_key:
+        logger.warning("Grok API key not configured")
+        return None, None, None
 
-        logger.info("Grok API enhancement successful")
-        return enhanced, settings.grok_model, response_id
+    try:
+        response = await call_with_retry_async("grok", post_grok_request_async, facts_payload, classify=classify_llm_error)
+        return parse_grok_response(response)
 
+    except CircuitOpenError as e:
+        logger.warning(f"Skipping Grok API call: {e}")
+        return None, None, None
     except Exception as e:
         logger.error(f"Grok API call failed: {e}")
         return None, None, None
@@ -170,68 +297,106 @@ def call_openai_api(facts_payload: str) -> Tuple[LLMEnhancedOutput | None, str |
         return None, None, None
 
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
+        client = get_openai_client(settings.openai_api_key)
+        response = call_with_retry(
+            "openai", client.chat.completions.create, classify=classify_llm_error,
+            **build_openai_request(facts_payload)
+        )
 
-        system_prompt = """You are an executive strategic analyst. Analyze the provided metrics and findings to identify:
-1. Key signals (emerging patterns, shifts in activity)
-2. Strategic drift (deviation from expected patterns)
-3. Decision pressure points (where decisions are needed)
-4. Recommended actions (specific, actionable steps)
-5. Watchlist items (things to monitor)
+        return parse_openai_response(response)
 
-Provide ONLY factual, evidence-backed insights. No speculation or assumptions."""
+    except CircuitOpenError as e:
+        logger.warning(f"Skipping OpenAI API call: {e}")
+        return None, None, None
+    except Exception as e:
+        logger.error(f"OpenAI API call failed: {e}")
+        return None, None, None
 
-        user_prompt = f"""Analyze these weekly strategic metrics and provide insights:
 
-{facts_payload}"""
+async def call_openai_api_async(facts_payload: str) -> Tuple[LLMEnhancedOutput | None, str | None, str | None]:
+    """
+    Call OpenAI API with strict structured output without blocking the event loop.
 
-        response = client.chat.completions.create(
-            model=settings.openai_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "strategic_enhancement",
-                    "strict": True,
-                    "schema": ENHANCEMENT_SCHEMA
-                }
-            },
-            temperature=0.3
-        )
+    Args:
+        facts_payload: JSON facts string
 
-        content = response.choices[0].message.content
-        parsed = json.loads(content)
+    Returns:
+        (Enhanced output or None, model name, response ID)
+    """
+    if not settings.openai_api_key:
+        logger.warning("OpenAI API key not configured")
+        return None, None, None
 
-        # Validate with Pydantic
-        enhanced = LLMEnhancedOutput(**parsed)
+    try:
+        client = get_async_openai_client(settings.openai_api_key)
+        response = await call_with_retry_async(
+            "openai", client.chat.completions.create, classify=classify_llm_error,
+            **build_openai_request(facts_payload)
+        )
 
-        logger.info("OpenAI API enhancement successful")
-        return enhanced, settings.openai_model, response.id
+        return parse_openai_response(response)
 
+    except CircuitOpenError as e:
+        logger.warning(f"Skipping OpenAI API call: {e}")
+        return None, None, None
     except Exception as e:
         logger.error(f"OpenAI API call failed: {e}")
         return None, None, None
 
 
+def lookup_cached_enhancement(facts_payload: str) -> Tuple[LLMEnhancedOutput | None, str | None, str | None]:
+    """
+    Look up a cached enhancement for either provider.
+
+    Args:
+        facts_payload: JSON facts string
+
+    Returns:
+        (Cached output or None, model name, response ID)
+    """
+    for model in (settings.grok_model, settings.openai_model):
+        cache_key = compute_cache_key(facts_payload, model, PROMPT_VERSION, settings.llm_temperature)
+        enhanced, cached_model, response_id = get_cached_response(cache_key)
+        if enhanced:
+            logger.info(f"Using cached LLM enhancement from {cached_model}")
+            return enhanced, cached_model, response_id
+
+    return None, None, None
+
+
+def store_enhancement(
+    facts_payload: str,
+    enhanced: LLMEnhancedOutput,
+    model: str,
+    response_id: str | None
+) -> None:
+    """Store a successful enhancement in the response cache."""
+    if settings.llm_cache_enabled:
+        cache_key = compute_cache_key(facts_payload, model, PROMPT_VERSION, settings.llm_temperature)
+        store_cached_response(cache_key, enhanced, model, response_id)
+
+
 def enhance_with_llm(
     week_metrics: Dict[str, Any],
     baseline_metrics: Dict[str, Any],
     deltas: Dict[str, Any],
     topic_metrics: list[Dict[str, Any]],
-    findings: list[Dict[str, Any]]
+    findings: list[Dict[str, Any]],
+    refresh: bool = False
 ) -> Tuple[LLMEnhancedOutput | None, bool, str | None, str | None]:
     """
     Enhance findings with LLM (Grok primary, OpenAI fallback).
 
+    Responses are cached on disk keyed by the facts payload, model, prompt
+    version and temperature, so reruns of the same week make no network calls.
+
     Args:
         week_metrics: Current week metrics
         baseline_metrics: 28-day baseline metrics
         deltas: Delta calculations
         topic_metrics: Topic-level metrics
         findings: Rule engine findings
+        refresh: Bypass cached responses and call the providers again
 
     Returns:
         (Enhanced output or None, LLM used bool, model name, response ID)
@@ -240,11 +405,20 @@ def enhance_with_llm(
         week_metrics, baseline_metrics, deltas, topic_metrics, findings
     )
 
+    # Check cache before any network call
+    if settings.llm_cache_enabled and not refresh:
+        enhanced, model, response_id = lookup_cached_enhancement(facts_payload)
+        if enhanced:
+            return enhanced, True, model, response_id
+    elif refresh:
+        logger.info("LLM cache bypassed (refresh requested)")
+
     # Try Grok first
     logger.info("Attempting Grok API enhancement...")
     enhanced, model, response_id = call_grok_api(facts_payload)
 
     if enhanced:
+        store_enhancement(facts_payload, enhanced, model, response_id)
         return enhanced, True, model, response_id
 
     # Fallback to OpenAI
@@ -252,8 +426,145 @@ def enhance_with_llm(
     enhanced, model, response_id = call_openai_api(facts_payload)
 
     if enhanced:
+        store_enhancement(facts_payload, enhanced, model, response_id)
         return enhanced, True, model, response_id
 
     # No LLM available
     logger.warning("Both LLM providers failed, proceeding without enhancement")
     return None, False, None, None
+
+
+async def enhance_with_llm_hedged(
+    week_metrics: Dict[str, Any],
+    baseline_metrics: Dict[str, Any],
+    deltas: Dict[str, Any],
+    topic_metrics: list[Dict[str, Any]],
+    findings: list[Dict[str, Any]],
+    refresh: bool = False,
+    hedge_delay: float | None = None
+) -> Tuple[LLMEnhancedOutput | None, bool, str | None, str | None, Dict[str, Any]]:
+    """
+    Enhance findings with hedged concurrent Grok and OpenAI calls.
+
+    Grok starts first; OpenAI starts once the hedge delay elapses or Grok
+    fails, whichever comes first. The first schema-valid response wins and
+    the other request is cancelled.
+
+    Args:
+        week_metrics: Current week metrics
+        baseline_metrics: 28-day baseline metrics
+        deltas: Delta calculations
+        topic_metrics: Topic-level metrics
+        findings: Rule engine findings
+        refresh: Bypass cached responses and call the providers again
+        hedge_delay: Seconds before firing the fallback (defaults to config, 0 = immediately)
+
+    Returns:
+        (Enhanced output or None, LLM used bool, model name, response ID, hedge details)
+    """
+    if hedge_delay is None:
+        hedge_delay = settings.llm_hedge_delay_seconds
+
+    facts_payload = prepare_facts_payload(
+        week_metrics, baseline_metrics, deltas, topic_metrics, findings
+    )
+
+    hedge = {
+        "mode": "hedged",
+        "hedge_delay_seconds": hedge_delay,
+        "winner": None,
+        "fallback_started": False,
+        "elapsed_seconds": 0.0,
+        "primary_elapsed_seconds": None,
+        "primary_outcome": None,
+        "latency_saved_seconds": 0.0,
+        "latency_saved_is_lower_bound": False
+    }
+
+    if settings.llm_cache_enabled and not refresh:
+        enhanced, model, response_id = lookup_cached_enhancement(facts_payload)
+        if enhanced:
+            hedge["winner"] = "cache"
+            return enhanced, True, model, response_id, hedge
+    elif refresh:
+        logger.info("LLM cache bypassed (refresh requested)")
+
+    started = time.perf_counter()
+    providers = {}
+    finished_at = {}
+
+    logger.info(f"Starting hedged LLM enhancement (hedge delay {hedge_delay}s)...")
+    primary = asyncio.create_task(call_grok_api_async(facts_payload))
+    providers[primary] = "grok"
+
+    pending = {primary}
+    fallback = None
+    fallback_started_at = None
+    winner = None
+
+    try:
+        while pending:
+            # Only wait out the hedge delay while the fallback has not been fired
+            timeout = None
+            if fallback is None:
+                timeout = max(hedge_delay - (time.perf_counter() - started), 0)
+
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                finished_at[task] = time.perf_counter()
+                result = task.result()
+                if result[0] is not None and winner is None:
+                    winner = task
+
+            if winner is not None:
+                break
+
+            if fallback is None:
+                if primary in done:
+                    logger.info("Grok failed, firing OpenAI fallback immediately...")
+                else:
+                    logger.info("Hedge delay elapsed, firing OpenAI fallback...")
+                fallback = asyncio.create_task(call_openai_api_async(facts_payload))
+                fallback_started_at = time.perf_counter()
+                providers[fallback] = "openai"
+                pending.add(fallback)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    ended = time.perf_counter()
+    hedge["elapsed_seconds"] = round(ended - started, 3)
+    hedge["fallback_started"] = fallback is not None
+
+    if primary in finished_at:
+        hedge["primary_outcome"] = "success" if primary is winner else "failed"
+        primary_elapsed = finished_at[primary] - started
+    else:
+        hedge["primary_outcome"] = "cancelled"
+        primary_elapsed = ended - started
+        hedge["latency_saved_is_lower_bound"] = True
+    hedge["primary_elapsed_seconds"] = round(primary_elapsed, 3)
+
+    if winner is fallback and fallback is not None:
+        # Sequential fallback would have waited for Grok before starting OpenAI
+        sequential = primary_elapsed + (finished_at[fallback] - fallback_started_at)
+        hedge["latency_saved_seconds"] = round(max(sequential - (ended - started), 0.0), 3)
+
+    if winner is None:
+        logger.warning("Both LLM providers failed, proceeding without enhancement")
+        return None, False, None, None, hedge
+
+    hedge["winner"] = providers[winner]
+    enhanced, model, response_id = winner.result()
+    logger.info(
+        f"Hedged LLM enhancement won by {hedge['winner']} in {hedge['elapsed_seconds']}s "
+        f"(saved {hedge['latency_saved_seconds']}s)"
+    )
+
+    store_enhancement(facts_payload, enhanced, model, response_id)
+    return enhanced, True, model, response_id, hedge
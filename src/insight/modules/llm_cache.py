@@ -0,0 +1,170 @@
+"""Persistent on-disk cache for LLM enhancement responses."""
+
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Tuple
+
+from src.config import get_settings
+from src.schemas import LLMEnhancedOutput
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def compute_cache_key(
+    facts_payload: str,
+    model: str,
+    prompt_version: str,
+    temperature: float
+) -> str:
+    """
+    Compute cache key for an LLM request.
+
+    Args:
+        facts_payload: JSON facts string sent to the model
+        model: Model name
+        prompt_version: Version of the system/user prompts
+        temperature: Sampling temperature
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    digest = hashlib.sha256()
+    for part in (model, prompt_version, f"{temperature:.4f}", facts_payload):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _cache_dir() -> Path:
+    return Path(settings.llm_cache_dir)
+
+
+def _entry_path(key: str) -> Path:
+    return _cache_dir() / f"{key}.json"
+
+
+def get_cached_response(key: str) -> Tuple[LLMEnhancedOutput | None, str | None, str | None]:
+    """
+    Look up a cached LLM response.
+
+    Expired or unreadable entries are removed and treated as misses.
+
+    Args:
+        key: Cache key from compute_cache_key
+
+    Returns:
+        (Cached output or None, model name, response ID)
+    """
+    path = _entry_path(key)
+    if not path.exists():
+        return None, None, None
+
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        age_seconds = time.time() - entry["created_at"]
+
+        if age_seconds > settings.llm_cache_ttl_hours * 3600:
+            logger.info(f"LLM cache entry {key[:12]} expired")
+            path.unlink(missing_ok=True)
+            return None, None, None
+
+        output = LLMEnhancedOutput(**entry["output"])
+
+    except Exception as e:
+        logger.warning(f"Discarding unreadable LLM cache entry {key[:12]}: {e}")
+        path.unlink(missing_ok=True)
+        return None, None, None
+
+    # Refresh mtime so size-based eviction drops least recently used entries first
+    path.touch()
+    return output, entry["model"], entry.get("response_id")
+
+
+def store_cached_response(
+    key: str,
+    output: LLMEnhancedOutput,
+    model: str,
+    response_id: str | None
+) -> None:
+    """
+    Store an LLM response and evict old entries.
+
+    Args:
+        key: Cache key from compute_cache_key
+        output: Validated LLM output
+        model: Model name that produced the output
+        response_id: Provider response ID
+    """
+    cache_dir = _cache_dir()
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "created_at": time.time(),
+            "model": model,
+            "response_id": response_id,
+            "output": output.model_dump()
+        }
+
+        # Write atomically so a concurrent reader never sees a partial file
+        tmp_path = cache_dir / f".{key}.tmp"
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        tmp_path.replace(_entry_path(key))
+
+        evict_entries()
+
+    except OSError as e:
+        logger.warning(f"Failed to write LLM cache entry: {e}")
+
+
+def evict_entries() -> int:
+    """
+    Remove expired or unreadable entries and enforce the maximum cache size.
+
+    Entries expire by their stored creation time; file mtime, refreshed on
+    every hit, only orders the least recently used entries for size eviction.
+
+    Returns:
+        Number of entries removed
+    """
+    cache_dir = _cache_dir()
+    if not cache_dir.exists():
+        return 0
+
+    ttl_seconds = settings.llm_cache_ttl_hours * 3600
+    now = time.time()
+    removed = 0
+
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        # Reads refresh mtime, so age comes from the stored creation time
+        try:
+            mtime = path.stat().st_mtime
+            created_at = json.loads(path.read_text(encoding="utf-8"))["created_at"]
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError, KeyError, TypeError):
+            created_at = None
+
+        if created_at is None or now - created_at > ttl_seconds:
+            path.unlink(missing_ok=True)
+            removed += 1
+        else:
+            entries.append((mtime, path))
+
+    # Least recently used entries go first
+    entries.sort()
+    excess = len(entries) - settings.llm_cache_max_entries
+    for _, path in entries[:max(excess, 0)]:
+        path.unlink(missing_ok=True)
+        removed += 1
+
+    if removed:
+        logger.info(f"Evicted {removed} LLM cache entries")
+
+    return removed
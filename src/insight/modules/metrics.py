@@ -4,7 +4,8 @@ from typing import Dict, List, Any
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from collections import Counter
+from collections import Counter, defaultdict
+from uuid import UUID
 import logging
 
 from src.models import CoreEvent, CoreTopic, CoreEventTopic
@@ -120,6 +121,97 @@ def compute_metrics(events: List[CoreEvent]) -> Dict[str, Any]:
     }
 
 
+def compute_rollup(events: List[CoreEvent]) -> Dict[str, Any]:
+    """
+    Compute mergeable partial metrics for a set of events (e.g. one day).
+
+    Unlike compute_metrics, thread counts are kept for every thread so that
+    repeated patterns can be found after merging several rollups.
+
+    Args:
+        events: List of events
+
+    Returns:
+        Rollup dictionary (JSON-serializable)
+    """
+    thread_subjects = {}
+    for event in events:
+        if event.thread_id is None:
+            continue
+        subjects = thread_subjects.setdefault(event.thread_id, [])
+        if event.subject not in subjects and len(subjects) < 3:
+            subjects.append(event.subject)
+
+    return {
+        "total_events": len(events),
+        "urgency_distribution": compute_urgency_distribution(events),
+        "actor_load": compute_actor_load(events),
+        "decision_counts": compute_decision_counts(events),
+        "follow_up_count": sum(1 for e in events if e.follow_up_required),
+        "thread_counts": dict(Counter(e.thread_id for e in events if e.thread_id is not None)),
+        "thread_subjects": thread_subjects
+    }
+
+
+def merge_rollups(rollups: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge rollups from compute_rollup (e.g. seven daily rollups into a week).
+
+    Args:
+        rollups: Rollup dictionaries
+
+    Returns:
+        Merged rollup dictionary
+    """
+    merged = compute_rollup([])
+
+    for rollup in rollups:
+        merged["total_events"] += rollup["total_events"]
+        merged["follow_up_count"] += rollup["follow_up_count"]
+
+        for key in ("urgency_distribution", "decision_counts", "actor_load", "thread_counts"):
+            for name, count in rollup[key].items():
+                merged[key][name] = merged[key].get(name, 0) + count
+
+        for thread_id, subjects in rollup["thread_subjects"].items():
+            merged_subjects = merged["thread_subjects"].setdefault(thread_id, [])
+            for subject in subjects:
+                if subject not in merged_subjects and len(merged_subjects) < 3:
+                    merged_subjects.append(subject)
+
+    return merged
+
+
+def metrics_from_rollup(rollup: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a (merged) rollup into the compute_metrics format.
+
+    Args:
+        rollup: Rollup dictionary
+
+    Returns:
+        Dictionary containing all computed metrics
+    """
+    repeated = [
+        {
+            "thread_id": thread_id,
+            "count": count,
+            "subjects": rollup["thread_subjects"].get(thread_id, [])
+        }
+        for thread_id, count in rollup["thread_counts"].items()
+        if count >= 3
+    ]
+
+    return {
+        "total_events": rollup["total_events"],
+        "urgency_distribution": rollup["urgency_distribution"],
+        "actor_load": dict(sorted(rollup["actor_load"].items(), key=lambda x: x[1], reverse=True)),
+        "decision_counts": rollup["decision_counts"],
+        "follow_up_count": rollup["follow_up_count"],
+        "repeated_patterns": sorted(repeated, key=lambda x: x["count"], reverse=True)
+    }
+
+
 def compute_deltas(week_metrics: Dict[str, Any], baseline_metrics: Dict[str, Any]) -> Dict[str, Any]:
     """
     Compute deltas between week and baseline metrics.
@@ -167,28 +259,65 @@ def compute_deltas(week_metrics: Dict[str, Any], baseline_metrics: Dict[str, Any
     return deltas
 
 
-def get_topic_metrics(db: Session, week_events: List[CoreEvent]) -> List[Dict[str, Any]]:
+def is_new_topic(created_at: datetime, as_of: datetime | None = None) -> bool:
+    """
+    Whether a topic first appeared in the seven days before as_of.
+
+    Args:
+        created_at: Topic creation time (its earliest event)
+        as_of: End of the processed window (defaults to now); a backfilled week
+            passes its own week_end so old topics are not reported as new
+
+    Returns:
+        True if the topic is less than seven days old at as_of
+    """
+    as_of = as_of or datetime.now(timezone.utc)
+    if as_of.tzinfo is None:
+        as_of = as_of.replace(tzinfo=timezone.utc)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+
+    return (as_of - created_at) < timedelta(days=7)
+
+
+def get_topic_metrics(
+    db: Session,
+    week_events: List[CoreEvent],
+    event_topic_map: Dict[str, Any] | None = None,
+    as_of: datetime | None = None
+) -> List[Dict[str, Any]]:
     """
     Get metrics for each topic detected this week.
 
     Args:
         db: Database session
         week_events: Events from current week
+        event_topic_map: Event ID to topic ID from this run's topic assignment;
+            when omitted the mappings are read from core_event_topics (which has
+            no rows for events read from cold storage)
+        as_of: End of the week, for is_new (defaults to now)
 
     Returns:
         List of topic metrics dictionaries
     """
     week_event_ids = {e.id for e in week_events}
 
-    # Get all topic mappings for week events
-    topic_data = db.query(
-        CoreEventTopic.topic_id,
-        func.count(CoreEventTopic.event_id).label('event_count')
-    ).filter(
-        CoreEventTopic.event_id.in_(week_event_ids)
-    ).group_by(
-        CoreEventTopic.topic_id
-    ).all()
+    if event_topic_map is not None:
+        topic_event_ids_by_topic = defaultdict(set)
+        for event_id, topic_id in event_topic_map.items():
+            if event_id in week_event_ids:
+                topic_event_ids_by_topic[UUID(str(topic_id))].add(event_id)
+        topic_data = [(topic_id, len(ids)) for topic_id, ids in topic_event_ids_by_topic.items()]
+    else:
+        # Get all topic mappings for week events
+        topic_data = db.query(
+            CoreEventTopic.topic_id,
+            func.count(CoreEventTopic.event_id).label('event_count')
+        ).filter(
+            CoreEventTopic.event_id.in_(week_event_ids)
+        ).group_by(
+            CoreEventTopic.topic_id
+        ).all()
 
     topic_metrics = []
 
@@ -197,11 +326,14 @@ def get_topic_metrics(db: Session, week_events: List[CoreEvent]) -> List[Dict[st
         topic = db.query(CoreTopic).filter(CoreTopic.topic_id == topic_id).first()
 
         # Get events for this topic
-        topic_event_ids = db.query(CoreEventTopic.event_id).filter(
-            CoreEventTopic.topic_id == topic_id,
-            CoreEventTopic.event_id.in_(week_event_ids)
-        ).all()
-        topic_event_ids = [eid[0] for eid in topic_event_ids]
+        if event_topic_map is not None:
+            topic_event_ids = topic_event_ids_by_topic[topic_id]
+        else:
+            topic_event_ids = db.query(CoreEventTopic.event_id).filter(
+                CoreEventTopic.topic_id == topic_id,
+                CoreEventTopic.event_id.in_(week_event_ids)
+            ).all()
+            topic_event_ids = {eid[0] for eid in topic_event_ids}
 
         topic_events = [e for e in week_events if e.id in topic_event_ids]
 
@@ -218,7 +350,111 @@ def get_topic_metrics(db: Session, week_events: List[CoreEvent]) -> List[Dict[st
             "follow_up_required": sum(1 for e in topic_events if e.follow_up_required),
             "sample_subjects": list(set(e.subject for e in topic_events))[:3],
             "created_at": topic.created_at.isoformat(),
-            "is_new": (datetime.now(timezone.utc) - topic.created_at) < timedelta(days=7)
+            "is_new": is_new_topic(topic.created_at, as_of)
+        })
+
+    return sorted(topic_metrics, key=lambda x: x["event_count"], reverse=True)
+
+
+def compute_topic_rollups(
+    events: List[CoreEvent],
+    event_topic_map: Dict[str, Any],
+    topic_created_at: Dict[str, datetime]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute mergeable per-topic metrics for a set of events (e.g. one day).
+
+    Args:
+        events: List of events
+        event_topic_map: Event ID to topic ID
+        topic_created_at: Topic ID (string) to topic creation time
+
+    Returns:
+        Dictionary mapping topic ID (string) to its rollup
+    """
+    rollups = {}
+
+    for event in events:
+        if event.id not in event_topic_map:
+            continue
+
+        topic_id = str(event_topic_map[event.id])
+        rollup = rollups.setdefault(topic_id, {
+            "event_count": 0,
+            "urgency_sum": 0,
+            "decisions_made": 0,
+            "decisions_deferred": 0,
+            "follow_up_required": 0,
+            "sample_subjects": [],
+            "created_at": topic_created_at[topic_id].isoformat()
+        })
+
+        rollup["event_count"] += 1
+        rollup["urgency_sum"] += event.urgency_score
+        rollup["decisions_made"] += int(event.decision == "made")
+        rollup["decisions_deferred"] += int(event.decision == "deferred")
+        rollup["follow_up_required"] += int(bool(event.follow_up_required))
+        if event.subject not in rollup["sample_subjects"] and len(rollup["sample_subjects"]) < 3:
+            rollup["sample_subjects"].append(event.subject)
+
+    return rollups
+
+
+def merge_topic_rollups(rollups: List[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge per-topic rollups from compute_topic_rollups.
+
+    Args:
+        rollups: Per-topic rollup dictionaries
+
+    Returns:
+        Merged per-topic rollup dictionary
+    """
+    merged = {}
+
+    for rollup in rollups:
+        for topic_id, topic in rollup.items():
+            if topic_id not in merged:
+                merged[topic_id] = {**topic, "sample_subjects": list(topic["sample_subjects"])}
+                continue
+
+            target = merged[topic_id]
+            for key in ("event_count", "urgency_sum", "decisions_made", "decisions_deferred", "follow_up_required"):
+                target[key] += topic[key]
+            for subject in topic["sample_subjects"]:
+                if subject not in target["sample_subjects"] and len(target["sample_subjects"]) < 3:
+                    target["sample_subjects"].append(subject)
+
+    return merged
+
+
+def topic_metrics_from_rollups(
+    rollups: Dict[str, Dict[str, Any]],
+    as_of: datetime | None = None
+) -> List[Dict[str, Any]]:
+    """
+    Convert merged per-topic rollups into the get_topic_metrics format.
+
+    Args:
+        rollups: Merged per-topic rollups
+        as_of: End of the window, for is_new (defaults to now)
+
+    Returns:
+        List of topic metrics dictionaries
+    """
+    topic_metrics = []
+
+    for topic_id, topic in rollups.items():
+        topic_metrics.append({
+            "topic_id": topic_id,
+            "event_count": topic["event_count"],
+            "avg_urgency": round(topic["urgency_sum"] / topic["event_count"], 2),
+            "decisions_made": topic["decisions_made"],
+            "decisions_deferred": topic["decisions_deferred"],
+            "follow_up_required": topic["follow_up_required"],
+            "sample_subjects": topic["sample_subjects"],
+            "created_at": topic["created_at"],
+            "is_new": is_new_topic(datetime.fromisoformat(topic["created_at"]), as_of)
         })
 
     return sorted(topic_metrics, key=lambda x: x["event_count"], reverse=True)
@@ -0,0 +1,224 @@
+"""Token-budgeted compaction of the LLM facts payload."""
+
+import copy
+import json
+from typing import Dict, Any, List
+
+# Rough average for English/JSON text with GPT-style tokenizers
+CHARS_PER_TOKEN = 4
+
+SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate token count for a prompt fragment.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Approximate number of tokens
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def dump_compact(facts: Dict[str, Any]) -> str:
+    """Serialize facts as compact JSON (no indentation or padding)."""
+    return json.dumps(facts, separators=(",", ":"), ensure_ascii=False)
+
+
+def rollup_actor_load(actor_load: Dict[str, int], top_k: int) -> Dict[str, int]:
+    """
+    Keep the top-k actors and roll the rest into a single "other" entry.
+
+    Args:
+        actor_load: Mapping of actor to event count
+        top_k: Number of actors to keep
+
+    Returns:
+        Truncated actor load mapping
+    """
+    ranked = sorted(actor_load.items(), key=lambda x: x[1], reverse=True)
+    compacted = dict(ranked[:top_k])
+
+    rest = ranked[top_k:]
+    if rest:
+        compacted[f"other ({len(rest)} actors)"] = sum(count for _, count in rest)
+
+    return compacted
+
+
+def rollup_repeated_patterns(patterns: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+    """
+    Keep the top-k repeated threads and roll the rest into one entry.
+
+    Args:
+        patterns: Repeated thread patterns sorted by count
+        top_k: Number of threads to keep
+
+    Returns:
+        Truncated pattern list
+    """
+    compacted = patterns[:top_k]
+
+    rest = patterns[top_k:]
+    if rest:
+        compacted = compacted + [{
+            "thread_id": "other",
+            "threads": len(rest),
+            "count": sum(p["count"] for p in rest)
+        }]
+
+    return compacted
+
+
+def rollup_topics(topics: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+    """
+    Keep the top-k topics by event count and roll the rest into one entry.
+
+    Args:
+        topics: Topic metrics
+        top_k: Number of topics to keep
+
+    Returns:
+        Truncated topic list
+    """
+    ranked = sorted(topics, key=lambda x: x["event_count"], reverse=True)
+    compacted = ranked[:top_k]
+
+    rest = ranked[top_k:]
+    if rest:
+        compacted = compacted + [{
+            "topic_id": "other",
+            "topics": len(rest),
+            "event_count": sum(t["event_count"] for t in rest),
+            "decisions_deferred": sum(t["decisions_deferred"] for t in rest),
+            "follow_up_required": sum(t["follow_up_required"] for t in rest)
+        }]
+
+    return compacted
+
+
+def truncate_findings(findings: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+    """
+    Keep the top-k findings, most severe first.
+
+    Args:
+        findings: Rule engine findings
+        top_k: Number of findings to keep
+
+    Returns:
+        Truncated findings list
+    """
+    ranked = sorted(findings, key=lambda f: SEVERITY_ORDER.get(f["severity"], len(SEVERITY_ORDER)))
+    compacted = ranked[:top_k]
+
+    rest = ranked[top_k:]
+    if rest:
+        compacted = compacted + [{"type": "other", "count": len(rest)}]
+
+    return compacted
+
+
+def dedup_subjects(facts: Dict[str, Any]) -> None:
+    """
+    Replace subjects repeated across topics, findings and threads with references.
+
+    Subjects that occur more than once are stored once under "subject_refs"
+    and replaced in place by "@S<n>" references.
+
+    Args:
+        facts: Facts dictionary (modified in place)
+    """
+    subject_lists = []
+    for topic in facts["topics"]:
+        if "sample_subjects" in topic:
+            subject_lists.append(topic["sample_subjects"])
+    for finding in facts["rule_findings"]:
+        if "evidence" in finding:
+            subject_lists.append(finding["evidence"])
+    for window in ("week", "baseline"):
+        for pattern in facts["metrics"][window].get("repeated_patterns", []):
+            if "subjects" in pattern:
+                subject_lists.append(pattern["subjects"])
+
+    occurrences = {}
+    for subjects in subject_lists:
+        for subject in subjects:
+            if isinstance(subject, str):
+                occurrences[subject] = occurrences.get(subject, 0) + 1
+
+    refs = {}
+    for subject, count in occurrences.items():
+        # Only intern when the reference is actually shorter than repeating the text
+        if count > 1 and len(subject) > 6:
+            refs[subject] = f"@S{len(refs) + 1}"
+
+    if not refs:
+        return
+
+    for subjects in subject_lists:
+        subjects[:] = [refs.get(s, s) if isinstance(s, str) else s for s in subjects]
+
+    facts["subject_refs"] = {ref: subject for subject, ref in refs.items()}
+
+
+def compact_facts(facts: Dict[str, Any], top_k: int) -> Dict[str, Any]:
+    """
+    Build a compacted copy of the facts dictionary.
+
+    Args:
+        facts: Full facts dictionary
+        top_k: Number of actors, threads, topics and findings to keep
+
+    Returns:
+        Compacted facts dictionary (input is not modified)
+    """
+    compacted = copy.deepcopy(facts)
+
+    for window in ("week", "baseline"):
+        metrics = compacted["metrics"][window]
+        metrics["actor_load"] = rollup_actor_load(metrics.get("actor_load", {}), top_k)
+        metrics["repeated_patterns"] = rollup_repeated_patterns(metrics.get("repeated_patterns", []), top_k)
+
+    compacted["topics"] = rollup_topics(compacted["topics"], top_k)
+    compacted["rule_findings"] = truncate_findings(compacted["rule_findings"], top_k)
+
+    dedup_subjects(compacted)
+    return compacted
+
+
+def compact_to_budget(
+    facts: Dict[str, Any],
+    token_budget: int,
+    top_k: int
+) -> Dict[str, Any]:
+    """
+    Compact facts until the serialized payload fits the token budget.
+
+    Top-k is halved until the payload fits; as a last resort the baseline
+    actor and thread breakdowns are dropped.
+
+    Args:
+        facts: Full facts dictionary
+        token_budget: Maximum estimated tokens for the payload
+        top_k: Initial number of list entries to keep
+
+    Returns:
+        Compacted facts dictionary
+    """
+    k = max(top_k, 1)
+
+    while True:
+        compacted = compact_facts(facts, k)
+        if estimate_tokens(dump_compact(compacted)) <= token_budget or k == 1:
+            break
+        k = max(k // 2, 1)
+
+    if estimate_tokens(dump_compact(compacted)) > token_budget:
+        baseline = compacted["metrics"]["baseline"]
+        baseline.pop("actor_load", None)
+        baseline.pop("repeated_patterns", None)
+
+    return compacted
@@ -181,7 +181,8 @@ def generate_audit_bundle(
     findings: List[Dict[str, Any]],
     llm_used: bool,
     llm_model: str | None,
-    llm_response_id: str | None
+    llm_response_id: str | None,
+    llm_hedge: Dict[str, Any] | None = None
 ) -> Dict[str, Any]:
     """
     Generate complete audit bundle with all data.
@@ -198,12 +199,13 @@ def generate_audit_bundle(
         llm_used: Whether LLM was used
         llm_model: LLM model name if used
         llm_response_id: LLM response ID if used
+        llm_hedge: Hedged call details (winner, latency saved) if hedging was used
 
     Returns:
         Complete audit data dictionary
     """
     return {
-        "version": "1.2",
+        "version": "1.3",
         "generated_at": datetime.utcnow().isoformat(),
         "time_windows": {
             "week_start": week_start.isoformat(),
@@ -223,9 +225,60 @@ def generate_audit_bundle(
             "urgency_low_max": 3,
             "urgency_medium_max": 7
         },
-        "llm_enhancement": {
-            "used": llm_used,
-            "model": llm_model,
-            "response_id": llm_response_id
-        }
+        "llm_enhancement": generate_llm_audit(llm_used, llm_model, llm_response_id, llm_hedge)
+    }
+
+
+def generate_llm_audit(
+    llm_used: bool,
+    llm_model: str | None,
+    llm_response_id: str | None,
+    llm_hedge: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    """
+    Generate the LLM enhancement section of the audit bundle.
+
+    Args:
+        llm_used: Whether LLM was used
+        llm_model: LLM model name if used
+        llm_response_id: LLM response ID if used
+        llm_hedge: Hedged call details if hedging was used
+
+    Returns:
+        LLM audit dictionary
+    """
+    return {
+        "used": llm_used,
+        "model": llm_model,
+        "response_id": llm_response_id,
+        "hedge": llm_hedge
+    }
+
+
+def generate_performance_audit(
+    timings: Dict[str, Dict[str, Any]],
+    wall_seconds: float,
+    critical_path: List[str],
+    critical_path_seconds: float,
+    restored: List[str]
+) -> Dict[str, Any]:
+    """
+    Generate the performance section of the audit bundle.
+
+    Args:
+        timings: Per-stage wall time, CPU time, peak RSS delta and row counts
+        wall_seconds: Total pipeline wall time
+        critical_path: Stage names along the critical path
+        critical_path_seconds: Duration of the critical path
+        restored: Stages restored from checkpoints instead of executed
+
+    Returns:
+        Performance audit dictionary
+    """
+    return {
+        "wall_seconds": wall_seconds,
+        "critical_path": critical_path,
+        "critical_path_seconds": critical_path_seconds,
+        "restored_stages": restored,
+        "stages": timings
     }
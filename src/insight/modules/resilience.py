@@ -0,0 +1,416 @@
+"""Retry, backoff and circuit breaking around external provider calls."""
+
+import asyncio
+import logging
+import random
+import socket
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from http.client import RemoteDisconnected
+from typing import Any, Callable, Dict, Tuple
+from urllib.error import URLError
+import httpx
+import openai
+from slack_sdk.errors import SlackApiError
+
+from src.config import get_settings
+from src.telemetry import PROVIDER_LATENCY
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# Connection errors of urllib-based clients (slack_sdk)
+URLLIB_TRANSPORT_ERRORS = (URLError, ConnectionError, RemoteDisconnected, socket.timeout)
+
+# Errors raised while connecting, before any request bytes were sent
+UNSENT_ERRORS = (ConnectionRefusedError, socket.gaierror)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a provider's circuit is open and the call is skipped."""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"Circuit open for {provider}, retry in {retry_in:.0f}s")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker (closed -> open -> half-open)."""
+
+    def __init__(self, provider: str, failure_threshold: int, reset_seconds: float):
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if calls to the provider should be skipped."""
+        with self._lock:
+            if self.state == "open":
+                retry_in = self.reset_seconds - (time.monotonic() - self.opened_at)
+                raise CircuitOpenError(self.provider, retry_in)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info(f"Circuit for {self.provider} closed")
+            self.consecutive_failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+
+            # A failed half-open probe re-opens the circuit immediately
+            if self.opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(
+                        f"Circuit for {self.provider} opened after "
+                        f"{self.consecutive_failures} consecutive failures"
+                    )
+                self.opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_counters: Dict[str, Dict[str, int]] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Get the circuit breaker for a provider."""
+    with _registry_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(
+                provider,
+                settings.circuit_failure_threshold,
+                settings.circuit_reset_seconds
+            )
+        return _breakers[provider]
+
+
+def _increment(provider: str, counter: str) -> None:
+    with _registry_lock:
+        counts = _counters.setdefault(provider, {
+            "attempts": 0,
+            "retries": 0,
+            "successes": 0,
+            "failures": 0,
+            "open_circuit_skips": 0
+        })
+        counts[counter] += 1
+
+
+def get_resilience_counters() -> Dict[str, Dict[str, int]]:
+    """
+    Get call counters per provider.
+
+    Returns:
+        Mapping of provider to attempts, retries, successes, failures and open-circuit skips
+    """
+    with _registry_lock:
+        return {provider: dict(counts) for provider, counts in _counters.items()}
+
+
+def reset_resilience_state() -> None:
+    """Reset all circuit breakers and counters."""
+    with _registry_lock:
+        _breakers.clear()
+        _counters.clear()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value in delta-seconds or HTTP-date form
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def classify_error(error: Exception) -> Tuple[bool, float | None]:
+    """
+    Decide whether a provider error is transient.
+
+    Args:
+        error: Exception raised by an HTTP, OpenAI or Slack call
+
+    Returns:
+        (Whether to retry, Retry-After seconds if the provider sent one)
+    """
+    status_code = None
+    headers = None
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        headers = error.response.headers
+    elif isinstance(error, httpx.TransportError):
+        return True, None
+    elif isinstance(error, openai.APIStatusError):
+        status_code = error.status_code
+        headers = error.response.headers
+    elif isinstance(error, openai.APIConnectionError):
+        # Includes APITimeoutError
+        return True, None
+    elif isinstance(error, SlackApiError):
+        status_code = error.response.status_code
+        headers = error.response.headers
+    elif isinstance(error, URLLIB_TRANSPORT_ERRORS):
+        return True, None
+
+    if status_code not in RETRYABLE_STATUS_CODES:
+        return False, None
+
+    retry_after = None
+    if headers is not None:
+        retry_after = parse_retry_after(headers.get("Retry-After") or headers.get("retry-after"))
+
+    return True, retry_after
+
+
+def classify_llm_error(error: Exception) -> Tuple[bool, float | None]:
+    """
+    Like classify_error, but timeouts are not retried.
+
+    A slow LLM call is already covered by the hedged fallback to the other
+    provider, so repeating it would only add latency. The timeout still
+    counts against the provider's circuit breaker.
+
+    Args:
+        error: Exception raised by an HTTP or OpenAI call
+
+    Returns:
+        (Whether to retry, Retry-After seconds if the provider sent one)
+    """
+    if isinstance(error, (httpx.TimeoutException, openai.APITimeoutError)):
+        return False, None
+
+    return classify_error(error)
+
+
+def classify_unsent_error(error: Exception) -> Tuple[bool, float | None]:
+    """
+    Retry policy for calls that are not idempotent (e.g. posting a Slack message).
+
+    Only a 429 (rejected, so nothing happened) or a connection error raised
+    before the request was sent is retried. A timeout, reset or 5xx may come
+    after the provider acted on the request, so repeating it could duplicate it.
+
+    Args:
+        error: Exception raised by an HTTP or Slack call
+
+    Returns:
+        (Whether to retry, Retry-After seconds if the provider sent one)
+    """
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True, None
+
+    if isinstance(error, URLError) and isinstance(error.reason, UNSENT_ERRORS):
+        return True, None
+    if isinstance(error, UNSENT_ERRORS):
+        return True, None
+
+    retryable, retry_after = classify_error(error)
+    status_code = None
+    if isinstance(error, (httpx.HTTPStatusError, SlackApiError)):
+        status_code = error.response.status_code
+
+    return retryable and status_code == 429, retry_after
+
+
+def compute_backoff(attempt: int, retry_after: float | None = None) -> float:
+    """
+    Compute delay before the next attempt.
+
+    Uses full-jitter exponential backoff; a provider's Retry-After wins when
+    it is longer. Delays are capped at the configured maximum.
+
+    Args:
+        attempt: Number of attempts made so far (1-based)
+        retry_after: Retry-After seconds sent by the provider
+
+    Returns:
+        Seconds to sleep
+    """
+    ceiling = min(settings.retry_max_delay_seconds, settings.retry_base_delay_seconds * (2 ** (attempt - 1)))
+    delay = random.uniform(0, ceiling)
+
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+
+    return min(delay, settings.retry_max_delay_seconds)
+
+
+def _after_failure(
+    provider: str,
+    attempt: int,
+    error: Exception,
+    classify: Callable[[Exception], Tuple[bool, float | None]],
+    deadline: float
+) -> float | None:
+    """Record a failed attempt and return the backoff delay, or None to give up."""
+    breaker = get_circuit_breaker(provider)
+
+    # Transport errors, timeouts and 5xx/429 responses count against the
+    # provider on every attempt; client errors (bad request, auth) do not
+    if classify_error(error)[0]:
+        breaker.record_failure()
+
+    retryable, retry_after = classify(error)
+    if not retryable or attempt >= settings.retry_max_attempts or breaker.state == "open":
+        _increment(provider, "failures")
+        return None
+
+    delay = compute_backoff(attempt, retry_after)
+    if time.monotonic() + delay > deadline:
+        logger.warning(
+            f"{provider} call failed ({error}), no retry within the {settings.retry_deadline_seconds:.0f}s deadline"
+        )
+        _increment(provider, "failures")
+        return None
+
+    _increment(provider, "retries")
+    logger.warning(f"{provider} call failed ({error}), retry {attempt}/{settings.retry_max_attempts - 1} in {delay:.1f}s")
+    return delay
+
+
+def _before_attempt(provider: str) -> None:
+    try:
+        get_circuit_breaker(provider).before_call()
+    except CircuitOpenError:
+        _increment(provider, "open_circuit_skips")
+        raise
+    _increment(provider, "attempts")
+
+
+def call_with_retry(
+    provider: str,
+    func: Callable[..., Any],
+    *args,
+    classify: Callable[[Exception], Tuple[bool, float | None]] = classify_error,
+    **kwargs
+) -> Any:
+    """
+    Call a provider with retries, backoff and circuit breaking.
+
+    No retry is started once its backoff would end after retry_deadline_seconds
+    from the first attempt.
+
+    Args:
+        provider: Provider name for the circuit breaker and counters
+        func: Callable performing one attempt (raises on failure)
+        *args: Positional arguments for func
+        classify: Decides which errors are retried (defaults to classify_error)
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+
+    Raises:
+        CircuitOpenError: If the provider's circuit is open
+        Exception: The last error once retries are exhausted or it is not retryable
+    """
+    deadline = time.monotonic() + settings.retry_deadline_seconds
+    attempt = 0
+    while True:
+        _before_attempt(provider)
+        attempt += 1
+
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            PROVIDER_LATENCY.labels(provider, "error").observe(time.perf_counter() - start)
+            delay = _after_failure(provider, attempt, e, classify, deadline)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            continue
+
+        PROVIDER_LATENCY.labels(provider, "success").observe(time.perf_counter() - start)
+        _increment(provider, "successes")
+        get_circuit_breaker(provider).record_success()
+        return result
+
+
+async def call_with_retry_async(
+    provider: str,
+    func: Callable[..., Any],
+    *args,
+    classify: Callable[[Exception], Tuple[bool, float | None]] = classify_error,
+    **kwargs
+) -> Any:
+    """
+    Await a provider coroutine with retries, backoff and circuit breaking.
+
+    No retry is started once its backoff would end after retry_deadline_seconds
+    from the first attempt.
+
+    Args:
+        provider: Provider name for the circuit breaker and counters
+        func: Coroutine function performing one attempt (raises on failure)
+        *args: Positional arguments for func
+        classify: Decides which errors are retried (defaults to classify_error)
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+
+    Raises:
+        CircuitOpenError: If the provider's circuit is open
+        Exception: The last error once retries are exhausted or it is not retryable
+    """
+    deadline = time.monotonic() + settings.retry_deadline_seconds
+    attempt = 0
+    while True:
+        _before_attempt(provider)
+        attempt += 1
+
+        start = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            PROVIDER_LATENCY.labels(provider, "error").observe(time.perf_counter() - start)
+            delay = _after_failure(provider, attempt, e, classify, deadline)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            continue
+
+        PROVIDER_LATENCY.labels(provider, "success").observe(time.perf_counter() - start)
+        _increment(provider, "successes")
+        get_circuit_breaker(provider).record_success()
+        return result
@@ -1,10 +1,11 @@
 """Slack integration for delivering weekly briefs."""
 
 import logging
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from src.config import get_settings
+from src.insight.modules.clients import get_slack_client
+from src.insight.modules.resilience import CircuitOpenError, call_with_retry, classify_unsent_error
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -31,14 +32,17 @@ def send_slack_dm(message: str, user_id: str | None = None) -> bool:
         return False
 
     try:
-        client = WebClient(token=settings.slack_bot_token)
+        client = get_slack_client(settings.slack_bot_token)
 
         # Open a DM channel with the user
-        response = client.conversations_open(users=target_user)
+        response = call_with_retry("slack", client.conversations_open, users=target_user)
         channel_id = response["channel"]["id"]
 
-        # Send the message
-        client.chat_postMessage(
+        # Send the message (not idempotent: only retried when Slack cannot have posted it)
+        call_with_retry(
+            "slack",
+            client.chat_postMessage,
+            classify=classify_unsent_error,
             channel=channel_id,
             text=message,
             mrkdwn=True
@@ -47,6 +51,9 @@ def send_slack_dm(message: str, user_id: str | None = None) -> bool:
         logger.info(f"Slack message sent successfully to {target_user}")
         return True
 
+    except CircuitOpenError as e:
+        logger.error(f"Skipping Slack delivery: {e}")
+        return False
     except SlackApiError as e:
         logger.error(f"Slack API error: {e.response['error']}")
         return False
@@ -59,7 +66,8 @@ def send_weekly_brief(
     markdown_brief: str,
     watchlist: list[str],
     week_start: str,
-    week_end: str
+    week_end: str,
+    user_id: str | None = None
 ) -> bool:
     """
     Send formatted weekly brief via Slack.
@@ -69,6 +77,7 @@ def send_weekly_brief(
         watchlist: List of watchlist items
         week_start: Week start date string
         week_end: Week end date string
+        user_id: Slack user ID of the recipient (defaults to config)
 
     Returns:
         True if successful, False otherwise
@@ -89,4 +98,4 @@ _{week_start} to {week_end}_
 _Generated automatically by the Weekly Strategic Insight Engine_
 """
 
-    return send_slack_dm(full_message)
+    return send_slack_dm(full_message, user_id)
@@ -0,0 +1,372 @@
+"""Dependency-graph stage runner for the processing pipelines."""
+
+import asyncio
+import json
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+class StopPipeline(Exception):
+    """Raised by a stage to end the run early without an error (e.g. no events)."""
+
+
+class Stage:
+    """A pipeline stage and the stages whose results it needs."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        deps: Tuple[str, ...] = (),
+        resource: str | None = None,
+        dump: Callable[[Any], Any] | None = None,
+        restore: Callable[[Any], Any] | None = None,
+        rows: Callable[[Any], int] | None = None
+    ):
+        """
+        Args:
+            name: Unique stage name
+            func: Callable (sync or async) receiving the results of completed stages
+            deps: Names of stages that must finish first
+            resource: Stages sharing a resource (e.g. "db") never run at the same time
+            dump: Converts the stage result to a JSON checkpoint (None result = don't save)
+            restore: Rebuilds the stage result from a checkpoint
+            rows: Counts the rows a stage result holds (for profiling)
+        """
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.resource = resource
+        self.dump = dump
+        self.restore = restore
+        self.rows = rows
+
+    @property
+    def checkpointed(self) -> bool:
+        return self.dump is not None and self.restore is not None
+
+
+class PipelineRun:
+    """Results and timings of a pipeline run."""
+
+    def __init__(self):
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.restored: List[str] = []
+        self.skipped: List[str] = []
+        self.stopped_reason: str | None = None
+        self.wall_seconds: float = 0.0
+        self.critical_path: List[str] = []
+        self.critical_path_seconds: float = 0.0
+
+    @property
+    def stopped(self) -> bool:
+        return self.stopped_reason is not None
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None where unavailable)."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _call_with_cpu_time(func: Callable[[Dict[str, Any]], Any], results: Dict[str, Any]) -> Tuple[Any, float]:
+    # Runs in the worker thread, so thread_time only counts this stage's CPU work
+    cpu_start = time.thread_time()
+    result = func(results)
+    return result, time.thread_time() - cpu_start
+
+
+def topological_order(stages: List[Stage]) -> List[Stage]:
+    """
+    Order stages so every stage comes after its dependencies.
+
+    Args:
+        stages: Pipeline stages
+
+    Returns:
+        Stages in dependency order (stable with respect to the input order)
+
+    Raises:
+        ValueError: On unknown dependencies, duplicate names or cycles
+    """
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate stage name: {stage.name}")
+        by_name[stage.name] = stage
+
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"Stage {stage.name} depends on unknown stage {dep}")
+
+    ordered = []
+    placed = set()
+    while len(ordered) < len(stages):
+        ready = [s for s in stages if s.name not in placed and all(d in placed for d in s.deps)]
+        if not ready:
+            raise ValueError("Pipeline stages contain a dependency cycle")
+        for stage in ready:
+            ordered.append(stage)
+            placed.add(stage.name)
+
+    return ordered
+
+
+def compute_critical_path(stages: List[Stage], timings: Dict[str, Dict[str, float]]) -> Tuple[List[str], float]:
+    """
+    Find the longest chain of dependent stages by measured duration.
+
+    Args:
+        stages: Pipeline stages
+        timings: Per-stage timings with a "duration" entry
+
+    Returns:
+        (Stage names along the critical path, total seconds)
+    """
+    longest = {}
+    previous = {}
+
+    for stage in topological_order(stages):
+        if stage.name not in timings:
+            continue
+
+        best_dep, best_seconds = None, 0.0
+        for dep in stage.deps:
+            if dep in longest and longest[dep] > best_seconds:
+                best_dep, best_seconds = dep, longest[dep]
+
+        longest[stage.name] = best_seconds + timings[stage.name]["duration"]
+        previous[stage.name] = best_dep
+
+    if not longest:
+        return [], 0.0
+
+    name = max(longest, key=longest.get)
+    total = longest[name]
+
+    path = []
+    while name is not None:
+        path.append(name)
+        name = previous[name]
+
+    return list(reversed(path)), total
+
+
+def descendants(stages: List[Stage], name: str) -> List[str]:
+    """
+    Find a stage and every stage that depends on it, directly or indirectly.
+
+    Args:
+        stages: Pipeline stages
+        name: Stage name
+
+    Returns:
+        Stage names in dependency order, starting with name
+    """
+    affected = {name}
+    for stage in topological_order(stages):
+        if any(dep in affected for dep in stage.deps):
+            affected.add(stage.name)
+
+    return [s.name for s in topological_order(stages) if s.name in affected]
+
+
+def plan_stages(
+    stages: List[Stage],
+    restorable: set,
+    targets: List[str] | None = None
+) -> Tuple[List[Stage], List[Stage]]:
+    """
+    Decide which stages to restore from checkpoints and which to execute.
+
+    Target stages (by default the sinks) always count as required. A restored
+    stage no longer needs its dependencies, so upstream work is only executed
+    when a stage that actually runs depends on it.
+
+    Args:
+        stages: Pipeline stages
+        restorable: Names of stages with a usable checkpoint
+        targets: Stages whose results are wanted (None = stages nothing depends on)
+
+    Returns:
+        (Stages to restore, stages to execute), each in dependency order
+    """
+    ordered = topological_order(stages)
+    dependents = {s.name: [] for s in ordered}
+    for stage in ordered:
+        for dep in stage.deps:
+            dependents[dep].append(stage.name)
+
+    if targets is None:
+        targets = [name for name, users in dependents.items() if not users]
+    else:
+        unknown = [name for name in targets if name not in dependents]
+        if unknown:
+            raise ValueError(f"Unknown target stages: {', '.join(unknown)}")
+
+    required = set()
+    executing = set()
+    for stage in reversed(ordered):
+        if stage.name in targets or any(d in executing for d in dependents[stage.name]):
+            required.add(stage.name)
+            if stage.name not in restorable:
+                executing.add(stage.name)
+
+    to_restore = [s for s in ordered if s.name in required and s.name in restorable]
+    to_execute = [s for s in ordered if s.name in executing]
+    return to_restore, to_execute
+
+
+async def _execute_stage(
+    stage: Stage,
+    run: PipelineRun,
+    origin: float,
+    locks: Dict[str, asyncio.Lock],
+    checkpoints: Any = None
+) -> None:
+    lock = None
+    if stage.resource:
+        lock = locks.setdefault(stage.resource, asyncio.Lock())
+        await lock.acquire()
+
+    try:
+        logger.info(f"Stage {stage.name} started")
+        rss_start = peak_rss_mb()
+        start = time.perf_counter()
+
+        if asyncio.iscoroutinefunction(stage.func):
+            # Event-loop CPU time, which includes other coroutines resumed meanwhile
+            cpu_start = time.thread_time()
+            result = await stage.func(run.results)
+            cpu_seconds = time.thread_time() - cpu_start
+        else:
+            # Blocking work runs in a worker thread so independent stages overlap
+            result, cpu_seconds = await asyncio.to_thread(_call_with_cpu_time, stage.func, run.results)
+
+        end = time.perf_counter()
+        rss_end = peak_rss_mb()
+    finally:
+        if lock:
+            lock.release()
+
+    run.results[stage.name] = result
+    run.timings[stage.name] = {
+        "start": round(start - origin, 4),
+        "end": round(end - origin, 4),
+        "duration": round(end - start, 4),
+        "cpu_seconds": round(cpu_seconds, 4),
+        # Growth of the process-wide high-water mark, so overlapping stages share it
+        "peak_rss_delta_mb": round(rss_end - rss_start, 2) if rss_start is not None else None,
+        "rows": stage.rows(result) if stage.rows else None
+    }
+    logger.info(f"Stage {stage.name} finished in {end - start:.2f}s")
+    logger.info("stage_profile " + json.dumps({"stage": stage.name, **run.timings[stage.name]}))
+
+    if checkpoints is not None and stage.checkpointed:
+        payload = stage.dump(result)
+        if payload is not None:
+            await asyncio.to_thread(checkpoints.save, stage.name, payload)
+
+
+async def run_pipeline(
+    stages: List[Stage],
+    concurrent: bool = True,
+    checkpoints: Any = None,
+    resume: bool = False,
+    from_stage: str | None = None,
+    targets: List[str] | None = None
+) -> PipelineRun:
+    """
+    Run pipeline stages respecting their dependencies.
+
+    Args:
+        stages: Pipeline stages
+        concurrent: Run independent stages concurrently (False runs them one by one)
+        checkpoints: Store with load_all(), save(stage, payload) and delete(stages);
+            completed checkpointed stages are saved to it when given
+        resume: Restore completed stages from checkpoints instead of rerunning them
+        from_stage: Recompute this stage and everything downstream of it
+            (earlier stages are restored from checkpoints where possible)
+        targets: Only run what these stages need (None = the whole pipeline)
+
+    Returns:
+        PipelineRun with results, timings and the critical path
+    """
+    by_name = {s.name: s for s in topological_order(stages)}
+    run = PipelineRun()
+    locks: Dict[str, asyncio.Lock] = {}
+    origin = time.perf_counter()
+
+    payloads: Dict[str, Any] = {}
+    if checkpoints is not None and not (resume or from_stage):
+        # A fresh run must not leave stale downstream checkpoints behind
+        await asyncio.to_thread(checkpoints.delete, list(by_name))
+    elif checkpoints is not None:
+        if from_stage is not None:
+            if from_stage not in by_name:
+                raise ValueError(f"Unknown stage: {from_stage}")
+            invalidated = descendants(stages, from_stage)
+            await asyncio.to_thread(checkpoints.delete, invalidated)
+            logger.info(f"Recomputing from stage {from_stage}: {', '.join(invalidated)}")
+
+        payloads = await asyncio.to_thread(checkpoints.load_all)
+        payloads = {name: p for name, p in payloads.items() if name in by_name and by_name[name].checkpointed}
+
+    to_restore, to_execute = plan_stages(stages, set(payloads), targets)
+
+    for stage in to_restore:
+        run.results[stage.name] = stage.restore(payloads[stage.name])
+        run.restored.append(stage.name)
+    run.skipped = [name for name in by_name if name not in run.results and all(s.name != name for s in to_execute)]
+
+    if run.restored:
+        logger.info(f"Restored from checkpoints: {', '.join(run.restored)}")
+
+    try:
+        if concurrent:
+            tasks: Dict[str, asyncio.Task] = {}
+
+            async def run_when_ready(stage: Stage) -> None:
+                pending = [tasks[dep] for dep in stage.deps if dep in tasks]
+                if pending:
+                    await asyncio.gather(*pending)
+                await _execute_stage(stage, run, origin, locks, checkpoints)
+
+            for stage in to_execute:
+                tasks[stage.name] = asyncio.create_task(run_when_ready(stage), name=stage.name)
+
+            try:
+                await asyncio.gather(*tasks.values())
+            except BaseException:
+                for task in tasks.values():
+                    task.cancel()
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+                raise
+        else:
+            for stage in to_execute:
+                await _execute_stage(stage, run, origin, locks, checkpoints)
+
+    except StopPipeline as e:
+        run.stopped_reason = str(e)
+        logger.warning(f"Pipeline stopped early: {e}")
+
+    run.wall_seconds = round(time.perf_counter() - origin, 4)
+    run.critical_path, run.critical_path_seconds = compute_critical_path(stages, run.timings)
+    run.critical_path_seconds = round(run.critical_path_seconds, 4)
+
+    return run
@@ -0,0 +1,277 @@
+"""Per-tenant, per-period run guard: Postgres advisory lock plus run state with heartbeats."""
+
+import os
+import socket
+import logging
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict
+from sqlalchemy import text
+
+from src import database
+from src.config import get_settings
+from src.database import get_db_context
+from src.models import OutPipelineRun
+from src.insight.pipeline import PipelineRun
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# First key of the two-key advisory lock, one namespace per kind of run
+RUN_LOCK_NAMESPACES = {"weekly": 5715275, "daily": 5715276}
+
+# Second key: the tenant and period hashed into one 32-bit value (a rare hash
+# collision only makes two unrelated runs take turns)
+RUN_LOCK_KEY_SQL = "hashtext(:tenant_id || ':' || :period)"
+
+
+class RunLockError(Exception):
+    """Raised when the run lock for a period could not be acquired in time."""
+
+
+class RunGuard:
+    """
+    Ensures only one pipeline run per tenant and period (week or day) at a time.
+
+    The lock is a session-level advisory lock on a dedicated connection, so
+    Postgres releases it if the process dies. Run state is recorded in
+    out_pipeline_runs and refreshed by a heartbeat thread while running.
+    """
+
+    def __init__(self, period_start: date, kind: str = "weekly", tenant_id: str | None = None):
+        """
+        Args:
+            period_start: First day of the week or the day being processed
+            kind: "weekly" or "daily"
+            tenant_id: Tenant being processed (defaults to default_tenant_id)
+        """
+        self.period_start = period_start
+        self.kind = kind
+        self.tenant_id = tenant_id or settings.default_tenant_id
+        self.run_id = None
+        self._connection = None
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat_thread = None
+
+    def try_lock(self) -> bool:
+        """Try to take the period's lock without waiting."""
+        connection = database.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        acquired = connection.execute(
+            text(f"SELECT pg_try_advisory_lock(:namespace, {RUN_LOCK_KEY_SQL})"),
+            self._lock_params()
+        ).scalar()
+
+        if acquired:
+            self._connection = connection
+        else:
+            connection.close()
+
+        return bool(acquired)
+
+    def lock(self, timeout: float) -> bool:
+        """
+        Wait for the period's lock.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the lock was acquired
+        """
+        deadline = time.monotonic() + timeout
+        while not self.try_lock():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(settings.run_lock_poll_seconds)
+
+        return True
+
+    def unlock(self) -> None:
+        """Release the lock (closing the connection releases it as well)."""
+        if self._connection is None:
+            return
+
+        try:
+            self._connection.execute(
+                text(f"SELECT pg_advisory_unlock(:namespace, {RUN_LOCK_KEY_SQL})"),
+                self._lock_params()
+            )
+        finally:
+            self._connection.close()
+            self._connection = None
+
+    def start(self) -> None:
+        """Record a running run and start heartbeats. Requires the lock."""
+        with get_db_context() as db:
+            # Holding the lock means no other run is alive; rows still marked
+            # running belong to a process that died
+            abandoned = db.query(OutPipelineRun).filter(
+                OutPipelineRun.tenant_id == self.tenant_id,
+                OutPipelineRun.kind == self.kind,
+                OutPipelineRun.period_start == self.period_start,
+                OutPipelineRun.status == "running"
+            ).update(
+                {"status": "failed", "finished_at": datetime.utcnow(), "detail": "Abandoned (process exited)"},
+                synchronize_session=False
+            )
+            if abandoned:
+                logger.warning(
+                    f"Marked {abandoned} abandoned {self.kind} run(s) for {self.tenant_id}/{self.period_start} as failed"
+                )
+
+            run = OutPipelineRun(
+                tenant_id=self.tenant_id,
+                kind=self.kind,
+                period_start=self.period_start,
+                status="running",
+                host=socket.gethostname(),
+                pid=os.getpid()
+            )
+            db.add(run)
+            db.flush()
+            self.run_id = run.run_id
+
+        self._stop_heartbeat.clear()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat, daemon=True)
+        self._heartbeat_thread.start()
+        logger.info(f"Run {self.run_id} ({self.kind}) started for {self.tenant_id}/{self.period_start}")
+
+    def finish(self, status: str, detail: str | None = None) -> None:
+        """
+        Record the final run state, stop heartbeats and release the lock.
+
+        Args:
+            status: "completed" or "failed"
+            detail: Error message or reason the run stopped early
+        """
+        self._stop_heartbeat.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join()
+
+        try:
+            if self.run_id is not None:
+                with get_db_context() as db:
+                    db.query(OutPipelineRun).filter(OutPipelineRun.run_id == self.run_id).update(
+                        {"status": status, "finished_at": datetime.utcnow(), "detail": detail},
+                        synchronize_session=False
+                    )
+                logger.info(f"Run {self.run_id} {status}")
+        finally:
+            self.unlock()
+
+    def latest_run(self) -> Dict[str, Any] | None:
+        """Status, detail and timestamps of the most recent run for the period."""
+        with get_db_context() as db:
+            run = db.query(OutPipelineRun).filter(
+                OutPipelineRun.tenant_id == self.tenant_id,
+                OutPipelineRun.kind == self.kind,
+                OutPipelineRun.period_start == self.period_start
+            ).order_by(OutPipelineRun.started_at.desc()).first()
+
+            if run is None:
+                return None
+
+            return {
+                "run_id": str(run.run_id),
+                "status": run.status,
+                "host": run.host,
+                "pid": run.pid,
+                "heartbeat_at": run.heartbeat_at,
+                "finished_at": run.finished_at,
+                "detail": run.detail
+            }
+
+    def _lock_params(self) -> Dict[str, Any]:
+        return {
+            "namespace": RUN_LOCK_NAMESPACES[self.kind],
+            "tenant_id": self.tenant_id,
+            "period": self.period_start.isoformat()
+        }
+
+    def _heartbeat(self) -> None:
+        while not self._stop_heartbeat.wait(settings.run_heartbeat_seconds):
+            try:
+                with get_db_context() as db:
+                    db.query(OutPipelineRun).filter(OutPipelineRun.run_id == self.run_id).update(
+                        {"heartbeat_at": datetime.utcnow()}, synchronize_session=False
+                    )
+            except Exception as e:
+                logger.warning(f"Heartbeat for run {self.run_id} failed: {e}")
+
+
+def run_exclusive(
+    guard: RunGuard,
+    execute: Callable[[], PipelineRun],
+    on_conflict: str | None = None,
+    attach: Callable[[], PipelineRun] | None = None,
+    execute_resumed: Callable[[], PipelineRun] | None = None
+) -> PipelineRun:
+    """
+    Run execute() while holding the guard's lock and record the run state.
+
+    After waiting, the period is not processed again if the other run
+    completed: the result comes from attach() (or is a stopped run). If it
+    did not complete, execute_resumed() continues from its checkpoints.
+
+    Args:
+        guard: Guard of the period
+        execute: Runs the pipeline and returns its PipelineRun
+        on_conflict: What to do if another run holds the period: "exit" returns
+            a stopped run, "wait" waits and then runs unless the other run
+            completed, "attach" waits and returns attach() (defaults to
+            run_lock_on_conflict)
+        attach: Builds the result from the other run (required for "attach")
+        execute_resumed: Like execute, but skipping stages the other run
+            completed (defaults to execute)
+
+    Returns:
+        PipelineRun
+
+    Raises:
+        RunLockError: If waiting for the lock timed out
+    """
+    on_conflict = on_conflict or settings.run_lock_on_conflict
+    period = f"{guard.kind} period {guard.period_start} of tenant {guard.tenant_id}"
+
+    if not guard.try_lock():
+        latest = guard.latest_run()
+        holder = f"{latest['host']}:{latest['pid']}" if latest else "unknown"
+
+        if on_conflict == "exit":
+            logger.warning(f"The {period} is already being processed by {holder}, exiting")
+            run = PipelineRun()
+            run.stopped_reason = f"The {period} is already being processed by {holder}"
+            return run
+
+        logger.info(f"The {period} is being processed by {holder}, waiting ({on_conflict})")
+        if not guard.lock(settings.run_lock_wait_seconds):
+            raise RunLockError(f"Timed out waiting for the run lock of the {period}")
+
+        if on_conflict == "attach" and attach is not None:
+            guard.unlock()
+            return attach()
+
+        latest = guard.latest_run()
+        if latest is not None and latest["status"] == "completed":
+            guard.unlock()
+            logger.info(f"The {period} was completed by run {latest['run_id']} while waiting")
+            if attach is not None:
+                return attach()
+            run = PipelineRun()
+            run.stopped_reason = f"The {period} was completed by run {latest['run_id']}"
+            return run
+
+        if execute_resumed is not None:
+            logger.info(f"Resuming the {period} from the checkpoints of the run that did not complete")
+            execute = execute_resumed
+
+    try:
+        guard.start()
+        run = execute()
+    except BaseException as e:
+        guard.finish("failed", str(e) or type(e).__name__)
+        raise
+
+    guard.finish("completed", run.stopped_reason)
+    return run
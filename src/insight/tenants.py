@@ -0,0 +1,82 @@
+"""Tenant lookup and failure-isolated processing of several tenants."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from src.config import get_settings
+from src.database import get_db_context
+from src.models import CoreTenant
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def get_active_tenants() -> List[str]:
+    """IDs of the active tenants, in ID order."""
+    with get_db_context() as db:
+        rows = db.query(CoreTenant.tenant_id).filter(CoreTenant.active.is_(True)).order_by(CoreTenant.tenant_id)
+        return [tenant_id for (tenant_id,) in rows]
+
+
+def get_tenant_slack_user(tenant_id: str) -> str | None:
+    """
+    Slack user who receives a tenant's weekly brief.
+
+    Only the default tenant falls back to slack_user_id, so a tenant without a
+    recipient of its own never has its brief sent to someone else's DMs.
+
+    Args:
+        tenant_id: Tenant
+
+    Returns:
+        Slack user ID, or None if the tenant has no recipient
+    """
+    with get_db_context() as db:
+        tenant = db.query(CoreTenant).filter(CoreTenant.tenant_id == tenant_id).first()
+        if tenant is not None and tenant.slack_user_id:
+            return tenant.slack_user_id
+
+    if tenant_id == settings.default_tenant_id:
+        return settings.slack_user_id
+
+    return None
+
+
+def run_for_tenants(
+    func: Callable[[str], Any],
+    tenants: List[str],
+    concurrency: int | None = None
+) -> Dict[str, Any]:
+    """
+    Call func(tenant_id) for every tenant, a few tenants at a time.
+
+    Tenants run in threads of this process, so they share the embedding model
+    and the pooled HTTP clients. An exception only fails its own tenant: it is
+    logged and returned in place of the result.
+
+    Args:
+        func: Processes one tenant
+        tenants: Tenant IDs
+        concurrency: Tenants processed at the same time (defaults to tenant_concurrency)
+
+    Returns:
+        Dictionary mapping tenant ID to func's result or the exception it raised,
+        in the order of tenants
+    """
+    concurrency = max(1, concurrency or settings.tenant_concurrency)
+
+    def run_one(tenant_id: str) -> Any:
+        try:
+            return func(tenant_id)
+        except Exception as e:
+            logger.error(f"Processing failed for tenant {tenant_id}: {e}", exc_info=True)
+            return e
+
+    if not tenants:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(tenants)), thread_name_prefix="tenant") as pool:
+        results = list(pool.map(run_one, tenants))
+
+    return dict(zip(tenants, results))
@@ -0,0 +1,683 @@
+"""Weekly processing pipeline: stage definitions and orchestration."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import UUID
+import numpy as np
+
+from src.archive import load_events as load_hot_and_cold_events
+from src.config import get_settings
+from src.database import get_db_context, get_read_db_context
+from src.models import CoreEvent, OutWeeklyBrief
+from src.schemas import LLMEnhancedOutput
+from src.insight.pipeline import PipelineRun, Stage, StopPipeline, run_pipeline
+from src.insight.checkpoints import CheckpointStore
+from src.insight.daily import ensure_daily_rollups
+from src.insight.run_guard import RunGuard, run_exclusive
+from src.insight.tenants import get_tenant_slack_user, run_for_tenants
+from src.insight.modules.embeddings import generate_embeddings_for_events, get_embedding_model
+from src.insight.modules.clustering import cluster_events, process_clusters_to_topics
+from src.insight.modules.metrics import (
+    compute_metrics, compute_deltas, get_topic_metrics,
+    merge_rollups, metrics_from_rollup, merge_topic_rollups, topic_metrics_from_rollups
+)
+from src.insight.modules.rules import apply_rules
+from src.insight.modules.llm import enhance_with_llm, enhance_with_llm_hedged
+from src.insight.modules.clients import close_async_clients
+from src.insight.modules.resilience import get_resilience_counters
+from src.insight.modules.reports import (
+    generate_markdown_brief, generate_watchlist, generate_audit_bundle, generate_llm_audit,
+    generate_performance_audit
+)
+from src.insight.modules.slack import send_weekly_brief
+from src.telemetry import record_pipeline_run
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+WEEKLY_STAGE_NAMES = [
+    "load_events", "embeddings", "cluster", "topics", "rollups", "metrics", "topic_metrics",
+    "rules", "llm", "draft_reports", "reports", "store", "slack"
+]
+
+
+def compute_windows(now: datetime | None = None) -> Dict[str, datetime]:
+    """
+    Compute week and baseline windows ending at the most recent UTC midnight.
+
+    Args:
+        now: Reference time (defaults to current UTC time)
+
+    Returns:
+        Dictionary with week_start, week_end and baseline_start
+    """
+    now = now or datetime.utcnow()
+    week_end = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_start = week_end - timedelta(days=7)
+    baseline_start = week_start - timedelta(days=28)
+
+    return {
+        "week_start": week_start,
+        "week_end": week_end,
+        "baseline_start": baseline_start
+    }
+
+
+def split_events(events: List[CoreEvent], week_start: datetime) -> Tuple[List[CoreEvent], List[CoreEvent]]:
+    """
+    Split events loaded for the whole baseline + week range at week_start.
+
+    Args:
+        events: Events from baseline_start to week_end
+        week_start: Start of the current week (naive UTC)
+
+    Returns:
+        (Week events, baseline events)
+    """
+    week_start_utc = week_start.replace(tzinfo=timezone.utc)
+    week_events, baseline_events = [], []
+
+    for event in events:
+        timestamp = event.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+        if timestamp >= week_start_utc:
+            week_events.append(event)
+        else:
+            baseline_events.append(event)
+
+    return week_events, baseline_events
+
+
+def build_weekly_stages(
+    db,
+    windows: Dict[str, datetime],
+    refresh_llm: bool = False,
+    send_slack: bool = True,
+    from_rollups: bool | None = None,
+    tenant_id: str | None = None
+) -> List[Stage]:
+    """
+    Build the weekly pipeline as a dependency graph of stages.
+
+    Metrics run alongside embedding/clustering, and the fallback Markdown,
+    watchlist and audit drafts are prepared while the LLM request is in flight.
+    Database stages share one session and are serialized on the "db" resource.
+
+    In daily mode the event, embedding, clustering and metrics stages are
+    replaced by a "rollups" stage that merges the stored daily rollups.
+
+    Args:
+        db: Database session
+        windows: Time windows from compute_windows
+        refresh_llm: Bypass the LLM response cache
+        send_slack: Include the Slack delivery stage
+        from_rollups: Assemble from daily rollups (defaults to processing_mode == "daily")
+        tenant_id: Tenant whose events are processed (defaults to default_tenant_id)
+
+    Returns:
+        List of pipeline stages
+    """
+    tenant_id = tenant_id or settings.default_tenant_id
+    week_start = windows["week_start"]
+    week_end = windows["week_end"]
+    baseline_start = windows["baseline_start"]
+
+    if from_rollups is None:
+        from_rollups = settings.processing_mode == "daily"
+
+    # Step 2 (daily mode): Merge daily rollups, processing any days not yet rolled up
+    def rollups(results: Dict[str, Any]) -> Dict[str, Any]:
+        daily = ensure_daily_rollups(
+            baseline_start.date(), week_end.date(), topics_from=week_start.date(), tenant_id=tenant_id
+        )
+        week_days = [d for d in daily if d >= week_start.date()]
+        baseline_days = [d for d in daily if d < week_start.date()]
+
+        week = merge_rollups([daily[d]["metrics"] for d in week_days])
+        if week["total_events"] == 0:
+            raise StopPipeline("No events in current week, skipping processing")
+
+        return {
+            "week": week,
+            "baseline": merge_rollups([daily[d]["metrics"] for d in baseline_days]),
+            "topics": merge_topic_rollups([daily[d]["topics"] for d in week_days])
+        }
+
+    # Step 6 (daily mode): Metrics from the merged rollups
+    def metrics_from_rollups(results: Dict[str, Any]) -> Dict[str, Any]:
+        week_metrics = metrics_from_rollup(results["rollups"]["week"])
+        baseline_metrics = metrics_from_rollup(results["rollups"]["baseline"])
+        deltas = compute_deltas(week_metrics, baseline_metrics)
+
+        return {"week": week_metrics, "baseline": baseline_metrics, "deltas": deltas}
+
+    # Step 7 (daily mode): Topic metrics from the merged rollups
+    def topic_metrics_from_daily(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return topic_metrics_from_rollups(results["rollups"]["topics"], as_of=week_end)
+
+    # Step 2: Load events (one query for baseline + week, split in memory), from the
+    # read replica once it has replayed the whole window
+    def load_events(results: Dict[str, Any]) -> Dict[str, List[CoreEvent]]:
+        with get_read_db_context(required_as_of=week_end, primary=db) as read_db:
+            events = load_hot_and_cold_events(read_db, baseline_start, week_end, tenant_id)
+        week_events, baseline_events = split_events(events, week_start)
+
+        logger.info(f"Loaded {len(week_events)} week events, {len(baseline_events)} baseline events")
+
+        if len(week_events) == 0:
+            raise StopPipeline("No events in current week, skipping processing")
+
+        return {"week": week_events, "baseline": baseline_events}
+
+    # Step 3: Generate missing embeddings for this week's events, on the loaded objects
+    def embeddings(results: Dict[str, Any]) -> int:
+        return generate_embeddings_for_events(db, results["load_events"]["week"])
+
+    # Step 4: Cluster week events (labels keyed by event ID so they survive a reload)
+    def cluster(results: Dict[str, Any]) -> Dict[str, int]:
+        week_events = results["load_events"]["week"]
+        week_embeddings = np.array([event.embedding for event in week_events])
+        labels = cluster_events(week_embeddings)
+        return {event.id: int(label) for event, label in zip(week_events, labels)}
+
+    # Step 5: Process clusters to topics
+    def topics(results: Dict[str, Any]) -> Dict[str, UUID]:
+        week_events = results["load_events"]["week"]
+        labels = np.array([results["cluster"].get(event.id, -1) for event in week_events])
+        return process_clusters_to_topics(week_events, labels, db, tenant_id)
+
+    # Step 6: Compute metrics
+    def metrics(results: Dict[str, Any]) -> Dict[str, Any]:
+        week_metrics = compute_metrics(results["load_events"]["week"])
+        baseline_metrics = compute_metrics(results["load_events"]["baseline"])
+        deltas = compute_deltas(week_metrics, baseline_metrics)
+
+        return {"week": week_metrics, "baseline": baseline_metrics, "deltas": deltas}
+
+    # Step 7: Get topic metrics. The topics stage has just written this run's topics,
+    # which a replica may not have received yet, so they are read from the primary
+    def topic_metrics(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return get_topic_metrics(db, results["load_events"]["week"], results["topics"], as_of=week_end)
+
+    # Step 8: Apply rules
+    def rules(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        m = results["metrics"]
+        findings = apply_rules(m["week"], m["baseline"], m["deltas"], results["topic_metrics"])
+
+        logger.info(f"Generated {len(findings)} findings:")
+        for finding in findings:
+            logger.info(f"  - [{finding.severity}] {finding.finding_type}: {finding.description}")
+
+        return [f.to_dict() for f in findings]
+
+    # Step 9: Enhance with LLM
+    async def llm(results: Dict[str, Any]) -> Dict[str, Any]:
+        m = results["metrics"]
+        args = (m["week"], m["baseline"], m["deltas"], results["topic_metrics"], results["rules"])
+
+        hedge = None
+        if settings.llm_hedging_enabled:
+            output, used, model, response_id, hedge = await enhance_with_llm_hedged(
+                *args, refresh=refresh_llm
+            )
+        else:
+            output, used, model, response_id = await asyncio.to_thread(
+                enhance_with_llm, *args, refresh=refresh_llm
+            )
+
+        if used:
+            logger.info(f"LLM enhancement successful with {model}")
+        else:
+            logger.info("Proceeding without LLM enhancement")
+
+        return {"output": output, "used": used, "model": model, "response_id": response_id, "hedge": hedge}
+
+    # Step 10a: Rule-based drafts, prepared while the LLM call is in flight
+    def draft_reports(results: Dict[str, Any]) -> Dict[str, Any]:
+        m = results["metrics"]
+        findings = results["rules"]
+
+        return {
+            "markdown": generate_markdown_brief(
+                week_start, week_end, m["week"], m["deltas"], results["topic_metrics"], findings
+            ),
+            "watchlist": generate_watchlist(results["topic_metrics"], findings),
+            "audit": generate_audit_bundle(
+                week_start, week_end, baseline_start, m["week"], m["baseline"], m["deltas"],
+                results["topic_metrics"], findings, False, None, None
+            )
+        }
+
+    # Step 10b: Final reports
+    def reports(results: Dict[str, Any]) -> Dict[str, Any]:
+        llm_result = results["llm"]
+        drafts = results["draft_reports"]
+        audit = drafts["audit"]
+        audit["llm_enhancement"] = generate_llm_audit(
+            llm_result["used"], llm_result["model"], llm_result["response_id"], llm_result["hedge"]
+        )
+
+        if not llm_result["output"]:
+            return {"markdown": drafts["markdown"], "watchlist": drafts["watchlist"], "audit": audit}
+
+        m = results["metrics"]
+        return {
+            "markdown": generate_markdown_brief(
+                week_start, week_end, m["week"], m["deltas"], results["topic_metrics"],
+                results["rules"], llm_result["output"]
+            ),
+            "watchlist": generate_watchlist(results["topic_metrics"], results["rules"], llm_result["output"]),
+            "audit": audit
+        }
+
+    # Step 11: Store in database
+    def store(results: Dict[str, Any]) -> bool:
+        report = results["reports"]
+        llm_result = results["llm"]
+
+        brief = OutWeeklyBrief(
+            tenant_id=tenant_id,
+            week_start=week_start.date(),
+            week_end=week_end.date(),
+            markdown=report["markdown"],
+            watchlist_json=report["watchlist"],
+            audit_json=report["audit"],
+            openai_used=llm_result["used"],
+            openai_model=llm_result["model"],
+            openai_response_id=llm_result["response_id"]
+        )
+
+        # Check if brief already exists
+        existing_brief = db.query(OutWeeklyBrief).filter(
+            OutWeeklyBrief.tenant_id == tenant_id,
+            OutWeeklyBrief.week_start == week_start.date()
+        ).first()
+
+        if existing_brief:
+            logger.info("Updating existing brief")
+            existing_brief.week_end = week_end.date()
+            existing_brief.markdown = report["markdown"]
+            existing_brief.watchlist_json = report["watchlist"]
+            existing_brief.audit_json = report["audit"]
+            existing_brief.openai_used = llm_result["used"]
+            existing_brief.openai_model = llm_result["model"]
+            existing_brief.openai_response_id = llm_result["response_id"]
+        else:
+            logger.info("Creating new brief")
+            db.add(brief)
+
+        db.commit()
+        return True
+
+    # Step 12: Send to Slack
+    def slack(results: Dict[str, Any]) -> bool:
+        report = results["reports"]
+        user_id = get_tenant_slack_user(tenant_id)
+        if user_id is None:
+            logger.warning(f"Tenant {tenant_id} has no Slack recipient, skipping delivery")
+            return False
+
+        slack_success = send_weekly_brief(
+            report["markdown"],
+            report["watchlist"],
+            week_start.strftime('%Y-%m-%d'),
+            week_end.strftime('%Y-%m-%d'),
+            user_id
+        )
+
+        if slack_success:
+            logger.info("Slack delivery successful")
+        else:
+            logger.warning("Slack delivery failed (check configuration)")
+
+        return slack_success
+
+    if from_rollups:
+        stages = [
+            Stage("rollups", rollups, rows=_metrics_rows),
+            Stage(
+                "metrics", metrics_from_rollups, deps=("rollups",),
+                dump=_as_is, restore=_as_is, rows=_metrics_rows
+            ),
+            Stage(
+                "topic_metrics", topic_metrics_from_daily, deps=("rollups",),
+                dump=_as_is, restore=_as_is, rows=len
+            ),
+        ]
+    else:
+        stages = [
+            Stage(
+                "load_events", load_events, resource="db",
+                rows=lambda events: len(events["week"]) + len(events["baseline"])
+            ),
+            Stage("embeddings", embeddings, deps=("load_events",), resource="db", rows=_as_is),
+            Stage(
+                "cluster", cluster, deps=("load_events", "embeddings"),
+                dump=_as_is, restore=_as_is, rows=len
+            ),
+            Stage(
+                "topics", topics, deps=("load_events", "cluster"), resource="db",
+                dump=lambda m: {event_id: str(topic_id) for event_id, topic_id in m.items()},
+                restore=lambda p: {event_id: UUID(topic_id) for event_id, topic_id in p.items()},
+                rows=len
+            ),
+            Stage(
+                "metrics", metrics, deps=("load_events",), dump=_as_is, restore=_as_is,
+                rows=_metrics_rows
+            ),
+            Stage(
+                "topic_metrics", topic_metrics, deps=("load_events", "topics"), resource="db",
+                dump=_as_is, restore=_as_is, rows=len
+            ),
+        ]
+
+    stages += [
+        Stage("rules", rules, deps=("metrics", "topic_metrics"), dump=_as_is, restore=_as_is, rows=len),
+        Stage("llm", llm, deps=("rules",), dump=_dump_llm, restore=_restore_llm),
+        Stage("draft_reports", draft_reports, deps=("rules",)),
+        Stage("reports", reports, deps=("llm", "draft_reports"), dump=_as_is, restore=_as_is),
+        Stage(
+            "store", store, deps=("reports",), resource="db",
+            dump=lambda stored: {"stored": True}, restore=lambda p: True
+        ),
+    ]
+
+    if send_slack:
+        # Only successful deliveries are checkpointed so a resume retries failed ones
+        stages.append(Stage(
+            "slack", slack, deps=("reports",),
+            dump=lambda sent: {"sent": True} if sent else None, restore=lambda p: True
+        ))
+
+    return stages
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+def _metrics_rows(metrics: Dict[str, Any]) -> int:
+    return metrics["week"]["total_events"] + metrics["baseline"]["total_events"]
+
+
+def _dump_llm(result: Dict[str, Any]) -> Dict[str, Any] | None:
+    # Failed enhancements are retried on resume rather than frozen into the checkpoint
+    if not result["used"]:
+        return None
+    return {**result, "output": result["output"].model_dump()}
+
+
+def _restore_llm(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {**payload, "output": LLMEnhancedOutput(**payload["output"])}
+
+
+async def run_weekly_pipeline(
+    db,
+    windows: Dict[str, datetime],
+    refresh_llm: bool = False,
+    concurrent: bool = True,
+    resume: bool = False,
+    from_stage: str | None = None,
+    send_slack: bool = True,
+    targets: List[str] | None = None,
+    tenant_id: str | None = None
+) -> PipelineRun:
+    """
+    Run the weekly pipeline for one tenant and set of windows.
+
+    Stage outputs are checkpointed per tenant and week so a failed run can resume.
+
+    Args:
+        db: Database session
+        windows: Time windows from compute_windows
+        refresh_llm: Bypass the LLM response cache
+        concurrent: Run independent stages concurrently
+        resume: Skip stages completed by a previous run for the same week
+        from_stage: Recompute this stage and everything downstream of it
+        send_slack: Deliver the brief to Slack
+        targets: Only run the stages these stages need (None = the whole pipeline)
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        PipelineRun with stage results, timings and critical path
+    """
+    stages = build_weekly_stages(db, windows, refresh_llm, send_slack, tenant_id=tenant_id)
+    checkpoints = CheckpointStore(windows["week_start"].date(), tenant_id)
+
+    try:
+        run = await run_pipeline(
+            stages,
+            concurrent=concurrent,
+            checkpoints=checkpoints,
+            resume=resume,
+            from_stage=from_stage,
+            targets=targets
+        )
+    finally:
+        await close_async_clients()
+
+    logger.info(
+        f"Pipeline wall time {run.wall_seconds:.2f}s, critical path "
+        f"{' -> '.join(run.critical_path)} ({run.critical_path_seconds:.2f}s)"
+    )
+
+    for provider, counts in get_resilience_counters().items():
+        logger.info(f"Provider calls [{provider}]: {counts}")
+
+    record_pipeline_run(run, "weekly", tenant_id or settings.default_tenant_id)
+
+    if "store" in run.results:
+        record_performance(db, windows["week_start"], run, tenant_id)
+
+    return run
+
+
+def record_performance(db, week_start: datetime, run: PipelineRun, tenant_id: str | None = None) -> None:
+    """
+    Add the run's stage profile to the stored brief's audit bundle.
+
+    This happens after the pipeline finishes so storage and Slack delivery
+    are included in the profile.
+
+    Args:
+        db: Database session
+        week_start: Start of the processed week
+        run: Finished pipeline run
+        tenant_id: Tenant (defaults to default_tenant_id)
+    """
+    performance = generate_performance_audit(
+        run.timings, run.wall_seconds, run.critical_path, run.critical_path_seconds, run.restored
+    )
+
+    if "reports" in run.results:
+        run.results["reports"]["audit"]["performance"] = performance
+
+    brief = db.query(OutWeeklyBrief).filter(
+        OutWeeklyBrief.tenant_id == (tenant_id or settings.default_tenant_id),
+        OutWeeklyBrief.week_start == week_start.date()
+    ).first()
+    if brief:
+        # Reassign so the JSONB column is detected as changed
+        brief.audit_json = {**brief.audit_json, "performance": performance}
+        db.commit()
+
+
+def load_stored_brief(week_start: datetime, tenant_id: str | None = None) -> Dict[str, Any] | None:
+    """
+    Load a stored brief in the same shape as the reports stage result.
+
+    Args:
+        week_start: Start of the week
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        Dictionary with markdown, watchlist and audit, or None if not stored
+    """
+    with get_db_context() as db:
+        brief = db.query(OutWeeklyBrief).filter(
+            OutWeeklyBrief.tenant_id == (tenant_id or settings.default_tenant_id),
+            OutWeeklyBrief.week_start == week_start.date()
+        ).first()
+        if brief is None:
+            return None
+
+        return {"markdown": brief.markdown, "watchlist": brief.watchlist_json, "audit": brief.audit_json}
+
+
+def attach_to_run(guard: RunGuard, windows: Dict[str, datetime]) -> PipelineRun:
+    """
+    Build a run result from the run that just finished for the same week.
+
+    Args:
+        guard: Guard of the week (not holding the lock)
+        windows: Time windows of the week
+
+    Returns:
+        PipelineRun whose "reports" result is the stored brief, or a stopped run
+    """
+    run = PipelineRun()
+    latest = guard.latest_run()
+
+    if latest is None or latest["status"] != "completed":
+        detail = latest["detail"] if latest else "no run recorded"
+        run.stopped_reason = f"Attached run did not complete: {detail}"
+        return run
+
+    report = load_stored_brief(windows["week_start"], guard.tenant_id)
+    if report is None:
+        run.stopped_reason = latest["detail"] or "Attached run stored no brief"
+        return run
+
+    run.results["reports"] = report
+    run.restored = ["reports"]
+    logger.info(f"Attached to run {latest['run_id']} for {guard.tenant_id}/{windows['week_start'].date()}")
+    return run
+
+
+def run_guarded(
+    windows: Dict[str, datetime],
+    execute: Callable[[], PipelineRun],
+    on_conflict: str | None = None,
+    tenant_id: str | None = None,
+    execute_resumed: Callable[[], PipelineRun] | None = None
+) -> PipelineRun:
+    """
+    Run execute() while holding the tenant's run lock for the week.
+
+    Args:
+        windows: Time windows of the week
+        execute: Runs the pipeline and returns its PipelineRun
+        on_conflict: What to do if another run holds the week: "exit" returns
+            a stopped run, "wait" waits and then runs unless the other run
+            completed (its brief is returned instead), "attach" waits and
+            returns the other run's brief (defaults to run_lock_on_conflict)
+        tenant_id: Tenant (defaults to default_tenant_id)
+        execute_resumed: Runs the pipeline with resume=True, used after waiting
+            for a run that did not complete (defaults to execute)
+
+    Returns:
+        PipelineRun
+
+    Raises:
+        RunLockError: If waiting for the lock timed out
+    """
+    guard = RunGuard(windows["week_start"].date(), tenant_id=tenant_id)
+    return run_exclusive(
+        guard, execute, on_conflict, attach=lambda: attach_to_run(guard, windows), execute_resumed=execute_resumed
+    )
+
+
+def run_weekly_processing(
+    refresh_llm: bool = False,
+    concurrent: bool = True,
+    resume: bool = False,
+    from_stage: str | None = None,
+    week_end: datetime | None = None,
+    on_conflict: str | None = None,
+    tenant_id: str | None = None
+) -> PipelineRun:
+    """
+    Execute weekly processing pipeline for one tenant.
+
+    Args:
+        refresh_llm: Bypass the LLM response cache and call the providers again
+        concurrent: Run independent stages concurrently
+        resume: Skip stages completed by a previous run for the same week
+        from_stage: Recompute this stage and everything downstream of it
+        week_end: End of the week to process (defaults to the most recent UTC midnight)
+        on_conflict: "exit", "wait" or "attach" when another run holds the week
+            (defaults to run_lock_on_conflict)
+        tenant_id: Tenant (defaults to default_tenant_id)
+
+    Returns:
+        PipelineRun with stage results, timings and critical path
+    """
+    tenant_id = tenant_id or settings.default_tenant_id
+
+    logger.info("=" * 80)
+    logger.info(f"WEEKLY STRATEGIC INSIGHT ENGINE - Processing Started ({tenant_id})")
+    logger.info("=" * 80)
+
+    try:
+        # Step 1: Define time windows (UTC)
+        windows = compute_windows(week_end)
+
+        logger.info("Time windows:")
+        logger.info(f"  Week: {windows['week_start']} to {windows['week_end']}")
+        logger.info(f"  Baseline: {windows['baseline_start']} to {windows['week_start']}")
+
+        def execute(resume: bool = resume) -> PipelineRun:
+            # Loaded events are read by concurrent stages, so they must not expire on commit
+            with get_db_context(expire_on_commit=False) as db:
+                return asyncio.run(run_weekly_pipeline(
+                    db, windows, refresh_llm, concurrent, resume, from_stage, tenant_id=tenant_id
+                ))
+
+        # After waiting for a run that failed, its completed stages (topic assignment,
+        # Slack delivery) must not run twice
+        run = run_guarded(windows, execute, on_conflict, tenant_id, execute_resumed=lambda: execute(resume=True))
+
+        if not run.stopped:
+            logger.info("=" * 80)
+            logger.info(f"WEEKLY PROCESSING COMPLETED SUCCESSFULLY ({tenant_id})")
+            logger.info("=" * 80)
+
+        return run
+
+    except Exception as e:
+        logger.error(f"Error in weekly processing for {tenant_id}: {e}", exc_info=True)
+        raise
+
+
+def run_weekly_for_tenants(
+    tenants: List[str],
+    concurrency: int | None = None,
+    **options: Any
+) -> Dict[str, PipelineRun | Exception]:
+    """
+    Run weekly processing for several tenants in one process.
+
+    The embedding model is loaded once before the tenants start so they share
+    it, and a tenant that fails does not stop the others.
+
+    Args:
+        tenants: Tenant IDs
+        concurrency: Tenants processed at the same time (defaults to tenant_concurrency)
+        **options: Keyword arguments for run_weekly_processing (refresh_llm, resume, ...)
+
+    Returns:
+        Dictionary mapping tenant ID to its PipelineRun or the exception it raised
+    """
+    if len(tenants) > 1:
+        # Load the shared model once instead of racing to load it per tenant
+        get_embedding_model()
+
+    return run_for_tenants(
+        lambda tenant_id: run_weekly_processing(tenant_id=tenant_id, **options),
+        tenants,
+        concurrency
+    )
@@ -1,25 +1,38 @@
 """SQLAlchemy models for the database schema."""
 
 from sqlalchemy import (
-    Column, String, Text, Boolean, Integer, DateTime, Date,
-    ForeignKey, CheckConstraint, Index
+    Column, String, Text, Boolean, Integer, BigInteger, DateTime, Date, Computed,
+    ForeignKey, ForeignKeyConstraint, CheckConstraint, Index
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 import uuid
 
 from src.database import Base
+from src.vector_types import EmbeddingVector
+
+
+class CoreTenant(Base):
+    """Tenant (mailbox) whose events are processed into their own weekly brief."""
+    __tablename__ = "core_tenants"
+
+    tenant_id = Column(String, primary_key=True)
+    name = Column(Text, nullable=False)
+    slack_user_id = Column(String)
+    active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
 
 class CoreEvent(Base):
-    """Normalized event from email or meeting source."""
+    """Normalized event from email or meeting source (range-partitioned by month on timestamp)."""
     __tablename__ = "core_events"
 
+    # The partition key must be part of the primary key
     id = Column(String, primary_key=True)
+    tenant_id = Column(String, ForeignKey('core_tenants.tenant_id'), nullable=False, default='default')
     source = Column(String, nullable=False)
-    timestamp = Column(DateTime(timezone=True), nullable=False)
+    timestamp = Column(DateTime(timezone=True), primary_key=True)
     actor = Column(Text, nullable=False)
     direction = Column(String, nullable=False)
     subject = Column(Text)
@@ -31,7 +44,13 @@ class CoreEvent(Base):
     urgency_score = Column(Integer, nullable=False)
     sentiment = Column(String, nullable=False, default='unknown')
     raw_ref = Column(Text, nullable=False)
-    embedding = Column(Vector(384))
+    embedding = Column(EmbeddingVector(384))
+    # Maintained by Postgres; deferred since only full-text queries read it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(subject, '')), 'A') || "
+        "setweight(to_tsvector('english', text), 'B')",
+        persisted=True
+    )))
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -44,19 +63,46 @@ class CoreEvent(Base):
         CheckConstraint("decision IN ('made', 'deferred', 'none')", name='check_decision'),
         CheckConstraint("urgency_score BETWEEN 0 AND 10", name='check_urgency_score'),
         Index('idx_core_events_timestamp', 'timestamp'),
+        Index('idx_core_events_tenant_timestamp', 'tenant_id', 'timestamp'),
         Index('idx_core_events_source', 'source'),
         Index('idx_core_events_thread_id', 'thread_id'),
         Index('idx_core_events_actor', 'actor'),
         Index('idx_core_events_urgency', 'urgency_score'),
+        Index('idx_core_events_search_vector', 'search_vector', postgresql_using='gin'),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
 
 
+class CoreEventCount(Base):
+    """Compacted events and missing embeddings per tenant, UTC day and source."""
+    __tablename__ = "core_event_counts"
+
+    tenant_id = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+    source = Column(String, primary_key=True)
+    events = Column(BigInteger, nullable=False, default=0)
+    missing_embeddings = Column(BigInteger, nullable=False, default=0)
+
+
+class CoreEventCountDelta(Base):
+    """Event count change appended by the core_events triggers, compacted into core_event_counts."""
+    __tablename__ = "core_event_count_deltas"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    tenant_id = Column(String, nullable=False)
+    day = Column(Date, nullable=False)
+    source = Column(String, nullable=False)
+    events = Column(BigInteger, nullable=False)
+    missing_embeddings = Column(BigInteger, nullable=False)
+
+
 class CoreTopic(Base):
     """Persistent topic identified through clustering."""
     __tablename__ = "core_topics"
 
     topic_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    centroid = Column(Vector(384), nullable=False)
+    tenant_id = Column(String, ForeignKey('core_tenants.tenant_id'), nullable=False, default='default')
+    centroid = Column(EmbeddingVector(384), nullable=False)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     last_seen_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     n_points = Column(Integer, nullable=False, default=0)
@@ -66,6 +112,7 @@ class CoreTopic(Base):
 
     __table_args__ = (
         Index('idx_core_topics_last_seen', 'last_seen_at'),
+        Index('idx_core_topics_tenant', 'tenant_id'),
     )
 
 
@@ -73,18 +120,29 @@ class CoreEventTopic(Base):
     """Many-to-many relationship between events and topics."""
     __tablename__ = "core_event_topics"
 
-    event_id = Column(String, ForeignKey('core_events.id', ondelete='CASCADE'), primary_key=True)
+    event_id = Column(String, primary_key=True)
     topic_id = Column(UUID(as_uuid=True), ForeignKey('core_topics.topic_id', ondelete='CASCADE'), primary_key=True)
+    # Copy of the event's partition key, needed to reference the partitioned events table
+    event_timestamp = Column(DateTime(timezone=True), nullable=False)
 
     # Relationships
     event = relationship("CoreEvent", back_populates="event_topics")
     topic = relationship("CoreTopic", back_populates="event_topics")
 
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['event_id', 'event_timestamp'], ['core_events.id', 'core_events.timestamp'],
+            ondelete='CASCADE', onupdate='CASCADE'
+        ),
+        Index('idx_core_event_topics_event_timestamp', 'event_timestamp'),
+    )
+
 
 class OutWeeklyBrief(Base):
     """Generated weekly strategic insight report."""
     __tablename__ = "out_weekly_briefs"
 
+    tenant_id = Column(String, ForeignKey('core_tenants.tenant_id'), primary_key=True, default='default')
     week_start = Column(Date, primary_key=True)
     week_end = Column(Date, nullable=False)
     markdown = Column(Text, nullable=False)
@@ -94,3 +152,51 @@ class OutWeeklyBrief(Base):
     openai_model = Column(Text)
     openai_response_id = Column(Text)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class OutPipelineCheckpoint(Base):
+    """Persisted output of a completed weekly pipeline stage."""
+    __tablename__ = "out_pipeline_checkpoints"
+
+    tenant_id = Column(String, primary_key=True, default='default')
+    week_start = Column(Date, primary_key=True)
+    stage = Column(String, primary_key=True)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class OutPipelineRun(Base):
+    """State of a weekly or daily pipeline run, kept alive by heartbeats."""
+    __tablename__ = "out_pipeline_runs"
+
+    run_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(String, nullable=False, default='default')
+    kind = Column(String, nullable=False, default='weekly')
+    period_start = Column(Date, nullable=False)
+    status = Column(String, nullable=False)
+    host = Column(Text, nullable=False)
+    pid = Column(Integer, nullable=False)
+    started_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    heartbeat_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    finished_at = Column(DateTime(timezone=True))
+    detail = Column(Text)
+
+    __table_args__ = (
+        CheckConstraint("kind IN ('weekly', 'daily')", name='check_run_kind'),
+        CheckConstraint("status IN ('running', 'completed', 'failed')", name='check_run_status'),
+        Index('idx_out_pipeline_runs_period', 'tenant_id', 'kind', 'period_start', 'started_at'),
+    )
+
+
+class OutDailyRollup(Base):
+    """Precomputed metrics, topic rollups and findings for one day of events."""
+    __tablename__ = "out_daily_rollups"
+
+    tenant_id = Column(String, primary_key=True, default='default')
+    day = Column(Date, primary_key=True)
+    metrics = Column(JSONB, nullable=False)
+    topics = Column(JSONB, nullable=False)
+    findings = Column(JSONB, nullable=False)
+    topics_assigned = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
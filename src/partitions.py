@@ -0,0 +1,257 @@
+"""Monthly range partitions of core_events: creating future months and archiving old ones."""
+
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import Dict, List
+from sqlalchemy import select, text
+
+from src.config import get_settings
+from src.database import get_db_context
+from src.models import CoreEvent
+from src.stats import EVENT_COUNTS_LOCK_KEY
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Detached partitions (and the topic mappings of their events) are moved here
+ARCHIVE_SCHEMA = "archive"
+
+PARTITION_NAME = re.compile(r"^core_events_y(\d{4})m(\d{2})$")
+
+# Smallest retention that still covers a weekly run's 35-day window
+MIN_RETENTION_MONTHS = 2
+
+# First key of the two-key advisory lock serializing ingests of one event ID
+EVENT_ID_LOCK_NAMESPACE = 5715278
+
+# Months this process has already made sure exist
+_known_months: set = set()
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing day."""
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month the given number of months after month (negative = before)."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding a month (matches create_core_events_partition)."""
+    return f"core_events_y{month.year:04d}m{month.month:02d}"
+
+
+def list_partitions(db) -> Dict[date, str]:
+    """
+    List the attached monthly partitions of core_events.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary mapping month start to partition name, in month order
+    """
+    rows = db.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'core_events'::regclass"
+    )).scalars()
+
+    partitions = {}
+    for name in rows:
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+
+    return dict(sorted(partitions.items()))
+
+
+def ensure_partition(db, day: date) -> str:
+    """
+    Create the partition for the month containing day if it is missing.
+
+    Args:
+        db: Database session
+        day: Any day of the month
+
+    Returns:
+        Partition name
+    """
+    name = db.execute(text("SELECT create_core_events_partition(:month)"), {"month": month_start(day)}).scalar()
+    db.commit()
+    return name
+
+
+def ensure_partition_for(db, timestamp: datetime) -> None:
+    """
+    Make sure an event timestamp has a partition before it is written.
+
+    Each month is checked once per process, so ingestion only pays for the
+    check on the first event of a month (e.g. an old email being imported).
+
+    Args:
+        db: Database session (committed if a partition is created)
+        timestamp: Timezone-aware event timestamp
+    """
+    month = month_start(timestamp.astimezone(timezone.utc).date())
+    if month not in _known_months:
+        ensure_partition(db, month)
+        _known_months.add(month)
+
+
+async def ensure_partition_for_async(db, timestamp: datetime) -> None:
+    """
+    Async variant of ensure_partition_for for AsyncSession callers (the API).
+
+    Args:
+        db: Async database session (committed if a partition is created)
+        timestamp: Timezone-aware event timestamp
+    """
+    month = month_start(timestamp.astimezone(timezone.utc).date())
+    if month not in _known_months:
+        await db.execute(text("SELECT create_core_events_partition(:month)"), {"month": month})
+        await db.commit()
+        _known_months.add(month)
+
+
+async def find_event_for_update_async(db, event_id: str) -> CoreEvent | None:
+    """
+    Lock an event ID for the rest of the transaction and load its event.
+
+    The primary key of the partitioned core_events is (id, timestamp), since
+    Postgres requires the partition key in every unique constraint, so an ID
+    alone is not unique. This transaction-level advisory lock on the ID makes
+    concurrent ingests of the same ID take turns: the second one finds the
+    row committed by the first and updates it instead of inserting a copy
+    with another timestamp. An update that changes the timestamp moves the
+    row to its new month's partition.
+
+    Args:
+        db: Async database session (the lock is released when it commits or rolls back)
+        event_id: Event ID
+
+    Returns:
+        The event with this ID, or None
+    """
+    await db.execute(
+        text("SELECT pg_advisory_xact_lock(:namespace, hashtext(:event_id))"),
+        {"namespace": EVENT_ID_LOCK_NAMESPACE, "event_id": event_id}
+    )
+    return await db.scalar(select(CoreEvent).where(CoreEvent.id == event_id))
+
+
+def ensure_future_partitions(db, today: date, months: int) -> List[str]:
+    """
+    Create partitions from the current month through the given number of months ahead.
+
+    Args:
+        db: Database session
+        today: Reference day (UTC)
+        months: Months to create beyond the current one
+
+    Returns:
+        Names of the partitions that were created
+    """
+    existing = list_partitions(db)
+    created = []
+
+    for offset in range(months + 1):
+        month = add_months(month_start(today), offset)
+        if month not in existing:
+            created.append(ensure_partition(db, month))
+
+    return created
+
+
+def archive_partitions(db, before: date) -> List[str]:
+    """
+    Detach partitions whose months end on or before a day and move them to the archive schema.
+
+    Topic mappings of the archived events are copied to
+    archive.core_event_topics_yYYYYmMM first and then removed, since Postgres
+    refuses to detach a partition that is still referenced. Detaching fires no
+    delete triggers, so the month's core_event_counts and core_event_count_deltas
+    rows are removed here.
+
+    Args:
+        db: Database session
+        before: Archive months that end on or before this day
+
+    Returns:
+        Names of the archived partitions
+    """
+    archived = []
+
+    for month, name in list_partitions(db).items():
+        upper = add_months(month, 1)
+        if upper > before:
+            continue
+
+        bounds = {
+            "lower": datetime(month.year, month.month, 1),
+            "upper": datetime(upper.year, upper.month, 1)
+        }
+        mappings = f"core_event_topics_y{month.year:04d}m{month.month:02d}"
+
+        db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        db.execute(text(
+            f"CREATE TABLE {ARCHIVE_SCHEMA}.{mappings} AS SELECT * FROM core_event_topics "
+            "WHERE event_timestamp >= :lower AT TIME ZONE 'UTC' AND event_timestamp < :upper AT TIME ZONE 'UTC'"
+        ), bounds)
+        db.execute(text(
+            "DELETE FROM core_event_topics "
+            "WHERE event_timestamp >= :lower AT TIME ZONE 'UTC' AND event_timestamp < :upper AT TIME ZONE 'UTC'"
+        ), bounds)
+        db.execute(text(f"ALTER TABLE core_events DETACH PARTITION {name}"))
+        # Wait for a running compaction, so none of its counters for the month land after the delete
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": EVENT_COUNTS_LOCK_KEY})
+        for table in ("core_event_count_deltas", "core_event_counts"):
+            db.execute(text(
+                f"DELETE FROM {table} WHERE day >= :lower_day AND day < :upper_day"
+            ), {"lower_day": month, "upper_day": upper})
+        db.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+        db.commit()
+
+        logger.info(f"Archived partition {name} to schema {ARCHIVE_SCHEMA}")
+        archived.append(name)
+
+    return archived
+
+
+def maintain_partitions(
+    today: date | None = None,
+    premake_months: int | None = None,
+    retention_months: int | None = None
+) -> Dict[str, List[str]]:
+    """
+    Create upcoming monthly partitions and archive those past retention.
+
+    Args:
+        today: Reference day (defaults to today, UTC)
+        premake_months: Months to create ahead (defaults to partition_premake_months)
+        retention_months: Full months to keep attached before the current one
+            (defaults to partition_retention_months; 0 keeps everything)
+
+    Returns:
+        Dictionary with the "created" and "archived" partition names
+
+    Raises:
+        ValueError: If retention is shorter than a weekly run's window
+    """
+    today = today or datetime.utcnow().date()
+    premake_months = settings.partition_premake_months if premake_months is None else premake_months
+    retention_months = settings.partition_retention_months if retention_months is None else retention_months
+
+    if 0 < retention_months < MIN_RETENTION_MONTHS:
+        raise ValueError(f"Partition retention must be at least {MIN_RETENTION_MONTHS} months (or 0)")
+
+    with get_db_context() as db:
+        created = ensure_future_partitions(db, today, premake_months)
+        archived = []
+        if retention_months:
+            archived = archive_partitions(db, add_months(month_start(today), -retention_months))
+
+    return {"created": created, "archived": archived}
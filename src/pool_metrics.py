@@ -0,0 +1,180 @@
+"""Connection pool instrumentation: checkout wait time, saturation and pre-ping failures."""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Stats of every instrumented engine, by name ("api", "batch", "api-async", ...)
+_registry: Dict[str, "PoolStats"] = {}
+
+
+class PoolStats:
+    """Thread-safe counters for one engine's connection pool."""
+
+    def __init__(self, name: str, pool_size: int, max_overflow: int):
+        self.name = name
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.pre_ping_failures = 0
+        self.invalidations = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)  # last bucket is +Inf
+        self.peak_checked_out = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.pool_size + max(self.max_overflow, 0)
+
+    def record_checkout(self, waited: float, checked_out: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS, waited)] += 1
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self, waited: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS, waited)] += 1
+
+    def record_pre_ping_failure(self) -> None:
+        with self._lock:
+            self.pre_ping_failures += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current counters plus live pool state.
+
+        Returns:
+            Dictionary of pool statistics; saturation is checked-out connections
+            over pool_size + max_overflow
+        """
+        checked_out = self.pool.checkedout() if self.pool is not None else 0
+        with self._lock:
+            return {
+                "name": self.name,
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "checked_out": checked_out,
+                "idle": self.pool.checkedin() if self.pool is not None else 0,
+                "saturation": round(checked_out / self.capacity, 3) if self.capacity else 0.0,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_saturation": round(self.peak_checked_out / self.capacity, 3) if self.capacity else 0.0,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_buckets": dict(zip([str(b) for b in WAIT_BUCKETS] + ["+Inf"], self.wait_buckets)),
+                "pre_ping_failures": self.pre_ping_failures,
+                "invalidations": self.invalidations
+            }
+
+
+class _InstrumentedPool:
+    """Mixin timing how long each checkout waits for a connection."""
+
+    stats: PoolStats | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            if self.stats is not None:
+                self.stats.record_timeout(time.perf_counter() - start)
+            raise
+
+        if self.stats is not None:
+            self.stats.record_checkout(time.perf_counter() - start, self.checkedout())
+        return record
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same stats
+        pool = super().recreate()
+        pool.stats = self.stats
+        if self.stats is not None:
+            self.stats.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    """QueuePool recording checkout wait times."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout wait times."""
+
+
+def instrument_engine(engine, name: str, pool_size: int, max_overflow: int) -> PoolStats:
+    """
+    Attach pool statistics to an engine created with an instrumented pool class.
+
+    Pre-ping failures are counted through the engine's handle_error event, and
+    every invalidated connection (failed ping or error in use) through the
+    pool's invalidate event.
+
+    Args:
+        engine: Engine (the sync engine of an AsyncEngine)
+        name: Name reported in the statistics
+        pool_size: Configured pool size
+        max_overflow: Configured overflow
+
+    Returns:
+        PoolStats registered under name (replacing an earlier engine's)
+    """
+    stats = PoolStats(name, pool_size, max_overflow)
+    stats.pool = engine.pool
+    engine.pool.stats = stats
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context):
+        # A ping that raises a disconnect error; the pool then reconnects
+        if context.is_pre_ping:
+            stats.record_pre_ping_failure()
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        stats.record_invalidation()
+
+    _registry[name] = stats
+    return stats
+
+
+def get_pool_stats() -> List[Dict[str, Any]]:
+    """Snapshots of every instrumented pool in this process."""
+    return [stats.snapshot() for stats in _registry.values()]
+
+
+def log_pool_stats() -> None:
+    """Log a one-line summary per pool (e.g. at the end of a batch run)."""
+    for snapshot in get_pool_stats():
+        if not snapshot["checkouts"]:
+            continue
+        logger.info(
+            f"Pool {snapshot['name']}: {snapshot['checkouts']} checkouts, "
+            f"wait avg {snapshot['wait_seconds_avg'] * 1000:.1f} ms / max {snapshot['wait_seconds_max'] * 1000:.1f} ms, "
+            f"peak saturation {snapshot['peak_saturation']:.0%}, {snapshot['timeouts']} timeouts, "
+            f"{snapshot['pre_ping_failures']} pre-ping failures"
+        )
@@ -58,6 +58,28 @@ class IngestResponse(BaseModel):
     id: str
 
 
+class SearchResult(BaseModel):
+    """Event returned by semantic search."""
+    id: str
+    source: str
+    timestamp: datetime
+    actor: str
+    subject: str | None
+    thread_id: str | None
+    urgency_score: int
+    similarity: float | None = Field(None, description="Cosine similarity to the query (1 = identical)")
+    score: float | None = Field(None, description="Reciprocal rank fusion score (hybrid mode)")
+    semantic_rank: int | None = Field(None, description="Rank in the vector results")
+    lexical_rank: int | None = Field(None, description="Rank in the full-text results (hybrid mode)")
+
+
+class SearchResponse(BaseModel):
+    """Response model for the search endpoint."""
+    query: str
+    mode: str
+    results: list[SearchResult]
+
+
 class LLMEnhancedOutput(BaseModel):
     """Structured output from LLM enhancement (strict schema)."""
 
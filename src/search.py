@@ -0,0 +1,387 @@
+"""Event search: semantic (HNSW on core_events.embedding) and hybrid with full-text."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from sqlalchemy import Float, Select, func, literal, select, text
+from sqlalchemy.orm import defer
+
+from src.archive import get_cold_storage
+from src.config import get_settings
+from src.models import CoreEvent
+from src.partitions import add_months
+from src.insight.modules.embeddings import generate_embedding
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ITERATIVE_SCAN_MODES = ("off", "relaxed_order", "strict_order")
+SEARCH_MODES = ("semantic", "hybrid")
+
+# Text search configuration of core_events.search_vector
+TEXT_SEARCH_CONFIG = "english"
+
+
+def event_filters(
+    tenant_id: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    source: str | None = None,
+    actor: str | None = None
+) -> List[Any]:
+    """
+    WHERE conditions shared by the semantic and full-text retrievers.
+
+    Args:
+        tenant_id: Tenant whose events are searched
+        start: Only events at or after this time
+        end: Only events before this time
+        source: Only "email" or "meeting" events
+        actor: Only events whose actor contains this text (case-insensitive)
+
+    Returns:
+        List of SQL conditions
+    """
+    conditions = [CoreEvent.tenant_id == tenant_id]
+
+    if start is not None:
+        conditions.append(CoreEvent.timestamp >= start)
+    if end is not None:
+        conditions.append(CoreEvent.timestamp < end)
+    if source is not None:
+        conditions.append(CoreEvent.source == source)
+    if actor is not None:
+        conditions.append(CoreEvent.actor.icontains(actor, autoescape=True))
+
+    return conditions
+
+
+def build_search_query(
+    embedding: List[float],
+    tenant_id: str,
+    limit: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    source: str | None = None,
+    actor: str | None = None
+) -> Select:
+    """
+    Build the nearest-neighbour query for an embedding.
+
+    Ordering by the <=> operator with a LIMIT is what lets Postgres use the
+    HNSW index of each partition; the time filter prunes partitions.
+
+    Args:
+        embedding: Query embedding
+        tenant_id: Tenant whose events are searched
+        limit: Maximum results
+        start: Only events at or after this time
+        end: Only events before this time
+        source: Only "email" or "meeting" events
+        actor: Only events whose actor contains this text (case-insensitive)
+
+    Returns:
+        Select of (CoreEvent, distance) rows, nearest first
+    """
+    distance = CoreEvent.embedding.cosine_distance(embedding).label("distance")
+
+    query = select(CoreEvent, distance).where(
+        CoreEvent.embedding.is_not(None),
+        *event_filters(tenant_id, start, end, source, actor)
+    )
+
+    # The embedding itself is only needed by the ORDER BY, not in the results
+    return query.options(defer(CoreEvent.embedding)).order_by(distance).limit(limit)
+
+
+def build_hybrid_query(
+    embedding: List[float],
+    query_text: str,
+    tenant_id: str,
+    limit: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    source: str | None = None,
+    actor: str | None = None,
+    candidates: int | None = None,
+    rrf_k: int | None = None
+) -> Select:
+    """
+    Build a single statement fusing vector kNN and full-text results.
+
+    Each retriever takes its top candidates independently (the kNN list from
+    the HNSW index, the full-text list from the GIN index ranked by ts_rank_cd),
+    and the lists are merged with reciprocal rank fusion:
+    score = sum of 1 / (rrf_k + rank) over the lists an event appears in.
+    Both run as CTEs of one query, so a search costs one round trip.
+
+    Args:
+        embedding: Query embedding
+        query_text: Query in web search syntax ("quoted phrases", OR, -exclusions)
+        tenant_id: Tenant whose events are searched
+        limit: Maximum results
+        start: Only events at or after this time
+        end: Only events before this time
+        source: Only "email" or "meeting" events
+        actor: Only events whose actor contains this text
+        candidates: Results taken from each retriever (defaults to search_hybrid_candidates)
+        rrf_k: Rank fusion constant (defaults to search_rrf_k)
+
+    Returns:
+        Select of (CoreEvent, score, similarity, semantic_rank, lexical_rank) rows, best first
+    """
+    candidates = max(candidates or settings.search_hybrid_candidates, limit)
+    rrf_k = settings.search_rrf_k if rrf_k is None else rrf_k
+    conditions = event_filters(tenant_id, start, end, source, actor)
+
+    distance = CoreEvent.embedding.cosine_distance(embedding)
+    semantic_hits = select(CoreEvent.id, CoreEvent.timestamp, distance.label("distance")).where(
+        CoreEvent.embedding.is_not(None), *conditions
+    ).order_by(distance).limit(candidates).subquery("semantic_hits")
+    semantic = select(
+        semantic_hits.c.id,
+        semantic_hits.c.timestamp,
+        func.row_number().over(order_by=semantic_hits.c.distance).label("rank")
+    ).cte("semantic")
+
+    tsquery = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query_text)
+    text_rank = func.ts_rank_cd(CoreEvent.search_vector, tsquery)
+    lexical_hits = select(CoreEvent.id, CoreEvent.timestamp, text_rank.label("text_rank")).where(
+        CoreEvent.search_vector.op("@@")(tsquery), *conditions
+    ).order_by(text_rank.desc()).limit(candidates).subquery("lexical_hits")
+    lexical = select(
+        lexical_hits.c.id,
+        lexical_hits.c.timestamp,
+        func.row_number().over(order_by=lexical_hits.c.text_rank.desc()).label("rank")
+    ).cte("lexical")
+
+    one = literal(1.0, Float)
+    score = (
+        func.coalesce(one / (rrf_k + semantic.c.rank), 0) + func.coalesce(one / (rrf_k + lexical.c.rank), 0)
+    ).label("score")
+    fused = select(
+        func.coalesce(semantic.c.id, lexical.c.id).label("id"),
+        func.coalesce(semantic.c.timestamp, lexical.c.timestamp).label("timestamp"),
+        score,
+        semantic.c.rank.label("semantic_rank"),
+        lexical.c.rank.label("lexical_rank")
+    ).select_from(
+        semantic.join(lexical, semantic.c.id == lexical.c.id, full=True)
+    ).order_by(score.desc()).limit(limit).subquery("fused")
+
+    return select(
+        CoreEvent,
+        fused.c.score,
+        (1 - CoreEvent.embedding.cosine_distance(embedding)).label("similarity"),
+        fused.c.semantic_rank,
+        fused.c.lexical_rank
+    ).join(
+        fused, (CoreEvent.id == fused.c.id) & (CoreEvent.timestamp == fused.c.timestamp)
+    ).options(defer(CoreEvent.embedding)).order_by(fused.c.score.desc(), CoreEvent.id)
+
+
+def configure_index_scan(db, limit: int) -> None:
+    """
+    Set the HNSW scan parameters for the current transaction.
+
+    Args:
+        db: Database session
+        limit: Results requested (ef_search is raised to at least this)
+
+    Raises:
+        ValueError: On an unknown search_iterative_scan mode
+    """
+    if settings.search_iterative_scan not in ITERATIVE_SCAN_MODES:
+        raise ValueError(f"Unknown search_iterative_scan: {settings.search_iterative_scan}")
+
+    ef_search = max(settings.search_ef_search, limit)
+    db.execute(text("SELECT set_config('hnsw.ef_search', :value, true)"), {"value": str(ef_search)})
+
+    # Without iterative scans a selective filter can leave fewer than limit rows
+    if settings.search_iterative_scan != "off":
+        db.execute(
+            text("SELECT set_config('hnsw.iterative_scan', :value, true)"),
+            {"value": settings.search_iterative_scan}
+        )
+
+
+def search_cold_events(
+    embedding: List[float],
+    tenant_id: str,
+    limit: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    source: str | None = None,
+    actor: str | None = None
+) -> List[Tuple[CoreEvent, float]]:
+    """
+    Exact nearest-neighbour scan over archived events.
+
+    Only months held in cold storage that overlap the requested range are read;
+    a range entirely within Postgres reads nothing.
+
+    Args:
+        embedding: Query embedding
+        tenant_id: Tenant whose events are searched
+        limit: Maximum results
+        start: Only events at or after this time
+        end: Only events before this time
+        source: Only "email" or "meeting" events
+        actor: Only events whose actor contains this text (case-insensitive)
+
+    Returns:
+        List of (transient CoreEvent, cosine similarity) tuples, most similar first
+    """
+    storage = get_cold_storage()
+    if storage is None:
+        return []
+
+    months = storage.months()
+    if not months:
+        return []
+
+    lower = datetime(months[0].year, months[0].month, 1, tzinfo=timezone.utc)
+    upper_month = add_months(months[-1], 1)
+    upper = datetime(upper_month.year, upper_month.month, 1, tzinfo=timezone.utc)
+    start = lower if start is None else max(_as_utc(start), lower)
+    end = upper if end is None else min(_as_utc(end), upper)
+    if start >= end:
+        return []
+
+    events = [
+        event for event in storage.read_events(start, end, tenant_id)
+        if event.embedding is not None
+        and (source is None or event.source == source)
+        and (actor is None or actor.lower() in (event.actor or "").lower())
+    ]
+    if not events:
+        return []
+
+    matrix = np.vstack([event.embedding for event in events]).astype(np.float32)
+    query = np.asarray(embedding, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    similarities = matrix @ query / np.where(norms == 0, 1, norms)
+
+    nearest = np.argsort(-similarities, kind="stable")[:limit]
+    return [(events[i], float(similarities[i])) for i in nearest]
+
+
+def merge_cold_results(rows: List[tuple], cold: List[Tuple[CoreEvent, float]], limit: int, mode: str) -> List[tuple]:
+    """
+    Add archived hits to the database results.
+
+    In semantic mode results are re-ranked by similarity. Archived events have
+    no full-text index, so in hybrid mode they only take part as a semantic
+    list of their own, scored 1 / (search_rrf_k + rank) like database hits.
+
+    Args:
+        rows: (CoreEvent, score, similarity, semantic_rank, lexical_rank) database rows
+        cold: Results of search_cold_events
+        limit: Maximum results
+        mode: "semantic" or "hybrid"
+
+    Returns:
+        Rows in the same layout, best first
+    """
+    hot_ids = {row[0].id for row in rows}
+    cold = [(event, similarity) for event, similarity in cold if event.id not in hot_ids]
+    if not cold:
+        return rows
+
+    if mode == "hybrid":
+        merged = rows + [
+            (event, 1.0 / (settings.search_rrf_k + rank), similarity, rank, None)
+            for rank, (event, similarity) in enumerate(cold, start=1)
+        ]
+        return sorted(merged, key=lambda row: -row[1])[:limit]
+
+    merged = sorted(
+        [(event, similarity) for event, _, similarity, _, _ in rows] + cold,
+        key=lambda pair: -pair[1]
+    )[:limit]
+    return [(event, None, similarity, rank, None) for rank, (event, similarity) in enumerate(merged, start=1)]
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def search_events(
+    db,
+    query: str,
+    tenant_id: str,
+    limit: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    source: str | None = None,
+    actor: str | None = None,
+    mode: str = "semantic"
+) -> List[Dict[str, Any]]:
+    """
+    Find the events most relevant to a query text.
+
+    When cold storage is configured, archived events in the requested range
+    (see src.archive) are scanned exactly and merged with the database results.
+
+    Args:
+        db: Database session
+        query: Free text, embedded like event subject and text
+        tenant_id: Tenant whose events are searched
+        limit: Maximum results (defaults to search_default_limit)
+        start: Only events at or after this time
+        end: Only events before this time
+        source: Only "email" or "meeting" events
+        actor: Only events whose actor contains this text
+        mode: "semantic" (vector kNN) or "hybrid" (kNN fused with full-text matches)
+
+    Returns:
+        Result dictionaries ordered by relevance
+
+    Raises:
+        ValueError: On an unknown mode
+    """
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode {mode!r} (expected one of {SEARCH_MODES})")
+
+    limit = limit or settings.search_default_limit
+    embedding = generate_embedding(query).tolist()
+
+    if mode == "hybrid":
+        configure_index_scan(db, max(settings.search_hybrid_candidates, limit))
+        rows = db.execute(build_hybrid_query(
+            embedding, query, tenant_id, limit, start, end, source, actor
+        )).all()
+    else:
+        configure_index_scan(db, limit)
+        rows = [
+            (event, None, 1 - distance, rank, None)
+            for rank, (event, distance) in enumerate(
+                db.execute(build_search_query(embedding, tenant_id, limit, start, end, source, actor)).all(),
+                start=1
+            )
+        ]
+
+    cold = search_cold_events(embedding, tenant_id, limit, start, end, source, actor)
+    if cold:
+        logger.info(f"Scanned cold storage: {len(cold)} archived candidates")
+        rows = merge_cold_results(rows, cold, limit, mode)
+
+    logger.info(f"{mode.capitalize()} search for {tenant_id} returned {len(rows)} events")
+
+    return [
+        {
+            "id": event.id,
+            "source": event.source,
+            "timestamp": event.timestamp,
+            "actor": event.actor,
+            "subject": event.subject,
+            "thread_id": event.thread_id,
+            "urgency_score": event.urgency_score,
+            "similarity": round(similarity, 4) if similarity is not None else None,
+            "score": round(float(score), 6) if score is not None else None,
+            "semantic_rank": semantic_rank,
+            "lexical_rank": lexical_rank
+        }
+        for event, score, similarity, semantic_rank, lexical_rank in rows
+    ]
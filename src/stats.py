@@ -0,0 +1,176 @@
+"""Ingest statistics for /stats, read from the event counters and their pending deltas."""
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List
+from sqlalchemy import func, select, text, union_all
+
+from src.config import get_settings
+from src.models import CoreEventCount, CoreEventCountDelta, CoreTopic
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Transaction-level advisory lock serializing compaction with archiving of counters
+EVENT_COUNTS_LOCK_KEY = 5715277
+
+COMPACT_EVENT_COUNTS_SQL = """
+WITH moved AS (
+  DELETE FROM core_event_count_deltas
+  RETURNING tenant_id, day, source, events, missing_embeddings
+)
+INSERT INTO core_event_counts (tenant_id, day, source, events, missing_embeddings)
+SELECT tenant_id, day, source, sum(events), sum(missing_embeddings)
+FROM moved
+GROUP BY tenant_id, day, source
+ON CONFLICT (tenant_id, day, source) DO UPDATE
+SET events = core_event_counts.events + EXCLUDED.events,
+    missing_embeddings = core_event_counts.missing_embeddings + EXCLUDED.missing_embeddings
+"""
+
+
+def event_counts():
+    """Compacted counters and not yet compacted deltas as one (tenant_id, day, source, ...) subquery."""
+    columns = ("tenant_id", "day", "source", "events", "missing_embeddings")
+    return union_all(
+        select(*(getattr(CoreEventCount, name) for name in columns)),
+        select(*(getattr(CoreEventCountDelta, name) for name in columns))
+    ).subquery("event_counts")
+
+
+def build_totals_query():
+    """Totals per source, embedding backlog and topic count in one statement."""
+    counts = event_counts()
+    return select(
+        func.coalesce(func.sum(counts.c.events), 0),
+        func.coalesce(func.sum(counts.c.events).filter(counts.c.source == 'email'), 0),
+        func.coalesce(func.sum(counts.c.events).filter(counts.c.source == 'meeting'), 0),
+        func.coalesce(func.sum(counts.c.missing_embeddings), 0),
+        select(func.count()).select_from(CoreTopic).scalar_subquery()
+    )
+
+
+def build_daily_query(since: date):
+    """Events per UTC day and source from since onwards."""
+    counts = event_counts()
+    return select(
+        counts.c.day,
+        counts.c.source,
+        func.sum(counts.c.events)
+    ).where(
+        counts.c.day >= since
+    ).group_by(counts.c.day, counts.c.source)
+
+
+def compact_event_counts(db) -> int:
+    """
+    Fold the pending deltas into core_event_counts.
+
+    Deltas are deleted and added to the counters in one statement, so each is
+    counted exactly once even if two compactions overlap.
+
+    Args:
+        db: Database session (committed here)
+
+    Returns:
+        Counter rows updated
+    """
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": EVENT_COUNTS_LOCK_KEY})
+    updated = db.execute(text(COMPACT_EVENT_COUNTS_SQL)).rowcount
+    db.commit()
+
+    logger.info(f"Compacted event count deltas into {updated} counter rows")
+    return updated
+
+
+def daily_counts(rows: List[tuple], today: date, days: int) -> List[Dict[str, Any]]:
+    """
+    Lay out per-day counts for the last days, oldest first, with empty days as zeros.
+
+    Args:
+        rows: (day, source, events) rows from build_daily_query
+        today: Last day (UTC)
+        days: Number of days
+
+    Returns:
+        List of {"day", "events", "email_events", "meeting_events"} dictionaries
+    """
+    by_day = {
+        today - timedelta(days=offset): {"email_events": 0, "meeting_events": 0}
+        for offset in range(days - 1, -1, -1)
+    }
+    for day, source, events in rows:
+        if day in by_day:
+            by_day[day][f"{source}_events"] = int(events)
+
+    return [
+        {"day": day.isoformat(), "events": counts["email_events"] + counts["meeting_events"], **counts}
+        for day, counts in by_day.items()
+    ]
+
+
+async def load_ingest_stats(db, days: int | None = None) -> Dict[str, Any]:
+    """
+    Read ingest statistics from the counters and pending deltas (two small queries).
+
+    Events of archived months are not counted: archiving removes their
+    counters and deltas (see src.partitions.archive_partitions).
+
+    Args:
+        db: Async database session
+        days: Days of per-day counts (defaults to stats_days)
+
+    Returns:
+        Dictionary with totals per source, per-day counts, embedding backlog and topics
+    """
+    days = days or settings.stats_days
+    now = datetime.now(timezone.utc)
+    today = now.date()
+
+    total, email, meeting, backlog, topics = (await db.execute(build_totals_query())).one()
+    rows = (await db.execute(build_daily_query(today - timedelta(days=days - 1)))).all()
+
+    return {
+        "total_events": int(total),
+        "email_events": int(email),
+        "meeting_events": int(meeting),
+        "embedding_backlog": int(backlog),
+        "topics": int(topics),
+        "daily": daily_counts(rows, today, days),
+        "as_of": now.isoformat()
+    }
+
+
+class StatsCache:
+    """
+    Keeps the last statistics for stats_cache_ttl_seconds.
+
+    Concurrent requests after expiry wait for a single reload instead of each
+    querying the database.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self.value: Dict[str, Any] | None = None
+        self.expires_at = float("-inf")
+
+    async def get(self, load: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Cached statistics, reloaded with load once they are older than the TTL.
+
+        Args:
+            load: Coroutine function returning fresh statistics
+        """
+        if time.monotonic() < self.expires_at:
+            return self.value
+
+        async with self._lock:
+            if time.monotonic() >= self.expires_at:
+                self.value = await load()
+                self.expires_at = time.monotonic() + settings.stats_cache_ttl_seconds
+            return self.value
+
+
+stats_cache = StatsCache()
@@ -0,0 +1,242 @@
+"""Prometheus metrics for the API (/metrics) and batch runs (textfile or Pushgateway)."""
+
+import logging
+import os
+import time
+from typing import Any, Dict, Iterator
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram, push_to_gateway, write_to_textfile
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+
+from src.config import get_settings
+from src.pool_metrics import get_pool_stats
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "API request latency by route template",
+    ["method", "route", "status"]
+)
+
+INGESTED_EVENTS = Counter(
+    "ingest_events_total",
+    "Events received by the ingest endpoints",
+    ["source", "result"]  # created, updated or error
+)
+
+EMBEDDING_BATCH_SIZE = Histogram(
+    "embedding_batch_size",
+    "Texts encoded per embedding model call",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+)
+
+EMBEDDING_LATENCY = Histogram(
+    "embedding_duration_seconds",
+    "Embedding model encode time per call",
+    ["kind"],  # single (ingest, search) or batch (pipelines)
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+
+PROVIDER_LATENCY = Histogram(
+    "provider_call_duration_seconds",
+    "Duration of one LLM or Slack call attempt",
+    ["provider", "outcome"],  # success or error
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+)
+
+COLD_START = Gauge(
+    "api_cold_start_seconds",
+    "Seconds from API start-up until the embedding model and database pools were warm"
+)
+
+STAGE_DURATION = Gauge(
+    "pipeline_stage_duration_seconds",
+    "Wall time of each stage in the last pipeline run",
+    ["kind", "tenant", "stage"]
+)
+
+STAGE_CPU = Gauge(
+    "pipeline_stage_cpu_seconds",
+    "CPU time of each stage in the last pipeline run",
+    ["kind", "tenant", "stage"]
+)
+
+RUN_DURATION = Gauge(
+    "pipeline_run_duration_seconds",
+    "Wall time of the last pipeline run",
+    ["kind", "tenant"]
+)
+
+RUN_CRITICAL_PATH = Gauge(
+    "pipeline_run_critical_path_seconds",
+    "Critical path length of the last pipeline run",
+    ["kind", "tenant"]
+)
+
+RUN_FINISHED = Gauge(
+    "pipeline_run_last_finished_timestamp_seconds",
+    "Unix time the last pipeline run finished",
+    ["kind", "tenant"]
+)
+
+RUN_STOPPED = Gauge(
+    "pipeline_run_stopped",
+    "1 if the last pipeline run stopped early (e.g. no events), else 0",
+    ["kind", "tenant"]
+)
+
+
+class PoolCollector:
+    """Exposes src.pool_metrics statistics of every instrumented engine."""
+
+    def collect(self) -> Iterator[Any]:
+        snapshots = get_pool_stats()
+
+        gauges = {
+            "checked_out": "Connections currently checked out",
+            "idle": "Idle connections in the pool",
+            "saturation": "Checked-out connections over pool_size + max_overflow",
+            "peak_saturation": "Highest saturation seen by this process"
+        }
+        for key, description in gauges.items():
+            family = GaugeMetricFamily(f"db_pool_{key}", description, labels=["pool"])
+            for snapshot in snapshots:
+                family.add_metric([snapshot["name"]], snapshot[key])
+            yield family
+
+        counters = {
+            "checkouts": "Connection checkouts",
+            "timeouts": "Checkouts that timed out waiting for a connection",
+            "pre_ping_failures": "Pre-ping checks that found a dead connection",
+            "invalidations": "Connections invalidated"
+        }
+        for key, description in counters.items():
+            family = CounterMetricFamily(f"db_pool_{key}", description, labels=["pool"])
+            for snapshot in snapshots:
+                family.add_metric([snapshot["name"]], snapshot[key])
+            yield family
+
+        wait = HistogramMetricFamily("db_pool_wait_seconds", "Time waited for a connection", labels=["pool"])
+        for snapshot in snapshots:
+            cumulative, buckets = 0, []
+            for bound, count in snapshot["wait_buckets"].items():
+                cumulative += count
+                buckets.append((bound if bound == "+Inf" else str(float(bound)), cumulative))
+            wait.add_metric([snapshot["name"]], buckets, snapshot["wait_seconds_total"])
+        yield wait
+
+
+class ProviderCollector:
+    """Exposes the retry and circuit breaker counters of src.insight.modules.resilience."""
+
+    descriptions = {
+        "attempts": "Provider call attempts",
+        "retries": "Provider call attempts that were retried",
+        "successes": "Provider calls that succeeded",
+        "failures": "Provider calls that failed after retries",
+        "open_circuit_skips": "Provider calls skipped because the circuit was open"
+    }
+
+    def families(self, counters: Dict[str, Dict[str, int]]) -> Iterator[Any]:
+        for key, description in self.descriptions.items():
+            family = CounterMetricFamily(f"provider_{key}", description, labels=["provider"])
+            for provider, counts in counters.items():
+                family.add_metric([provider], counts[key])
+            yield family
+
+    def describe(self) -> Iterator[Any]:
+        # Lets the registry learn the names without calling collect() during import
+        return self.families({})
+
+    def collect(self) -> Iterator[Any]:
+        # Imported here since resilience imports this module (for PROVIDER_LATENCY)
+        from src.insight.modules.resilience import get_resilience_counters
+
+        return self.families(get_resilience_counters())
+
+
+REGISTRY.register(PoolCollector())
+REGISTRY.register(ProviderCollector())
+
+
+async def record_request_latency(request, call_next):
+    """
+    HTTP middleware observing each request in REQUEST_LATENCY.
+
+    Requests are labelled with the route template (e.g. /ingest/email), not the
+    raw path, so path parameters and unknown URLs cannot grow the label set.
+    """
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        REQUEST_LATENCY.labels(
+            request.method, getattr(route, "path", "unmatched"), str(status_code)
+        ).observe(time.perf_counter() - start)
+
+
+def observe_embedding(kind: str, texts: int, seconds: float) -> None:
+    """Record one embedding model call."""
+    EMBEDDING_BATCH_SIZE.observe(texts)
+    EMBEDDING_LATENCY.labels(kind).observe(seconds)
+
+
+def record_pipeline_run(run, kind: str, tenant_id: str) -> None:
+    """
+    Set the last-run gauges from a finished pipeline run.
+
+    Args:
+        run: PipelineRun with stage timings
+        kind: "weekly" or "daily"
+        tenant_id: Tenant the run processed
+    """
+    for stage, timing in run.timings.items():
+        STAGE_DURATION.labels(kind, tenant_id, stage).set(timing["duration"])
+        STAGE_CPU.labels(kind, tenant_id, stage).set(timing["cpu_seconds"])
+
+    RUN_DURATION.labels(kind, tenant_id).set(run.wall_seconds)
+    RUN_CRITICAL_PATH.labels(kind, tenant_id).set(run.critical_path_seconds)
+    RUN_STOPPED.labels(kind, tenant_id).set(1 if run.stopped else 0)
+    RUN_FINISHED.labels(kind, tenant_id).set_to_current_time()
+
+
+def export_batch_metrics(job: str) -> Dict[str, str]:
+    """
+    Publish this process's metrics at the end of a batch run.
+
+    Writes <metrics_textfile_dir>/<job>.prom for the node_exporter textfile
+    collector and/or pushes to metrics_pushgateway_url; failures are logged
+    rather than failing the run.
+
+    Args:
+        job: Job name ("weekly_run", "daily_run")
+
+    Returns:
+        Dictionary of the targets written to
+    """
+    exported = {}
+
+    if settings.metrics_textfile_dir:
+        path = os.path.join(settings.metrics_textfile_dir, f"{job}.prom")
+        try:
+            os.makedirs(settings.metrics_textfile_dir, exist_ok=True)
+            # Written to a temporary file and renamed, so the collector never reads half a file
+            write_to_textfile(path, REGISTRY)
+            exported["textfile"] = path
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {path}: {e}")
+
+    if settings.metrics_pushgateway_url:
+        try:
+            push_to_gateway(settings.metrics_pushgateway_url, job=job, registry=REGISTRY, timeout=10)
+            exported["pushgateway"] = settings.metrics_pushgateway_url
+        except Exception as e:
+            logger.warning(f"Could not push metrics to {settings.metrics_pushgateway_url}: {e}")
+
+    return exported
@@ -0,0 +1,77 @@
+"""Embedding column types: pgvector float32 vector or float16 halfvec storage."""
+
+from sqlalchemy.dialects.postgresql.base import ischema_names
+from sqlalchemy.types import Float, TypeEngine, UserDefinedType
+from pgvector.sqlalchemy import Vector
+from pgvector.utils import from_db, to_db
+
+from src.config import get_settings
+
+settings = get_settings()
+
+EMBEDDING_STORAGE_MODES = ("vector", "halfvec")
+
+
+class HalfVector(UserDefinedType):
+    """
+    pgvector halfvec column (float16 storage, pgvector >= 0.7 on the server).
+
+    halfvec uses the same text format as vector, so values are written from
+    lists or arrays and read back as NumPy float32 arrays, like Vector.
+    """
+
+    cache_ok = True
+
+    def __init__(self, dim: int | None = None):
+        super().__init__()
+        self.dim = dim
+
+    def get_col_spec(self, **kw) -> str:
+        if self.dim is None:
+            return "HALFVEC"
+        return f"HALFVEC({self.dim})"
+
+    def bind_processor(self, dialect):
+        def process(value):
+            return to_db(value, self.dim)
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            return from_db(value)
+        return process
+
+    class comparator_factory(UserDefinedType.Comparator):
+        def l2_distance(self, other):
+            return self.op('<->', return_type=Float)(other)
+
+        def max_inner_product(self, other):
+            return self.op('<#>', return_type=Float)(other)
+
+        def cosine_distance(self, other):
+            return self.op('<=>', return_type=Float)(other)
+
+
+# for reflection
+ischema_names['halfvec'] = HalfVector
+
+
+def EmbeddingVector(dim: int, storage: str | None = None) -> TypeEngine:
+    """
+    Column type for embeddings in the configured storage mode.
+
+    Args:
+        dim: Number of dimensions
+        storage: "vector" (float32) or "halfvec" (float16), defaults to embedding_storage
+
+    Returns:
+        Vector or HalfVector column type
+
+    Raises:
+        ValueError: On an unknown storage mode
+    """
+    storage = storage or settings.embedding_storage
+    if storage not in EMBEDDING_STORAGE_MODES:
+        raise ValueError(f"Unknown embedding storage {storage!r} (expected one of {EMBEDDING_STORAGE_MODES})")
+
+    return HalfVector(dim) if storage == "halfvec" else Vector(dim)
@@ -0,0 +1,173 @@
+"""API start-up warm-up: embedding model and database pools, tracked for /ready."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List
+from sqlalchemy import text
+
+from src.config import get_settings
+from src.insight.modules.embeddings import get_embedding_executor, get_embedding_model
+from src.telemetry import COLD_START
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Representative texts so the warm-up batch exercises tokenization and padding
+WARMUP_TEXTS = [
+    "Quarterly budget review and hiring plan",
+    "Follow up with the vendor on the contract renewal before Friday",
+    "Meeting notes: roadmap priorities, open risks and decisions deferred to next week"
+]
+
+
+class Readiness:
+    """Warm-up progress of this API process."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.model_ready = False
+        self.db_ready = False
+        self.model_seconds: float | None = None
+        self.db_seconds: float | None = None
+        self.cold_start_seconds: float | None = None
+        self.error: str | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.model_ready and self.db_ready
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State reported by /ready."""
+        return {
+            "ready": self.ready,
+            "model_ready": self.model_ready,
+            "db_ready": self.db_ready,
+            "model_seconds": self.model_seconds,
+            "db_seconds": self.db_seconds,
+            "cold_start_seconds": self.cold_start_seconds,
+            "error": self.error
+        }
+
+
+def warm_embedding_model(batch_size: int | None = None) -> float:
+    """
+    Load the embedding model and encode a dummy batch.
+
+    The first encode after loading is much slower than the following ones
+    (lazy weight initialization, allocator and kernel warm-up), so it is paid
+    here instead of by the first ingest request.
+
+    Args:
+        batch_size: Texts in the dummy batch (defaults to warmup_batch_size)
+
+    Returns:
+        Seconds spent
+    """
+    start = time.perf_counter()
+    batch_size = batch_size or settings.warmup_batch_size
+
+    model = get_embedding_model()
+    texts = [WARMUP_TEXTS[i % len(WARMUP_TEXTS)] for i in range(batch_size)]
+    model.encode(texts, convert_to_numpy=True, show_progress_bar=False, batch_size=32)
+    model.encode(texts[0], convert_to_numpy=True, show_progress_bar=False)
+
+    return time.perf_counter() - start
+
+
+async def warm_async_pool(engine, connections: int) -> None:
+    """
+    Hold several connections at once, so the pool opens that many, and return them idle.
+
+    Args:
+        engine: AsyncEngine
+        connections: Connections to open (capped at the pool size)
+    """
+    connections = max(1, min(connections, engine.pool.size()))
+    opened: List[Any] = []
+    try:
+        for _ in range(connections):
+            opened.append(await engine.connect())
+        await asyncio.gather(*(connection.execute(text("SELECT 1")) for connection in opened))
+    finally:
+        for connection in opened:
+            await connection.close()
+
+
+def warm_sync_pool(engine) -> None:
+    """Open one connection of a sync engine (used by /search) and return it to the pool."""
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def warm_db_pools(connections: int | None = None) -> float:
+    """
+    Warm the API's database pools: the asyncpg engine and the sync engine
+    (and their read replicas, if configured).
+
+    Args:
+        connections: Async connections to open (defaults to warmup_db_connections)
+
+    Returns:
+        Seconds spent
+
+    Raises:
+        Exception: If the database cannot be reached
+    """
+    # Imported here so this module can be imported without creating the engines
+    from src import database, database_async
+
+    start = time.perf_counter()
+    connections = connections or settings.warmup_db_connections
+
+    await warm_async_pool(database_async.async_engine, connections)
+    await asyncio.to_thread(warm_sync_pool, database.engine)
+
+    if database_async.async_replica_engine is not None:
+        await warm_async_pool(database_async.async_replica_engine, connections)
+    if database.replica_engine is not None:
+        await asyncio.to_thread(warm_sync_pool, database.replica_engine)
+
+    return time.perf_counter() - start
+
+
+async def warm_up(state: Readiness) -> None:
+    """
+    Warm the model and the pools concurrently, updating state as each finishes.
+
+    The model is warmed on the embedding executor (where ingest encodes).
+    Database warm-up is retried every warmup_retry_seconds until the database
+    is reachable; a model that fails to load leaves the process not ready.
+
+    Args:
+        state: Readiness to update
+    """
+    async def model() -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            state.model_seconds = round(await loop.run_in_executor(get_embedding_executor(), warm_embedding_model), 3)
+        except Exception as e:
+            state.error = f"Embedding model warm-up failed: {e}"
+            logger.error(state.error)
+            raise
+        state.model_ready = True
+        logger.info(f"Embedding model warm in {state.model_seconds:.2f}s")
+
+    async def pools() -> None:
+        while True:
+            try:
+                state.db_seconds = round(await warm_db_pools(), 3)
+                break
+            except Exception as e:
+                logger.warning(f"Database pool warm-up failed, retrying in {settings.warmup_retry_seconds}s: {e}")
+                await asyncio.sleep(settings.warmup_retry_seconds)
+        state.db_ready = True
+        logger.info(f"Database pools warm in {state.db_seconds:.2f}s")
+
+    results = await asyncio.gather(model(), pools(), return_exceptions=True)
+    if any(isinstance(result, Exception) for result in results):
+        return
+
+    state.cold_start_seconds = round(time.perf_counter() - state.started_at, 3)
+    COLD_START.set(state.cold_start_seconds)
+    logger.info(f"API ready: cold start took {state.cold_start_seconds:.2f}s")
@@ -0,0 +1,82 @@
+"""Tests for the cold-storage archive of old events."""
+
+import pytest
+import sys
+from datetime import date, datetime, timezone
+from pathlib import Path
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.archive import ColdStorage, EVENT_COLUMNS, get_cold_storage, is_archived, merge_hot_and_cold
+from src.models import CoreEvent
+
+
+def make_row(event_id: str, day: int) -> dict:
+    timestamp = datetime(2025, 1, day, 12, tzinfo=timezone.utc)
+    row = {name: None for name in EVENT_COLUMNS}
+    row.update({
+        "id": event_id, "tenant_id": "default", "source": "email", "timestamp": timestamp,
+        "actor": "a@example.com", "direction": "inbound", "text": "Budget review", "decision": "none",
+        "follow_up_required": False, "urgency_score": 4, "sentiment": "neutral", "raw_ref": "ref",
+        "created_at": timestamp, "updated_at": timestamp
+    })
+    return row
+
+
+def test_merge_prefers_database_copy_and_orders_by_time():
+    """Test an event both in the database and cold storage is taken once, from the database."""
+    hot = [CoreEvent(**make_row("b", 3)), CoreEvent(**make_row("c", 1))]
+    cold = [CoreEvent(**{**make_row("b", 3), "text": "stale"}), CoreEvent(**make_row("a", 2))]
+
+    merged = merge_hot_and_cold(hot, cold)
+
+    assert [event.id for event in merged] == ["c", "a", "b"]
+    assert merged[2] is hot[0]
+    assert is_archived(cold[1])
+
+
+def test_cold_storage_is_off_by_default(monkeypatch):
+    """Test no backend is used unless configured and unknown names are rejected."""
+    monkeypatch.setattr(get_settings(), "cold_storage", "none")
+    assert get_cold_storage() is None
+
+    monkeypatch.setattr(get_settings(), "cold_storage", "glacier")
+    with pytest.raises(ValueError):
+        get_cold_storage()
+
+
+def test_incomplete_backend_cannot_be_created():
+    """Test a backend missing part of the ColdStorage interface fails at instantiation."""
+    class WriteOnly(ColdStorage):
+        def write_month(self, month, batches):
+            return 0
+
+    with pytest.raises(TypeError):
+        WriteOnly()
+
+
+def test_parquet_round_trip(tmp_path, monkeypatch):
+    """Test a month written to Parquet reads back filtered by tenant and time range."""
+    pytest.importorskip("pyarrow")
+    from src.archive import ParquetColdStorage
+
+    monkeypatch.setattr(get_settings(), "embedding_storage", "vector")
+    storage = ParquetColdStorage(tmp_path)
+    embedding = np.linspace(-1, 1, 384, dtype=np.float32)
+    rows = [
+        {**make_row("a", 2), "embedding": embedding, "topic_ids": ["t1"]},
+        {**make_row("b", 20), "embedding": None, "topic_ids": []},
+        {**make_row("c", 3), "tenant_id": "other", "embedding": embedding, "topic_ids": []},
+    ]
+
+    assert storage.write_month(date(2025, 1, 1), [rows]) == 3
+    assert storage.months() == [date(2025, 1, 1)]
+
+    events = storage.read_events(datetime(2025, 1, 1), datetime(2025, 1, 10), "default")
+
+    assert [event.id for event in events] == ["a"]
+    assert np.allclose(events[0].embedding, embedding)
+    assert is_archived(events[0])
@@ -0,0 +1,120 @@
+"""Tests for historical backfill planning."""
+
+import sys
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.insight import weekly
+from src.insight.backfill import backfill_windows, summarize_run
+from src.insight.pipeline import PipelineRun
+from src.models import CoreEvent, CoreTopic
+
+
+def test_backfill_windows_cover_range_in_order():
+    """Test weeks step back from the end date and stay inside the range."""
+    windows = backfill_windows(date(2025, 1, 1), date(2025, 2, 1))
+
+    assert [w["week_end"] for w in windows] == [
+        datetime(2025, 1, 11), datetime(2025, 1, 18), datetime(2025, 1, 25), datetime(2025, 2, 1)
+    ]
+    assert windows[0]["week_start"] >= datetime(2025, 1, 1)
+    assert all(w["baseline_start"] == w["week_start"] - (w["week_end"] - w["week_start"]) * 4 for w in windows)
+
+
+def test_backfill_windows_shorter_than_a_week():
+    """Test a range shorter than a week yields no windows."""
+    assert backfill_windows(date(2025, 1, 1), date(2025, 1, 5)) == []
+
+
+def test_summarize_run_statuses():
+    """Test run summaries distinguish completed, skipped and failed weeks."""
+    windows = backfill_windows(date(2025, 1, 1), date(2025, 1, 8))[0]
+
+    run = PipelineRun()
+    assert summarize_run(windows, run)["status"] == "completed"
+
+    run.stopped_reason = "No events"
+    assert summarize_run(windows, run)["status"] == "skipped"
+
+    failed = summarize_run(windows, None, "boom")
+    assert failed["status"] == "failed" and failed["detail"] == "boom"
+    assert failed["week_start"] == "2025-01-01"
+
+
+class TopicStore:
+    """Session stand-in keeping CoreTopic rows in memory."""
+
+    def __init__(self, topics):
+        self.topics = {str(topic.topic_id): topic for topic in topics}
+
+    def query(self, model):
+        return self
+
+    def filter(self, condition):
+        self.condition = condition
+        return self
+
+    def all(self):
+        return list(self.topics.values())
+
+    def first(self):
+        return self.topics.get(str(self.condition.right.value))
+
+    def add(self, topic):
+        topic.topic_id = topic.topic_id or uuid.uuid4()
+        self.topics[str(topic.topic_id)] = topic
+
+    def flush(self):
+        pass
+
+    def execute(self, statement):
+        pass
+
+    def commit(self):
+        pass
+
+
+def unit_vector(axis: int) -> list:
+    vector = np.zeros(384)
+    vector[axis] = 1.0
+    return vector.tolist()
+
+
+def test_backfilled_week_dates_topics_by_its_events():
+    """Test a past week creates topics dated by their first event and judges newness at the week's end."""
+    windows = backfill_windows(date(2024, 1, 1), date(2024, 1, 15))[0]
+    week_start = windows["week_start"].replace(tzinfo=timezone.utc)
+
+    old_created = datetime(2023, 6, 1, tzinfo=timezone.utc)
+    old_topic = CoreTopic(
+        topic_id=uuid.uuid4(), tenant_id="default", centroid=unit_vector(1), n_points=10,
+        created_at=old_created, last_seen_at=old_created
+    )
+    db = TopicStore([old_topic])
+
+    events = [
+        CoreEvent(
+            id=f"e{i}", timestamp=week_start + timedelta(days=day), embedding=unit_vector(axis),
+            subject="Budget", urgency_score=5, decision="none", follow_up_required=False
+        )
+        for i, (day, axis) in enumerate([(3, 0), (1, 0), (2, 1), (4, 1)])
+    ]
+    results = {"load_events": {"week": events}, "cluster": {"e0": 0, "e1": 0, "e2": 1, "e3": 1}}
+
+    stages = {stage.name: stage for stage in weekly.build_weekly_stages(db, windows, from_rollups=False)}
+    results["topics"] = stages["topics"].func(results)
+    metrics = {m["topic_id"]: m for m in stages["topic_metrics"].func(results)}
+
+    new_topic = db.topics[str(results["topics"]["e0"])]
+    assert new_topic.created_at == week_start + timedelta(days=1)
+    assert new_topic.last_seen_at == week_start + timedelta(days=3)
+    assert metrics[str(new_topic.topic_id)]["is_new"]
+
+    assert old_topic.created_at == old_created
+    assert old_topic.last_seen_at == week_start + timedelta(days=4)
+    assert not metrics[str(old_topic.topic_id)]["is_new"]
@@ -0,0 +1,65 @@
+"""Tests for the shared HTTP client registry."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.insight.modules import clients, llm
+from scripts.llm_standin_server import StandinServer
+
+
+@pytest.fixture
+def standin_server():
+    with StandinServer() as server:
+        yield server
+
+
+def test_grok_calls_reuse_pooled_connection(standin_server, monkeypatch):
+    """Test repeated provider calls share one keep-alive connection."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "grok_api_url", standin_server.url)
+    monkeypatch.setattr(settings, "grok_api_key", "test-key")
+    clients.close_clients()
+
+    try:
+        for _ in range(3):
+            enhanced, model, response_id = llm.call_grok_api("{}")
+            assert enhanced is not None
+
+        assert clients.get_http_client() is clients.get_http_client()
+        assert standin_server.requests == 3
+        assert standin_server.connections == 1
+    finally:
+        clients.close_clients()
+
+
+def test_openai_sdk_against_standin_server(standin_server, monkeypatch):
+    """Test the OpenAI SDK path speaks the stand-in server's protocol over the shared pool."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "openai_base_url", standin_server.url)
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+    clients.close_clients()
+
+    try:
+        for _ in range(2):
+            enhanced, model, response_id = llm.call_openai_api("{}")
+            assert enhanced is not None
+            assert response_id.startswith("chatcmpl-standin-")
+
+        assert standin_server.connections == 1
+    finally:
+        clients.close_clients()
+
+
+def test_sdk_clients_are_cached_per_credential():
+    """Test SDK clients are created once per API key or token."""
+    try:
+        assert clients.get_openai_client("key-a") is clients.get_openai_client("key-a")
+        assert clients.get_openai_client("key-a") is not clients.get_openai_client("key-b")
+        assert clients.get_slack_client("xoxb-a") is clients.get_slack_client("xoxb-a")
+    finally:
+        clients.close_clients()
@@ -0,0 +1,81 @@
+"""Tests for daily rollups and their merge into weekly metrics."""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import CoreEvent
+from src.insight.daily import build_daily_stages, days_between
+from src.insight.weekly import build_weekly_stages, compute_windows
+from src.insight.modules.metrics import (
+    compute_metrics, compute_rollup, merge_rollups, metrics_from_rollup,
+    compute_topic_rollups, merge_topic_rollups, topic_metrics_from_rollups
+)
+
+
+def make_events():
+    start = datetime(2025, 1, 6, tzinfo=timezone.utc)
+    events = []
+    for i in range(21):
+        events.append(CoreEvent(
+            id=f"e{i}",
+            timestamp=start + timedelta(hours=8 * i),
+            actor=f"actor{i % 4}@example.com",
+            subject=f"Subject {i % 5}",
+            text="Body",
+            thread_id=f"thread{i % 3}" if i % 2 else None,
+            decision=["made", "deferred", "none"][i % 3],
+            follow_up_required=i % 4 == 0,
+            urgency_score=i % 11
+        ))
+    return events
+
+
+def test_merged_daily_rollups_match_batch_metrics():
+    """Test merging per-day rollups gives the same metrics as computing over the whole week."""
+    events = make_events()
+    by_day = {}
+    for event in events:
+        by_day.setdefault(event.timestamp.date(), []).append(event)
+
+    merged = metrics_from_rollup(merge_rollups([compute_rollup(day) for day in by_day.values()]))
+    batch = compute_metrics(events)
+
+    for key in ("total_events", "urgency_distribution", "actor_load", "decision_counts", "follow_up_count"):
+        assert merged[key] == batch[key]
+    assert list(merged["actor_load"].values()) == sorted(batch["actor_load"].values(), reverse=True)
+    assert [(p["thread_id"], p["count"]) for p in merged["repeated_patterns"]] == \
+        [(p["thread_id"], p["count"]) for p in batch["repeated_patterns"]]
+
+
+def test_topic_rollups_merge_into_topic_metrics():
+    """Test per-day topic rollups merge into get_topic_metrics-shaped output."""
+    events = make_events()
+    topic_map = {e.id: "t1" if i < 12 else "t2" for i, e in enumerate(events)}
+    created = {"t1": datetime.now(timezone.utc), "t2": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+
+    daily = [compute_topic_rollups(events[:10], topic_map, created), compute_topic_rollups(events[10:], topic_map, created)]
+    metrics = topic_metrics_from_rollups(merge_topic_rollups(daily))
+
+    t1, t2 = metrics
+    assert (t1["topic_id"], t1["event_count"], t2["event_count"]) == ("t1", 12, 9)
+    assert t1["avg_urgency"] == round(sum(e.urgency_score for e in events[:12]) / 12, 2)
+    assert t1["decisions_deferred"] == sum(1 for e in events[:12] if e.decision == "deferred")
+    assert t1["is_new"] and not t2["is_new"]
+    assert len(t1["sample_subjects"]) == 3
+
+
+def test_daily_mode_replaces_event_stages_with_rollups():
+    """Test the weekly graph reads rollups in daily mode and daily stages skip topics for baseline days."""
+    windows = compute_windows(datetime(2025, 1, 13))
+    names = [s.name for s in build_weekly_stages(None, windows, from_rollups=True)]
+
+    assert names[:3] == ["rollups", "metrics", "topic_metrics"]
+    assert "load_events" not in names and "cluster" not in names
+
+    baseline_day = [s.name for s in build_daily_stages(None, windows["baseline_start"].date(), assign_topics=False)]
+    assert baseline_day == ["load_events", "rollup", "store"]
+    assert len(days_between(windows["baseline_start"].date(), windows["week_end"].date())) == 35
@@ -0,0 +1,31 @@
+"""Tests for the async engine and the embedding executor used by async handlers."""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database_async import async_database_url
+from src.insight.modules import embeddings
+
+
+def test_async_database_url_switches_driver():
+    """Test sync URLs (with or without an explicit driver) map to asyncpg, keeping credentials."""
+    assert async_database_url("postgresql://user:pw@db:5432/insight") == "postgresql+asyncpg://user:pw@db:5432/insight"
+    assert async_database_url("postgresql+psycopg2://u:p@h/d") == "postgresql+asyncpg://u:p@h/d"
+
+
+def test_embedding_runs_on_dedicated_executor(monkeypatch):
+    """Test async embedding is computed off the event loop thread, on the embedding executor."""
+    monkeypatch.setattr(embeddings, "generate_embedding", lambda text: threading.current_thread().name)
+
+    async def run():
+        return await asyncio.gather(*(embeddings.generate_embedding_async("text") for _ in range(4)))
+
+    names = asyncio.run(run())
+
+    assert all(name.startswith("embedding") for name in names)
+    assert threading.current_thread().name not in names
@@ -0,0 +1,205 @@
+"""Tests for the LLM enhancement layer."""
+
+import pytest
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.schemas import LLMEnhancedOutput
+from src.insight.modules import llm
+from src.insight.modules.payload import estimate_tokens
+from src.insight.modules.llm_cache import (
+    compute_cache_key, get_cached_response, store_cached_response, evict_entries
+)
+
+
+def make_output(signal: str = "Signal") -> LLMEnhancedOutput:
+    return LLMEnhancedOutput(
+        signals=[signal],
+        drift=[],
+        decision_pressure=[],
+        recommended_actions=[],
+        watchlist=[]
+    )
+
+
+def make_metrics() -> dict:
+    return {
+        "total_events": 4,
+        "urgency_distribution": {"low": 1, "medium": 2, "high": 1},
+        "actor_load": {"alice@example.com": 3, "bob@example.com": 1},
+        "decision_counts": {"made": 1, "deferred": 1, "none": 2},
+        "follow_up_count": 2,
+        "repeated_patterns": []
+    }
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "llm_cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    return tmp_path
+
+
+def test_cache_key_depends_on_request_parameters():
+    """Test cache key changes with payload, model, prompt version and temperature."""
+    base = compute_cache_key("{}", "grok-beta", "1", 0.3)
+
+    assert base == compute_cache_key("{}", "grok-beta", "1", 0.3)
+    assert base != compute_cache_key("{\"a\": 1}", "grok-beta", "1", 0.3)
+    assert base != compute_cache_key("{}", "gpt-4o", "1", 0.3)
+    assert base != compute_cache_key("{}", "grok-beta", "2", 0.3)
+    assert base != compute_cache_key("{}", "grok-beta", "1", 0.5)
+
+
+def test_cache_ttl_and_size_eviction(cache_dir, monkeypatch):
+    """Test expired entries are misses and the cache is capped in size."""
+    settings = get_settings()
+
+    store_cached_response("a", make_output(), "grok-beta", "resp-a")
+    output, model, response_id = get_cached_response("a")
+    assert output == make_output()
+    assert (model, response_id) == ("grok-beta", "resp-a")
+
+    monkeypatch.setattr(settings, "llm_cache_ttl_hours", 0)
+    assert get_cached_response("a") == (None, None, None)
+
+    monkeypatch.setattr(settings, "llm_cache_ttl_hours", 24)
+    monkeypatch.setattr(settings, "llm_cache_max_entries", 2)
+    for key in ("b", "c", "d"):
+        store_cached_response(key, make_output(), "grok-beta", key)
+
+    evict_entries()
+    assert len(list(cache_dir.glob("*.json"))) == 2
+
+
+def test_cache_hits_do_not_extend_ttl(cache_dir, monkeypatch):
+    """Test eviction expires entries by creation time even after recent hits."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "llm_cache_ttl_hours", 1)
+
+    store_cached_response("a", make_output(), "grok-beta", "resp-a")
+    path = cache_dir / "a.json"
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    entry["created_at"] -= 2 * 3600
+    path.write_text(json.dumps(entry), encoding="utf-8")
+
+    # A fresh mtime, as left by a cache hit, must not keep the entry alive
+    assert path.stat().st_mtime > entry["created_at"] + 3600
+    assert evict_entries() == 1
+    assert not path.exists()
+
+
+def test_enhance_with_llm_uses_cache(cache_dir, monkeypatch):
+    """Test a cached response is returned without calling any provider."""
+    calls = []
+
+    def fake_grok(facts_payload):
+        calls.append("grok")
+        return make_output("From Grok"), "grok-beta", "resp-1"
+
+    def fail_openai(facts_payload):
+        calls.append("openai")
+        return None, None, None
+
+    monkeypatch.setattr(llm, "call_grok_api", fake_grok)
+    monkeypatch.setattr(llm, "call_openai_api", fail_openai)
+
+    args = (make_metrics(), make_metrics(), {}, [], [])
+
+    first = llm.enhance_with_llm(*args)
+    second = llm.enhance_with_llm(*args)
+    assert first == second == (make_output("From Grok"), True, "grok-beta", "resp-1")
+    assert calls == ["grok"]
+
+    llm.enhance_with_llm(*args, refresh=True)
+    assert calls == ["grok", "grok"]
+
+
+def test_hedged_fallback_wins_when_primary_is_slow(cache_dir, monkeypatch):
+    """Test the fallback fires after the hedge delay and the slow primary is cancelled."""
+    cancelled = []
+
+    async def slow_grok(facts_payload):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("grok")
+            raise
+        return make_output("From Grok"), "grok-beta", "resp-grok"
+
+    async def fast_openai(facts_payload):
+        await asyncio.sleep(0.01)
+        return make_output("From OpenAI"), "gpt-4o", "resp-openai"
+
+    monkeypatch.setattr(llm, "call_grok_api_async", slow_grok)
+    monkeypatch.setattr(llm, "call_openai_api_async", fast_openai)
+
+    enhanced, used, model, response_id, hedge = asyncio.run(llm.enhance_with_llm_hedged(
+        make_metrics(), make_metrics(), {}, [], [], refresh=True, hedge_delay=0.05
+    ))
+
+    assert used and model == "gpt-4o" and enhanced.signals == ["From OpenAI"]
+    assert hedge["winner"] == "openai"
+    assert hedge["primary_outcome"] == "cancelled"
+    assert hedge["latency_saved_seconds"] > 0
+    assert cancelled == ["grok"]
+
+
+def test_hedged_primary_failure_fires_fallback_immediately(cache_dir, monkeypatch):
+    """Test a failed primary does not wait out the hedge delay."""
+    async def failing_grok(facts_payload):
+        return None, None, None
+
+    async def fast_openai(facts_payload):
+        return make_output("From OpenAI"), "gpt-4o", "resp-openai"
+
+    monkeypatch.setattr(llm, "call_grok_api_async", failing_grok)
+    monkeypatch.setattr(llm, "call_openai_api_async", fast_openai)
+
+    enhanced, used, model, response_id, hedge = asyncio.run(llm.enhance_with_llm_hedged(
+        make_metrics(), make_metrics(), {}, [], [], refresh=True, hedge_delay=10
+    ))
+
+    assert used and hedge["winner"] == "openai"
+    assert hedge["primary_outcome"] == "failed"
+    assert hedge["elapsed_seconds"] < 1
+
+
+def test_facts_payload_compaction_fits_budget(monkeypatch):
+    """Test large payloads are rolled up to fit the token budget."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "llm_token_budget", 600)
+    monkeypatch.setattr(settings, "llm_payload_top_k", 10)
+
+    week = make_metrics()
+    week["actor_load"] = {f"actor{i}@example.com": 100 - i for i in range(50)}
+    week["repeated_patterns"] = [
+        {"thread_id": f"thread_{i}", "count": 10 - i % 5, "subjects": ["Quarterly budget review"]}
+        for i in range(20)
+    ]
+    topics = [
+        {
+            "topic_id": f"topic-{i}", "event_count": 30 - i, "avg_urgency": 5.0,
+            "decisions_made": 0, "decisions_deferred": 1, "follow_up_required": 2,
+            "sample_subjects": ["Quarterly budget review"], "created_at": "2025-12-20T00:00:00",
+            "is_new": False
+        }
+        for i in range(20)
+    ]
+
+    payload = llm.prepare_facts_payload(week, make_metrics(), {}, topics, [])
+    facts = json.loads(payload)
+
+    assert estimate_tokens(payload) <= 600
+    assert any(key.startswith("other (") for key in facts["metrics"]["week"]["actor_load"])
+    assert facts["topics"][-1]["topic_id"] == "other"
+    assert facts["subject_refs"] == {"@S1": "Quarterly budget review"}
+    # Inputs are left untouched for the audit bundle
+    assert len(week["actor_load"]) == 50
@@ -0,0 +1,61 @@
+"""Tests for monthly partition maintenance of core_events."""
+
+import asyncio
+import pytest
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.partitions import (
+    EVENT_ID_LOCK_NAMESPACE, PARTITION_NAME, add_months, find_event_for_update_async, maintain_partitions,
+    month_start, partition_name
+)
+
+
+def test_month_arithmetic_crosses_years():
+    """Test month starts and offsets across year boundaries."""
+    assert month_start(date(2025, 3, 31)) == date(2025, 3, 1)
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert add_months(date(2025, 1, 1), -13) == date(2023, 12, 1)
+
+
+def test_partition_names_round_trip():
+    """Test partition names match the SQL function's naming and parse back."""
+    name = partition_name(date(2025, 7, 1))
+    assert name == "core_events_y2025m07"
+
+    match = PARTITION_NAME.match(name)
+    assert (int(match.group(1)), int(match.group(2))) == (2025, 7)
+    assert PARTITION_NAME.match("core_events_default") is None
+
+
+def test_retention_shorter_than_weekly_window_is_rejected():
+    """Test a retention that would detach data a weekly run still reads is refused."""
+    with pytest.raises(ValueError):
+        maintain_partitions(date(2025, 6, 15), premake_months=3, retention_months=1)
+
+
+def test_event_lookup_locks_the_id_first():
+    """Test an ingest takes the event ID's transaction lock before looking the event up."""
+    class Session:
+        def __init__(self):
+            self.statements = []
+
+        async def execute(self, statement, params=None):
+            self.statements.append((str(statement), params))
+
+        async def scalar(self, statement):
+            self.statements.append((str(statement), None))
+            return None
+
+    db = Session()
+    assert asyncio.run(find_event_for_update_async(db, "msg-1")) is None
+
+    (lock, lock_params), (lookup, _) = db.statements
+    assert lock == "SELECT pg_advisory_xact_lock(:namespace, hashtext(:event_id))"
+    assert lock_params == {"namespace": EVENT_ID_LOCK_NAMESPACE, "event_id": "msg-1"}
+    assert "FROM core_events" in lookup and "core_events.id =" in lookup
@@ -0,0 +1,183 @@
+"""Tests for the dependency-graph pipeline runner."""
+
+import pytest
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.insight.pipeline import Stage, StopPipeline, run_pipeline, topological_order
+
+
+def sleeper(name: str, seconds: float, log: list):
+    def func(results):
+        log.append(f"{name}:start")
+        time.sleep(seconds)
+        log.append(f"{name}:end")
+        return name
+    return func
+
+
+def test_independent_stages_overlap_and_critical_path():
+    """Test independent stages run concurrently and the longest chain is reported."""
+    log = []
+    stages = [
+        Stage("load", sleeper("load", 0.05, log)),
+        Stage("slow", sleeper("slow", 0.3, log), deps=("load",)),
+        Stage("fast", sleeper("fast", 0.05, log), deps=("load",)),
+        Stage("report", sleeper("report", 0.05, log), deps=("slow", "fast")),
+    ]
+
+    run = asyncio.run(run_pipeline(stages))
+
+    assert run.results["report"] == "report"
+    assert run.wall_seconds < 0.5
+    assert run.critical_path == ["load", "slow", "report"]
+    assert log.index("fast:start") < log.index("slow:end")
+
+
+def test_shared_resource_is_serialized():
+    """Test stages on the same resource never overlap."""
+    log = []
+    stages = [
+        Stage("a", sleeper("a", 0.05, log), resource="db"),
+        Stage("b", sleeper("b", 0.05, log), resource="db"),
+    ]
+
+    asyncio.run(run_pipeline(stages))
+
+    assert log in (["a:start", "a:end", "b:start", "b:end"], ["b:start", "b:end", "a:start", "a:end"])
+
+
+def test_stop_pipeline_skips_dependents():
+    """Test StopPipeline ends the run without running dependent stages."""
+    def empty(results):
+        raise StopPipeline("No events")
+
+    stages = [
+        Stage("load", empty),
+        Stage("metrics", lambda results: 1, deps=("load",)),
+    ]
+
+    run = asyncio.run(run_pipeline(stages))
+
+    assert run.stopped and run.stopped_reason == "No events"
+    assert "metrics" not in run.results
+
+
+def test_cycles_are_rejected():
+    """Test dependency cycles are detected."""
+    with pytest.raises(ValueError):
+        topological_order([
+            Stage("a", lambda r: None, deps=("b",)),
+            Stage("b", lambda r: None, deps=("a",)),
+        ])
+
+
+class MemoryCheckpoints:
+    """In-memory stand-in for CheckpointStore."""
+
+    def __init__(self):
+        self.payloads = {}
+
+    def load_all(self):
+        return dict(self.payloads)
+
+    def save(self, stage, payload):
+        self.payloads[stage] = payload
+
+    def delete(self, stages):
+        for stage in stages:
+            self.payloads.pop(stage, None)
+
+
+def counting_stages(calls: dict, fail_at: str | None = None):
+    def make(name):
+        def func(results):
+            calls[name] = calls.get(name, 0) + 1
+            if name == fail_at:
+                raise RuntimeError(f"{name} failed")
+            return name
+        return func
+
+    keep = dict(dump=lambda r: {"value": r}, restore=lambda p: p["value"])
+    return [
+        Stage("load", make("load")),
+        Stage("cluster", make("cluster"), deps=("load",), **keep),
+        Stage("metrics", make("metrics"), deps=("cluster",), **keep),
+        Stage("report", make("report"), deps=("metrics",), **keep),
+    ]
+
+
+def test_resume_skips_completed_stages():
+    """Test a resumed run restores checkpoints and only runs what is left."""
+    store, calls = MemoryCheckpoints(), {}
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run_pipeline(counting_stages(calls, fail_at="report"), checkpoints=store))
+    assert set(store.payloads) == {"cluster", "metrics"}
+
+    calls.clear()
+    run = asyncio.run(run_pipeline(counting_stages(calls), checkpoints=store, resume=True))
+
+    assert calls == {"report": 1}
+    assert run.restored == ["metrics"]
+    assert run.skipped == ["load", "cluster"]
+    assert run.results["report"] == "report"
+
+
+def test_from_stage_invalidates_downstream_checkpoints():
+    """Test from_stage recomputes the stage and its dependents but restores upstream."""
+    store, calls = MemoryCheckpoints(), {}
+    asyncio.run(run_pipeline(counting_stages(calls), checkpoints=store))
+
+    calls.clear()
+    run = asyncio.run(run_pipeline(counting_stages(calls), checkpoints=store, from_stage="metrics"))
+
+    assert calls == {"metrics": 1, "report": 1}
+    assert run.restored == ["cluster"]
+    assert "load" in run.skipped
+
+
+def test_fresh_run_clears_checkpoints():
+    """Test a run without resume starts from scratch."""
+    store, calls = MemoryCheckpoints(), {}
+    store.payloads["report"] = {"value": "stale"}
+
+    run = asyncio.run(run_pipeline(counting_stages(calls), checkpoints=store))
+
+    assert calls == {"load": 1, "cluster": 1, "metrics": 1, "report": 1}
+    assert run.restored == []
+
+
+def test_targets_limit_the_run():
+    """Test targets only run the stages they need and still checkpoint them."""
+    store, calls = MemoryCheckpoints(), {}
+
+    run = asyncio.run(run_pipeline(counting_stages(calls), checkpoints=store, targets=["cluster"]))
+
+    assert calls == {"load": 1, "cluster": 1}
+    assert run.skipped == ["metrics", "report"]
+    assert set(store.payloads) == {"cluster"}
+
+
+def test_stage_profile_records_cpu_memory_and_rows():
+    """Test each executed stage gets wall time, CPU time, RSS delta and row counts."""
+    def busy(results):
+        return [sum(range(200000)) for _ in range(5)]
+
+    stages = [
+        Stage("load", busy, rows=len),
+        Stage("report", lambda results: "done", deps=("load",)),
+    ]
+
+    run = asyncio.run(run_pipeline(stages))
+    profile = run.timings["load"]
+
+    assert profile["cpu_seconds"] > 0
+    assert profile["peak_rss_delta_mb"] >= 0
+    assert profile["rows"] == 5
+    assert run.timings["report"]["rows"] is None
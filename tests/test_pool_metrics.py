@@ -0,0 +1,77 @@
+"""Tests for connection pool profiles and pool metrics."""
+
+import pytest
+import sys
+from pathlib import Path
+from sqlalchemy import create_engine, exc, text
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.database import engine_profile
+from src.pool_metrics import InstrumentedQueuePool, get_pool_stats, instrument_engine
+
+
+def make_engine(tmp_path, **options):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=True,
+        **options
+    )
+
+
+def test_profiles_read_their_own_settings(monkeypatch):
+    """Test each profile maps to its db_<profile>_* settings and unknown ones are rejected."""
+    monkeypatch.setattr(get_settings(), "db_batch_pool_size", 7)
+    monkeypatch.setattr(get_settings(), "db_batch_statement_timeout_ms", 0)
+
+    batch = engine_profile("batch")
+    assert batch["pool_size"] == 7
+    assert batch["statement_timeout_ms"] == 0
+    assert engine_profile("api")["statement_timeout_ms"] == get_settings().db_api_statement_timeout_ms
+
+    with pytest.raises(ValueError):
+        engine_profile("reporting")
+
+
+def test_checkouts_saturation_and_timeouts_are_recorded(tmp_path):
+    """Test checkout counts, peak saturation and pool timeouts survive engine.dispose()."""
+    engine = make_engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+    stats = instrument_engine(engine, "test-pool", 1, 0)
+
+    held = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    held.close()
+
+    engine.dispose()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    snapshot = next(s for s in get_pool_stats() if s["name"] == "test-pool")
+    assert snapshot["checkouts"] == 2
+    assert snapshot["timeouts"] == 1
+    assert snapshot["peak_saturation"] == 1.0
+    assert snapshot["wait_seconds_max"] >= 0.05
+    assert sum(snapshot["wait_buckets"].values()) == 3
+    assert stats.pool is engine.pool
+
+
+def test_pre_ping_failures_are_counted(tmp_path):
+    """Test a pre-ping on a dead connection fires handle_error, is counted and the connection replaced."""
+    engine = make_engine(tmp_path, pool_size=1, max_overflow=0, pool_reset_on_return=None)
+    stats = instrument_engine(engine, "test-ping", 1, 0)
+
+    # Fresh connection (not pinged); kill it behind the pool's back
+    connection = engine.connect()
+    connection.connection.dbapi_connection.close()
+    connection.close()
+
+    # Reused connection: the ping fails, the pool reconnects transparently
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
+
+    assert stats.pre_ping_failures == 1
+    assert stats.invalidations == 1
@@ -0,0 +1,115 @@
+"""Tests for read replica routing and lag-aware fallback."""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import database
+from src.config import get_settings
+from src.database import ReplicaLagCache, get_read_db_context, replica_is_fresh
+from src.insight import weekly
+from src.models import CoreEvent
+
+
+class TopicSession:
+    """Session stand-in answering CoreTopic lookups from a dict."""
+
+    def __init__(self, topics):
+        self.topics = topics
+        self.looked_up = []
+
+    def query(self, model):
+        return self
+
+    def filter(self, condition):
+        self.topic_id = str(condition.right.value)
+        return self
+
+    def first(self):
+        self.looked_up.append(self.topic_id)
+        return self.topics.get(self.topic_id)
+
+    def close(self):
+        pass
+
+
+def test_replica_freshness_against_window_and_max_lag():
+    """Test the replica is used only when it has replayed the window and is within the lag bound."""
+    now = datetime(2025, 1, 13, 6, 0, tzinfo=timezone.utc)
+    window_end = datetime(2025, 1, 13, 0, 0, tzinfo=timezone.utc)
+
+    assert replica_is_fresh(now, window_end, now=now)
+    assert replica_is_fresh(now - timedelta(hours=1), window_end, now=now)
+    assert not replica_is_fresh(now - timedelta(hours=7), window_end, now=now)
+    assert not replica_is_fresh(None, window_end, now=now)
+
+    # Naive window ends (daily runs) are taken as UTC
+    assert not replica_is_fresh(now - timedelta(seconds=1), now.replace(tzinfo=None), now=now)
+
+    assert replica_is_fresh(now - timedelta(seconds=10), max_lag_seconds=30.0, now=now)
+    assert not replica_is_fresh(now - timedelta(seconds=45), max_lag_seconds=30.0, now=now)
+
+
+def test_cached_replay_time_ages(monkeypatch):
+    """Test the replay time is measured once per interval and its lag keeps growing meanwhile."""
+    monkeypatch.setattr(get_settings(), "replica_lag_check_seconds", 60.0)
+    replayed_at = datetime(2025, 1, 13, 6, 0, tzinfo=timezone.utc)
+    calls = []
+
+    def measure():
+        calls.append(1)
+        return replayed_at
+
+    cache = ReplicaLagCache()
+    assert cache.get(measure) == replayed_at
+    assert cache.get(measure) == replayed_at
+    assert len(calls) == 1
+
+    # A measurement showing no lag when taken is stale 40 seconds later
+    later = replayed_at + timedelta(seconds=40)
+    assert not replica_is_fresh(cache.get(measure), max_lag_seconds=30.0, now=later)
+
+    def unreachable():
+        raise ConnectionError("replica down")
+
+    failing = ReplicaLagCache()
+    assert failing.get(unreachable) is None
+
+
+def test_read_context_uses_primary_without_replica(monkeypatch):
+    """Test reads stay on the given primary session when no replica is configured."""
+    monkeypatch.setattr(database, "replica_engine", None)
+    primary = object()
+
+    with get_read_db_context(required_as_of=datetime.now(timezone.utc) - timedelta(days=1), primary=primary) as db:
+        assert db is primary
+
+
+def test_topic_metrics_read_this_runs_topics_from_primary(monkeypatch):
+    """Test a replica reporting no lag but missing the run's new topic is not used for topic metrics."""
+    topic_id = "3f2b1c9e-8d4a-4e6b-9c1d-2a7f5e8b0c13"
+    created = datetime.now(timezone.utc)
+    primary = TopicSession({topic_id: SimpleNamespace(created_at=created)})
+    replica = TopicSession({})
+
+    # The replica reports no lag at all (it has replayed everything it received)
+    monkeypatch.setattr(database, "replica_engine", object())
+    monkeypatch.setattr(database, "ReadSessionLocal", lambda: replica)
+    monkeypatch.setattr(database, "use_replica", lambda *args, **kwargs: True)
+
+    windows = weekly.compute_windows()
+    stages = {stage.name: stage for stage in weekly.build_weekly_stages(primary, windows, from_rollups=False)}
+    event = CoreEvent(
+        id="e1", timestamp=windows["week_start"], subject="Budget", text="Body",
+        urgency_score=5, decision="none", follow_up_required=False
+    )
+
+    metrics = stages["topic_metrics"].func({"load_events": {"week": [event]}, "topics": {"e1": topic_id}})
+
+    assert metrics[0]["topic_id"] == topic_id
+    assert metrics[0]["created_at"] == created.isoformat()
+    assert replica.looked_up == []
@@ -0,0 +1,163 @@
+"""Tests for provider retries and circuit breaking."""
+
+import pytest
+import sys
+from pathlib import Path
+from urllib.error import URLError
+import httpx
+import openai
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.insight.modules import resilience
+from src.insight.modules.resilience import (
+    CircuitOpenError, call_with_retry, classify_error, classify_llm_error, classify_unsent_error,
+    get_circuit_breaker, get_resilience_counters, parse_retry_after
+)
+
+
+def status_error(status_code: int, retry_after: str | None = None) -> httpx.HTTPStatusError:
+    headers = {"Retry-After": retry_after} if retry_after else {}
+    request = httpx.Request("POST", "http://provider.test/chat/completions")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "retry_max_attempts", 3)
+    monkeypatch.setattr(settings, "retry_base_delay_seconds", 0.01)
+    monkeypatch.setattr(settings, "retry_max_delay_seconds", 10.0)
+    monkeypatch.setattr(settings, "circuit_failure_threshold", 2)
+    monkeypatch.setattr(settings, "circuit_reset_seconds", 60.0)
+    monkeypatch.setattr(settings, "retry_deadline_seconds", 60.0)
+
+    sleeps = []
+    monkeypatch.setattr(resilience.time, "sleep", sleeps.append)
+    resilience.reset_resilience_state()
+    yield sleeps
+    resilience.reset_resilience_state()
+
+
+def test_retry_honors_retry_after(fresh_state, monkeypatch):
+    """Test transient errors are retried and Retry-After is respected."""
+    monkeypatch.setattr(get_settings(), "circuit_failure_threshold", 3)
+    outcomes = [status_error(429, "2"), status_error(503), "ok"]
+
+    def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert call_with_retry("grok", flaky) == "ok"
+    assert fresh_state[0] >= 2
+    assert get_resilience_counters()["grok"]["attempts"] == 3
+    assert get_resilience_counters()["grok"]["retries"] == 2
+
+
+def test_client_errors_are_not_retried():
+    """Test non-transient errors fail on the first attempt."""
+    def bad_request():
+        raise status_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retry("grok", bad_request)
+
+    assert get_resilience_counters()["grok"]["attempts"] == 1
+
+
+def test_circuit_opens_and_skips_provider():
+    """Test every failed attempt counts against the provider, so the circuit opens mid-retry."""
+    calls = []
+
+    def down():
+        calls.append(1)
+        raise httpx.ConnectError("connection refused")
+
+    with pytest.raises(httpx.ConnectError):
+        call_with_retry("openai", down)
+
+    with pytest.raises(CircuitOpenError):
+        call_with_retry("openai", down)
+
+    assert len(calls) == 2
+    assert get_resilience_counters()["openai"]["failures"] == 1
+    assert get_resilience_counters()["openai"]["open_circuit_skips"] == 1
+
+
+def test_retries_stop_at_deadline(fresh_state, monkeypatch):
+    """Test no retry is started when its backoff would end after the call's deadline."""
+    monkeypatch.setattr(get_settings(), "retry_deadline_seconds", 1.0)
+    monkeypatch.setattr(get_settings(), "retry_max_attempts", 5)
+    monkeypatch.setattr(get_settings(), "circuit_failure_threshold", 10)
+    calls = []
+
+    def throttled():
+        calls.append(1)
+        raise status_error(429, "30")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retry("grok", throttled)
+
+    assert len(calls) == 1
+    assert fresh_state == []
+
+
+def test_llm_timeouts_are_not_retried_but_count_against_provider():
+    """Test LLM timeouts fail at once (the hedge covers latency) yet still feed the circuit breaker."""
+    request = httpx.Request("POST", "http://provider.test/chat/completions")
+    calls = []
+
+    def slow():
+        calls.append(1)
+        raise openai.APITimeoutError(request=request)
+
+    with pytest.raises(openai.APITimeoutError):
+        call_with_retry("openai", slow, classify=classify_llm_error)
+
+    assert len(calls) == 1
+    assert get_circuit_breaker("openai").consecutive_failures == 1
+    assert classify_llm_error(httpx.ReadTimeout("timed out", request=request)) == (False, None)
+    assert classify_llm_error(status_error(503)) == (True, None)
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds and invalid values."""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+
+
+def test_unsent_policy_retries_only_what_cannot_have_been_posted():
+    """Test non-idempotent calls retry 429s and refused connections but not timeouts, resets or 5xx."""
+    request = httpx.Request("POST", "https://slack.com/api/chat.postMessage")
+
+    assert classify_unsent_error(status_error(429, "3")) == (True, 3.0)
+    assert classify_unsent_error(URLError(ConnectionRefusedError(111, "Connection refused"))) == (True, None)
+    assert classify_unsent_error(httpx.ConnectError("refused", request=request)) == (True, None)
+
+    assert classify_unsent_error(status_error(503)) == (False, None)
+    assert classify_unsent_error(URLError(ConnectionResetError(104, "Connection reset by peer"))) == (False, None)
+    assert classify_unsent_error(httpx.ReadTimeout("timed out", request=request)) == (False, None)
+
+    # The full policy (conversations_open) retries all of these
+    assert classify_error(URLError(ConnectionResetError(104, "Connection reset by peer"))) == (True, None)
+    assert classify_error(status_error(503)) == (True, None)
+
+
+def test_unsent_policy_gives_up_after_server_error():
+    """Test a post failing with 5xx is not repeated."""
+    calls = []
+
+    def post():
+        calls.append(1)
+        raise status_error(502)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retry("slack", post, classify=classify_unsent_error)
+
+    assert len(calls) == 1
@@ -0,0 +1,120 @@
+"""Tests for semantic search over event embeddings."""
+
+import pytest
+import sys
+from datetime import date, datetime, timezone
+from pathlib import Path
+import numpy as np
+from sqlalchemy.dialects import postgresql
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import search
+from src.config import get_settings
+from src.models import CoreEvent
+from src.search import (
+    build_hybrid_query, build_search_query, configure_index_scan, merge_cold_results, search_cold_events
+)
+
+
+def compile_query(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_search_query_orders_by_cosine_distance():
+    """Test the query is an index-friendly ORDER BY <=> LIMIT scoped to the tenant."""
+    sql = compile_query(build_search_query([0.1] * 384, "acme", 5))
+
+    assert "<=>" in sql
+    assert "ORDER BY distance" in sql
+    assert "LIMIT" in sql
+    assert "core_events.tenant_id =" in sql
+    assert "core_events.embedding IS NOT NULL" in sql
+    assert "core_events.source =" not in sql
+    assert "core_events.embedding," not in sql
+
+
+def test_search_query_applies_optional_filters():
+    """Test time, source and actor filters are added only when given."""
+    sql = compile_query(build_search_query(
+        [0.1] * 384, "acme", 5,
+        start=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        source="email",
+        actor="jane"
+    ))
+
+    assert "core_events.timestamp >=" in sql
+    assert "core_events.timestamp <" in sql
+    assert "core_events.source =" in sql
+    assert "core_events.actor ILIKE" in sql
+
+
+def test_unknown_iterative_scan_mode_is_rejected(monkeypatch):
+    """Test a misconfigured iterative scan mode fails before touching the database."""
+    monkeypatch.setattr(get_settings(), "search_iterative_scan", "sometimes")
+
+    with pytest.raises(ValueError):
+        configure_index_scan(db=None, limit=10)
+
+
+def test_hybrid_query_fuses_both_retrievers_in_one_statement():
+    """Test hybrid search ranks vector and full-text candidates separately and fuses them by rank."""
+    sql = compile_query(build_hybrid_query([0.1] * 384, "INC-4521 outage", "acme", 10, source="email"))
+
+    assert "WITH semantic AS" in sql
+    assert "lexical AS" in sql
+    assert "<=>" in sql
+    assert "websearch_to_tsquery" in sql
+    assert "core_events.search_vector @@" in sql
+    assert "ts_rank_cd" in sql
+    assert sql.count("row_number() OVER") == 2
+    assert "FULL OUTER JOIN" in sql
+    assert sql.count("core_events.source =") == 2
+
+
+def archived_row(event_id: str, day: int, embedding, source: str = "email") -> dict:
+    timestamp = datetime(2025, 1, day, 12, tzinfo=timezone.utc)
+    return {
+        "id": event_id, "tenant_id": "acme", "source": source, "timestamp": timestamp, "actor": "Jane Doe",
+        "direction": "inbound", "subject": None, "text": "Budget review", "thread_id": None, "decision": "none",
+        "action_owner": None, "follow_up_required": False, "urgency_score": 4, "sentiment": "neutral",
+        "raw_ref": "ref", "created_at": timestamp, "updated_at": timestamp,
+        "embedding": embedding, "topic_ids": []
+    }
+
+
+def test_cold_search_scans_archived_months_in_range(tmp_path, monkeypatch):
+    """Test archived events are ranked by exact cosine similarity and only read for archived ranges."""
+    pytest.importorskip("pyarrow")
+    from src.archive import ParquetColdStorage
+
+    monkeypatch.setattr(get_settings(), "embedding_storage", "vector")
+    storage = ParquetColdStorage(tmp_path)
+    near, far = np.zeros(384, dtype=np.float32), np.zeros(384, dtype=np.float32)
+    near[0], far[1] = 1.0, 1.0
+    storage.write_month(date(2025, 1, 1), [[
+        archived_row("far", 5, far),
+        archived_row("near", 6, near),
+        archived_row("meeting", 7, near, source="meeting"),
+        archived_row("unembedded", 8, None),
+    ]])
+    monkeypatch.setattr(search, "get_cold_storage", lambda: storage)
+
+    hits = search_cold_events(near.tolist(), "acme", 5, source="email")
+    assert [(event.id, round(similarity, 4)) for event, similarity in hits] == [("near", 1.0), ("far", 0.0)]
+
+    assert search_cold_events(near.tolist(), "acme", 5, start=datetime(2025, 2, 1)) == []
+    assert search_cold_events(near.tolist(), "other", 5) == []
+
+
+def test_cold_results_merge_by_similarity():
+    """Test archived hits are interleaved with database hits by similarity and re-ranked."""
+    hot = [CoreEvent(id="h1"), CoreEvent(id="h2")]
+    cold = [(CoreEvent(id="c1"), 0.8), (CoreEvent(id="h2"), 0.99)]
+    rows = [(hot[0], None, 0.9, 1, None), (hot[1], None, 0.5, 2, None)]
+
+    merged = merge_cold_results(rows, cold, limit=2, mode="semantic")
+
+    assert [(event.id, similarity, rank) for event, _, similarity, rank, _ in merged] == [("h1", 0.9, 1), ("c1", 0.8, 2)]
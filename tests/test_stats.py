@@ -0,0 +1,93 @@
+"""Tests for /stats served from event counters behind a TTL cache."""
+
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+from sqlalchemy.dialects import postgresql
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.stats import (
+    EVENT_COUNTS_LOCK_KEY, StatsCache, build_daily_query, build_totals_query, compact_event_counts, daily_counts
+)
+
+
+def test_stats_queries_read_counters_not_events():
+    """Test both statistics queries add the pending deltas to the counters and never read core_events."""
+    for query in (build_totals_query(), build_daily_query(date(2025, 1, 7))):
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "FROM core_event_counts UNION ALL" in sql
+        assert "FROM core_event_count_deltas" in sql
+        assert "core_events" not in sql.replace("core_event_counts", "")
+
+
+def test_compaction_moves_deltas_in_one_locked_statement():
+    """Test compaction takes the counters lock and deletes and adds the deltas in a single statement."""
+    class Result:
+        rowcount = 3
+
+    class Session:
+        def __init__(self):
+            self.statements = []
+            self.committed = False
+
+        def execute(self, statement, params=None):
+            self.statements.append((str(statement), params))
+            return Result()
+
+        def commit(self):
+            self.committed = True
+
+    db = Session()
+
+    assert compact_event_counts(db) == 3
+    assert db.statements[0] == ("SELECT pg_advisory_xact_lock(:key)", {"key": EVENT_COUNTS_LOCK_KEY})
+    assert "DELETE FROM core_event_count_deltas" in db.statements[1][0]
+    assert "ON CONFLICT (tenant_id, day, source) DO UPDATE" in db.statements[1][0]
+    assert db.committed
+
+
+def test_daily_counts_fill_empty_days():
+    """Test per-day counts cover every day of the window, oldest first, with sources split."""
+    rows = [
+        (date(2025, 1, 6), "email", 4),
+        (date(2025, 1, 6), "meeting", 1),
+        (date(2025, 1, 8), "email", 2),
+        (date(2024, 12, 1), "email", 99)
+    ]
+
+    daily = daily_counts(rows, date(2025, 1, 8), 3)
+
+    assert [d["day"] for d in daily] == ["2025-01-06", "2025-01-07", "2025-01-08"]
+    assert daily[0] == {"day": "2025-01-06", "events": 5, "email_events": 4, "meeting_events": 1}
+    assert daily[1]["events"] == 0
+    assert daily[2]["email_events"] == 2
+
+
+def test_cache_loads_once_per_ttl(monkeypatch):
+    """Test concurrent requests share one load and the value is reused until it expires."""
+    monkeypatch.setattr(get_settings(), "stats_cache_ttl_seconds", 60.0)
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return {"total_events": len(loads)}
+
+    async def run():
+        cache = StatsCache()
+        results = await asyncio.gather(*(cache.get(load) for _ in range(10)))
+        again = await cache.get(load)
+        cache.expires_at = 0
+        expired = await cache.get(load)
+        return results, again, expired
+
+    results, again, expired = asyncio.run(run())
+
+    assert all(r == {"total_events": 1} for r in results)
+    assert again == {"total_events": 1}
+    assert expired == {"total_events": 2}
+    assert len(loads) == 2
@@ -0,0 +1,78 @@
+"""Tests for the Prometheus metrics of the API and batch runs."""
+
+import sys
+from pathlib import Path
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY, generate_latest
+from sqlalchemy import create_engine, text
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_settings
+from src.insight.pipeline import PipelineRun
+from src.pool_metrics import InstrumentedQueuePool, instrument_engine
+from src.telemetry import export_batch_metrics, record_pipeline_run, record_request_latency
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_request_latency_is_labelled_by_route_template():
+    """Test requests are observed under their route template and unknown paths share one label."""
+    app = FastAPI()
+    app.middleware("http")(record_request_latency)
+
+    @app.get("/items/{item_id}")
+    def item(item_id: str):
+        return {"id": item_id}
+
+    before = sample("http_request_duration_seconds_count", method="GET", route="/items/{item_id}", status="200")
+    client = TestClient(app)
+    client.get("/items/a")
+    client.get("/items/b")
+    client.get("/missing")
+
+    assert sample(
+        "http_request_duration_seconds_count", method="GET", route="/items/{item_id}", status="200"
+    ) == before + 2
+    assert sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404") >= 1
+
+
+def test_pool_stats_are_exposed(tmp_path):
+    """Test instrumented pools appear as gauges, counters and a wait histogram."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool, pool_size=2)
+    instrument_engine(engine, "telemetry-test", 2, 0)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert sample("db_pool_checkouts_total", pool="telemetry-test") == 1
+    assert sample("db_pool_wait_seconds_count", pool="telemetry-test") == 1
+    assert sample("db_pool_wait_seconds_bucket", pool="telemetry-test", le="+Inf") == 1
+    engine.dispose()
+
+
+def test_pipeline_run_is_exported_to_textfile(tmp_path, monkeypatch):
+    """Test a run's stage durations are recorded and the batch job writes them to a textfile."""
+    run = PipelineRun()
+    run.timings = {
+        "load_events": {"duration": 1.5, "cpu_seconds": 0.5},
+        "cluster": {"duration": 3.0, "cpu_seconds": 2.9}
+    }
+    run.wall_seconds = 4.6
+    record_pipeline_run(run, "weekly", "acme")
+
+    assert sample("pipeline_stage_duration_seconds", kind="weekly", tenant="acme", stage="cluster") == 3.0
+    assert sample("pipeline_run_duration_seconds", kind="weekly", tenant="acme") == 4.6
+    assert sample("pipeline_run_stopped", kind="weekly", tenant="acme") == 0
+
+    monkeypatch.setattr(get_settings(), "metrics_textfile_dir", str(tmp_path / "textfile"))
+    monkeypatch.setattr(get_settings(), "metrics_pushgateway_url", None)
+    exported = export_batch_metrics("weekly_run")
+
+    written = Path(exported["textfile"]).read_text()
+    assert exported["textfile"].endswith("weekly_run.prom")
+    assert 'pipeline_stage_duration_seconds{kind="weekly",stage="cluster",tenant="acme"} 3.0' in written
+    assert generate_latest(REGISTRY).decode().count("pipeline_run_duration_seconds{") >= 1
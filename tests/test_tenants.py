@@ -0,0 +1,65 @@
+"""Tests for multi-tenant execution."""
+
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.insight import weekly
+from src.insight.tenants import run_for_tenants
+
+
+def test_run_for_tenants_isolates_failures():
+    """Test one tenant's exception does not stop the other tenants."""
+    def process(tenant_id):
+        if tenant_id == "b":
+            raise RuntimeError("mailbox unavailable")
+        return tenant_id.upper()
+
+    results = run_for_tenants(process, ["a", "b", "c"], concurrency=2)
+
+    assert list(results) == ["a", "b", "c"]
+    assert results["a"] == "A" and results["c"] == "C"
+    assert isinstance(results["b"], RuntimeError)
+
+
+def test_run_for_tenants_respects_concurrency_limit():
+    """Test no more than the configured number of tenants run at once."""
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def process(tenant_id):
+        with lock:
+            running.append(tenant_id)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(tenant_id)
+
+    run_for_tenants(process, [f"t{i}" for i in range(6)], concurrency=2)
+
+    assert max(peak) == 2
+
+
+def test_weekly_stages_are_scoped_to_tenant(monkeypatch):
+    """Test the weekly stages pass the tenant to topic assignment."""
+    captured = {}
+
+    def fake_topics(events, labels, db, tenant_id=None):
+        captured["topics"] = tenant_id
+        return {}
+
+    monkeypatch.setattr(weekly, "process_clusters_to_topics", fake_topics)
+    stages = {
+        s.name: s for s in weekly.build_weekly_stages(
+            None, weekly.compute_windows(datetime(2025, 1, 8)), from_rollups=False, tenant_id="acme"
+        )
+    }
+    stages["topics"].func({"load_events": {"week": []}, "cluster": {}})
+
+    assert captured["topics"] == "acme"
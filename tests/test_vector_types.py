@@ -0,0 +1,41 @@
+"""Tests for embedding column types."""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects import postgresql
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.vector_types import EmbeddingVector, HalfVector
+
+
+def test_embedding_vector_storage_modes():
+    """Test the storage mode picks the column type."""
+    assert isinstance(EmbeddingVector(384, "vector"), Vector)
+
+    half = EmbeddingVector(384, "halfvec")
+    assert isinstance(half, HalfVector)
+    assert half.get_col_spec() == "HALFVEC(384)"
+
+    with pytest.raises(ValueError):
+        EmbeddingVector(384, "float8")
+
+
+def test_halfvec_round_trip_returns_float32():
+    """Test values are written in pgvector text format and read back as float32 arrays."""
+    column_type = HalfVector(3)
+    dialect = postgresql.dialect()
+
+    stored = column_type.bind_processor(dialect)(np.array([0.5, -1.0, 0.25]))
+    assert stored == "[0.5,-1.0,0.25]"
+
+    loaded = column_type.result_processor(dialect, None)(stored)
+    assert loaded.dtype == np.float32
+    assert loaded.tolist() == [0.5, -1.0, 0.25]
+
+    with pytest.raises(ValueError):
+        column_type.bind_processor(dialect)([1.0, 2.0])
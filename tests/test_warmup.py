@@ -0,0 +1,56 @@
+"""Tests for the API start-up warm-up and readiness state."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import warmup
+from src.config import get_settings
+from src.warmup import Readiness, warm_up
+
+
+def test_ready_only_after_model_and_pools_are_warm(monkeypatch):
+    """Test readiness waits for both warm-ups and pool warm-up is retried until the database answers."""
+    monkeypatch.setattr(get_settings(), "warmup_retry_seconds", 0)
+    monkeypatch.setattr(warmup, "warm_embedding_model", lambda: 0.5)
+    attempts = []
+
+    async def flaky_pools():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("database starting up")
+        return 0.1
+
+    monkeypatch.setattr(warmup, "warm_db_pools", flaky_pools)
+    state = Readiness()
+    assert not state.ready
+
+    asyncio.run(warm_up(state))
+
+    assert state.ready
+    assert len(attempts) == 3
+    assert state.model_seconds == 0.5
+    assert state.cold_start_seconds is not None
+
+
+def test_model_failure_keeps_process_not_ready(monkeypatch):
+    """Test a model that cannot load leaves /ready failing with the error reported."""
+    def broken_model():
+        raise OSError("model files missing")
+
+    async def pools():
+        return 0.1
+
+    monkeypatch.setattr(warmup, "warm_embedding_model", broken_model)
+    monkeypatch.setattr(warmup, "warm_db_pools", pools)
+    state = Readiness()
+
+    asyncio.run(warm_up(state))
+
+    assert state.db_ready and not state.model_ready
+    assert not state.ready
+    assert "model files missing" in state.snapshot()["error"]
+    assert state.cold_start_seconds is None
@@ -0,0 +1,169 @@
+"""Tests for weekly pipeline helpers."""
+
+import pytest
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import CoreEvent
+from src.insight import weekly
+from src.insight.modules import embeddings
+
+
+class FakeSession:
+    def __init__(self):
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+def make_event(event_id: str, timestamp: datetime, embedding=None) -> CoreEvent:
+    return CoreEvent(id=event_id, timestamp=timestamp, subject="Subject", text="Body", embedding=embedding)
+
+
+def test_split_events_at_week_start():
+    """Test one range query is split into week and baseline events by timestamp."""
+    week_start = datetime(2025, 1, 8)
+    events = [
+        make_event("a", datetime(2025, 1, 7, 23, 59, tzinfo=timezone.utc)),
+        make_event("b", datetime(2025, 1, 8, tzinfo=timezone.utc)),
+        make_event("c", datetime(2025, 1, 10)),
+    ]
+
+    week_events, baseline_events = weekly.split_events(events, week_start)
+
+    assert [e.id for e in week_events] == ["b", "c"]
+    assert [e.id for e in baseline_events] == ["a"]
+
+
+def test_embeddings_generated_in_place_for_missing_only(monkeypatch):
+    """Test only events without embeddings are embedded, in one batch, on the loaded objects."""
+    batches = []
+
+    def fake_batch(texts):
+        batches.append(texts)
+        return np.ones((len(texts), 384))
+
+    monkeypatch.setattr(embeddings, "generate_embeddings_batch", fake_batch)
+    now = datetime(2025, 1, 8, tzinfo=timezone.utc)
+    events = [make_event("a", now, [0.5] * 384), make_event("b", now), make_event("c", now)]
+    db = FakeSession()
+
+    assert embeddings.generate_embeddings_for_events(db, events) == 2
+    assert len(batches) == 1 and len(batches[0]) == 2
+    assert events[0].embedding[0] == 0.5
+    assert events[1].embedding == [1.0] * 384
+    assert db.commits == 1
+
+    assert embeddings.generate_embeddings_for_events(db, events) == 0
+    assert db.commits == 1
+
+
+class FakeGuard:
+    """Stand-in for RunGuard that records state transitions."""
+
+    held = False
+    latest = {"run_id": "r1", "host": "other-host", "pid": 42, "status": "running", "detail": None}
+
+    def __init__(self, period_start, kind="weekly", tenant_id=None):
+        self.period_start = period_start
+        self.kind = kind
+        self.tenant_id = tenant_id or "default"
+        self.events = []
+        FakeGuard.instances.append(self)
+
+    def try_lock(self):
+        return not FakeGuard.held
+
+    def lock(self, timeout):
+        # The other run finishes while this one waits
+        self.events.append("lock")
+        return True
+
+    def unlock(self):
+        self.events.append("unlock")
+
+    def latest_run(self):
+        return FakeGuard.latest
+
+    def start(self):
+        self.events.append("start")
+
+    def finish(self, status, detail=None):
+        self.events.append((status, detail))
+
+
+def run_with_fake_guard(monkeypatch, held, execute):
+    FakeGuard.held = held
+    FakeGuard.instances = []
+    monkeypatch.setattr(weekly, "RunGuard", FakeGuard)
+    return weekly.run_guarded(weekly.compute_windows(datetime(2025, 1, 8)), execute, on_conflict="exit")
+
+
+def test_run_guard_exits_when_week_is_locked(monkeypatch):
+    """Test a second run for a locked week exits without running the pipeline."""
+    calls = []
+    run = run_with_fake_guard(monkeypatch, True, lambda: calls.append("run"))
+
+    assert calls == []
+    assert run.stopped and "other-host:42" in run.stopped_reason
+    assert FakeGuard.instances[0].events == []
+
+
+def test_run_guard_records_completed_and_failed_runs(monkeypatch):
+    """Test run state is recorded around the pipeline."""
+    run = run_with_fake_guard(monkeypatch, False, weekly.PipelineRun)
+    assert not run.stopped
+    assert FakeGuard.instances[0].events == ["start", ("completed", None)]
+
+    def boom():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        run_with_fake_guard(monkeypatch, False, boom)
+    assert FakeGuard.instances[0].events == ["start", ("failed", "boom")]
+
+
+def test_wait_after_completed_run_does_not_process_again(monkeypatch):
+    """Test a run that waited for a completed run returns its brief instead of running the pipeline again."""
+    FakeGuard.held = True
+    FakeGuard.instances = []
+    monkeypatch.setattr(FakeGuard, "latest", {**FakeGuard.latest, "status": "completed"})
+    monkeypatch.setattr(weekly, "RunGuard", FakeGuard)
+    monkeypatch.setattr(weekly, "load_stored_brief", lambda week_start, tenant_id: {"markdown": "# Brief"})
+    calls = []
+
+    run = weekly.run_guarded(
+        weekly.compute_windows(datetime(2025, 1, 8)), lambda: calls.append("run"), on_conflict="wait",
+        execute_resumed=lambda: calls.append("resume")
+    )
+
+    assert calls == []
+    assert run.results["reports"] == {"markdown": "# Brief"}
+    assert FakeGuard.instances[0].events == ["lock", "unlock"]
+
+
+def test_wait_after_failed_run_resumes_from_checkpoints(monkeypatch):
+    """Test a run that waited for a failed run resumes, so completed stages (e.g. Slack) are skipped."""
+    FakeGuard.held = True
+    FakeGuard.instances = []
+    monkeypatch.setattr(FakeGuard, "latest", {**FakeGuard.latest, "status": "failed"})
+    monkeypatch.setattr(weekly, "RunGuard", FakeGuard)
+    calls = []
+
+    def resumed():
+        calls.append("resume")
+        return weekly.PipelineRun()
+
+    weekly.run_guarded(
+        weekly.compute_windows(datetime(2025, 1, 8)), lambda: calls.append("run"), on_conflict="wait",
+        execute_resumed=resumed
+    )
+
+    assert calls == ["resume"]
+    assert FakeGuard.instances[0].events == ["lock", "start", ("completed", None)]